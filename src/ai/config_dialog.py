@@ -1005,14 +1005,17 @@ class AIConfigDialog:
                 self.app.ai_chat.reload_config()
             
             # 重新加载语音助手配置
-            if hasattr(self.app, "voice_assistant") and self.app.voice_assistant:
-                self.app.voice_assistant._load_config()
-                # 如果语音功能启用，重新启动语音助手
-                if self.voice_enabled_var.get():
-                    self.app.voice_assistant.stop()
-                    self.app.voice_assistant.start()
-                else:
-                    self.app.voice_assistant.stop()
+            # （尚未创建时首次访问会直接读取新配置）
+            voice = self.app._voice_assistant
+            if voice:
+                voice._load_config()
+            # 如果语音功能启用，重新启动语音助手
+            if self.voice_enabled_var.get():
+                if voice:
+                    voice.stop()
+                self.app.voice_assistant.start()
+            elif voice:
+                voice.stop()
 
             messagebox.showinfo("成功", "配置已保存并应用！", parent=self.dialog)
             self.dialog.destroy()
@@ -5,8 +5,10 @@ LLM引擎模块
 
 import json
 import logging
-import threading
+import re
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Callable, Generator
 
 import requests
@@ -25,6 +27,27 @@ from src.constants import (
     AI_PROVIDER_QWEN,
 )
 
+# SSE 数据帧：每行 "data: <payload>"
+_DATA_RE = re.compile(rb"^data: (.*?)\r?$", re.M)
+
+# 请求体中固定不变的尾部字段
+_PAYLOAD_SUFFIX = b'],"max_tokens":150,"temperature":0.7,"stream":true}'
+
+
+def _encode_message(role: str, content: str) -> bytes:
+    """将单条消息编码为 JSON 字节串
+
+    Args:
+        role: 消息角色
+        content: 消息内容
+
+    Returns:
+        UTF-8 编码的 JSON 对象
+    """
+    return json.dumps(
+        {"role": role, "content": content}, ensure_ascii=False
+    ).encode("utf-8")
+
 
 class LLMEngine:
     """
@@ -60,6 +83,8 @@ class LLMEngine:
     def __init__(self, app):
         self.app = app
         self.history = []  # 简化的历史记录
+        self._encoded_history: List[bytes] = []  # 与 history 一一对应的预编码消息
+        self._encoded_system: tuple[str, bytes] = ("", b"")
         self.is_processing = False
         self.current_personality = "aemeath"  # 默认使用爱弥斯人设
         self.logger = logging.getLogger(__name__)
@@ -67,6 +92,12 @@ class LLMEngine:
         # 流式回复相关
         self.full_response = ""
         self.is_streaming = False
+
+        # 复用连接池，避免每次请求重新握手
+        self._session = requests.Session()
+        # 共享的 IO 线程池，避免每次发送都新建线程
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-io")
+        self._active_response: Optional[requests.Response] = None
         
         self._load_config()
 
@@ -75,7 +106,8 @@ class LLMEngine:
         config = load_config()
         
         self.api_key = config.get("ai_api_key", "")
-        self.provider = config.get("ai_provider", AI_PROVIDER_GLM)
+        # 配置文件中可能是 null 或非字符串，先规范为字符串再驻留
+        self.provider = sys.intern(str(config.get("ai_provider") or AI_PROVIDER_GLM))
         self.model = config.get("ai_model", "glm-4-flash")
         self.base_url = config.get("ai_base_url", "")
         
@@ -105,14 +137,70 @@ class LLMEngine:
                 self.provider, AI_DEFAULT_MODELS[AI_PROVIDER_GLM]
             )
         
+        self._is_configured = bool(self.api_key) and bool(self.enabled)
+
+        self._payload_prefix = (
+            b'{"model":' + json.dumps(self.model).encode("utf-8") + b',"messages":['
+        )
+
         self.logger.info(f"LLM配置加载完成: {self.provider}/{self.model}")
 
+        # 后台预连接，提前完成 DNS + TLS 握手（未配置或未启用 AI 时不发起网络请求）
+        if self._is_configured:
+            self._executor.submit(self._preconnect)
+
+    def _preconnect(self) -> None:
+        """预热连接池，降低首条消息的等待时间"""
+        try:
+            self._session.head(self.base_url, timeout=5)
+        except requests.exceptions.RequestException as e:
+            self.logger.debug(f"预连接失败: {e}")
+
+    def _consume_sse_lines(
+        self, buffer: bytes, end: int, on_stream_token: Optional[Callable[[str], None]]
+    ) -> bool:
+        """解析缓冲区 [0, end) 内的 SSE data 行，累积回复并回调流式 token
+
+        Args:
+            buffer: 已接收的字节
+            end: 解析截止位置（不含）
+            on_stream_token: 流式 token 回调
+
+        Returns:
+            是否遇到 [DONE] 结束标记
+        """
+        for match in _DATA_RE.finditer(buffer, 0, end):
+            data = match.group(1)
+            if data == b"[DONE]":
+                return True
+            try:
+                json_data = json.loads(data)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            choices = json_data.get("choices")
+            if not choices:
+                continue
+            content = choices[0].get("delta", {}).get("content", "")
+            if content:
+                self.full_response += content
+                # 调用流式token回调
+                if on_stream_token:
+                    self.app.root.after(0, lambda c=content: on_stream_token(c))
+        return False
+
+    def _append_history(self, role: str, content: str) -> None:
+        """追加历史记录，同时缓存其 JSON 编码"""
+        self.history.append({"role": role, "content": content})
+        self._encoded_history.append(_encode_message(role, content))
+
+    def clear_history(self) -> None:
+        """清空对话历史"""
+        self.history.clear()
+        self._encoded_history.clear()
+
     def is_configured(self) -> bool:
-        """检查是否已配置"""
-        api_key_ok = bool(self.api_key)
-        enabled_ok = bool(self.enabled)
-        
-        return api_key_ok and enabled_ok
+        """检查是否已配置（结果在 _load_config 中缓存）"""
+        return self._is_configured
 
     def send_message(
         self,
@@ -142,7 +230,7 @@ class LLMEngine:
         self.is_streaming = True
 
         # 添加到历史
-        self.history.append({"role": "user", "content": message})
+        self._append_history("user", message)
 
         # 在后台线程调用API
         def _call_api():
@@ -152,7 +240,7 @@ class LLMEngine:
                 self.is_streaming = False
                 
                 if response:
-                    self.history.append({"role": "assistant", "content": response})
+                    self._append_history("assistant", response)
                     # 在主线程回调
                     self.app.root.after(0, lambda: on_response(response))
                 else:
@@ -166,7 +254,7 @@ class LLMEngine:
                 self.logger.error(f"AI API调用错误: {error_msg}")
                 self.app.root.after(0, lambda: on_error(f"出错了: {error_msg[:50]}..."))
 
-        threading.Thread(target=_call_api, daemon=True).start()
+        self._executor.submit(_call_api)
 
     def _call_llm_api_stream(
         self, 
@@ -180,57 +268,56 @@ class LLMEngine:
                 "Authorization": f"Bearer {self.api_key}",
             }
 
-            # 构建消息
+            # 构建请求体：消息在加入历史时已预编码，这里只做字节拼接
             system_prompt = self._get_system_prompt()
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # 添加历史记录（最近5条）
-            recent_history = self.history[-5:] if len(self.history) > 5 else self.history
-            messages.extend(recent_history)
-
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": 150,
-                "temperature": 0.7,
-                "stream": True,  # 启用流式回复
-            }
+            if self._encoded_system[0] != system_prompt:
+                self._encoded_system = (
+                    system_prompt,
+                    _encode_message("system", system_prompt),
+                )
+
+            # 历史记录（最近5条）
+            body = b"".join((
+                self._payload_prefix,
+                b",".join([self._encoded_system[1], *self._encoded_history[-5:]]),
+                _PAYLOAD_SUFFIX,
+            ))
 
             self.logger.info(f"发送流式请求: {message[:20]}...")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
-                json=payload,
+                data=body,
                 stream=True,  # 启用流式请求
                 timeout=30,
             )
+            self._active_response = response
 
             if response.status_code == 200:
                 self.full_response = ""
                 
-                # 处理流式数据
-                for line in response.iter_lines():
+                # 处理流式数据：按块缓冲，用预编译正则一次性匹配完整的 data 行
+                buffer = b""
+                finished = False
+                for chunk in response.iter_content(chunk_size=4096):
                     if not self.is_streaming:  # 检查是否被中断
                         break
-                        
-                    if line:
-                        line = line.decode('utf-8')
-                        if line.startswith('data: '):
-                            data = line[6:]
-                            if data == '[DONE]':
-                                break
-                            try:
-                                json_data = json.loads(data)
-                                if 'choices' in json_data and len(json_data['choices']) > 0:
-                                    delta = json_data['choices'][0].get('delta', {})
-                                    content = delta.get('content', '')
-                                    if content:
-                                        self.full_response += content
-                                        # 调用流式token回调
-                                        if on_stream_token:
-                                            self.app.root.after(0, lambda c=content: on_stream_token(c))
-                            except json.JSONDecodeError:
-                                continue
+                    if not chunk:
+                        continue
+
+                    buffer += chunk
+                    complete_end = buffer.rfind(b"\n")
+                    if complete_end < 0:
+                        continue
+
+                    finished = self._consume_sse_lines(buffer, complete_end, on_stream_token)
+                    buffer = buffer[complete_end + 1:]
+                    if finished:
+                        break
+
+                # 最后一行可能没有换行符，流结束后再解析剩余缓冲
+                if buffer and not finished and self.is_streaming:
+                    self._consume_sse_lines(buffer, len(buffer), on_stream_token)
                 
                 self.logger.info(f"流式回复完成: {self.full_response[:50]}...")
                 return self.full_response
@@ -248,12 +335,24 @@ class LLMEngine:
         except Exception as e:
             self.logger.error(f"API调用异常: {e}")
             return None
+        finally:
+            self._active_response = None
 
     def stop_streaming(self):
         """停止流式回复"""
         self.is_streaming = False
         self.logger.info("流式回复已停止")
 
+    def shutdown(self) -> None:
+        """关闭后台线程池与连接（程序退出时调用）"""
+        self.is_streaming = False
+        response = self._active_response
+        if response is not None:
+            # 关闭正在读取的响应，让工作线程尽快返回
+            response.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
     def reload_config(self):
         """重新加载配置"""
         self._load_config()
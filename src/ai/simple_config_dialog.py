@@ -1,7 +1,8 @@
-"""简单的LLM配置对话框模块"""
+"""简单的LLM配置对话框模块
+
+tkinter 在真正打开对话框时才导入，仅使用 LLM 功能时不承担 GUI 导入开销。
+"""
 
-import tkinter as tk
-from tkinter import ttk, messagebox
 from typing import Dict, Any
 
 from src.config import load_config, update_config
@@ -27,6 +28,8 @@ class SimpleConfigDialog:
 
     def _create_dialog(self) -> None:
         """创建对话框"""
+        import tkinter as tk
+
         self.dialog = tk.Toplevel(self.app.root)
         self.dialog.title("LLM配置")
         self.dialog.geometry("500x600")
@@ -42,6 +45,9 @@ class SimpleConfigDialog:
 
     def _create_widgets(self) -> None:
         """创建界面组件"""
+        import tkinter as tk
+        from tkinter import ttk
+
         # 加载当前配置
         config = load_config()
         
@@ -210,6 +216,8 @@ class SimpleConfigDialog:
     
     def _save_config(self) -> None:
         """保存配置"""
+        from tkinter import messagebox
+
         try:
             # 获取配置
             ai_enabled = self.config_vars["ai_enabled"].get()
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 import random
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
 
 from PIL import Image, ImageTk
 
@@ -32,6 +33,8 @@ class AnimationManager:
         self.cache = AnimationCache()
         self._raw_gif_cache: dict[str, Tuple[list, list]] = {}
         self._raw_gif_cache_enabled = False
+        # 预先打乱的待机动画循环（随 load_animations 重建）
+        self._idle_cycle: Iterator[Tuple[list, list]] = iter(())
 
     def load_animations(self) -> None:
         """加载动画资源（带缓存）"""
@@ -44,6 +47,7 @@ class AnimationManager:
             app.move_delays = cached.move_delays
             app.move_frames_left = cached.move_frames_left
             app.idle_gifs = cached.idle_gifs
+            self._reset_idle_cycle()
             app.drag_frames = cached.drag_frames
             app.drag_delays = cached.drag_delays
             app.music_frames = cached.music_frames
@@ -69,6 +73,7 @@ class AnimationManager:
             idle_frames, idle_delays, _ = load_gif_frames(f"idle{i}.gif", app.scale)
             if idle_frames:
                 app.idle_gifs.append((idle_frames, idle_delays))
+        self._reset_idle_cycle()
 
         # 拖动动画
         drag_frames, drag_delays, _ = load_gif_frames("drag.gif", app.scale)
@@ -134,24 +139,23 @@ class AnimationManager:
     def animate(self) -> None:
         """动画循环"""
         app = self.app
-        app._animate_after_id = None
         if not getattr(app, "current_frames", None):
-            app._animate_after_id = app.root.after(100, self.animate)
+            app.scheduler.call_later(100, self.animate)
             return
 
         if getattr(app, "_resizing", False):
-            app._animate_after_id = app.root.after(30, self.animate)
+            app.scheduler.call_later(30, self.animate)
             return
 
         if getattr(app, "dragging", False):
-            app._animate_after_id = app.root.after(50, self.animate)
+            app.scheduler.call_later(50, self.animate)
             return
 
         app.label.config(image=app.current_frames[app.frame_index])
         delay = app.current_delays[app.frame_index] if app.current_delays else 100
 
         app.frame_index = (app.frame_index + 1) % len(app.current_frames)
-        app._animate_after_id = app.root.after(delay, self.animate)
+        app.scheduler.call_later(delay, self.animate)
 
     def switch_to_idle(self) -> None:
         """切换到待机动画"""
@@ -163,7 +167,7 @@ class AnimationManager:
         app._move_ticks_since_move = 0
         if app.idle_gifs:
             if app.behavior_mode == BEHAVIOR_MODE_ACTIVE:
-                frames, delays = random.choice(app.idle_gifs)
+                frames, delays = self.next_idle()
             else:
                 frames, delays = self.pick_idle_gif()
             app.current_frames = frames
@@ -190,10 +194,19 @@ class AnimationManager:
         app.frame_index = 0
 
         if app._move_after_id:
-            app.root.after_cancel(app._move_after_id)
+            app.scheduler.cancel(app._move_after_id)
             app._move_after_id = None
         app.motion.tick()
 
+    def _reset_idle_cycle(self) -> None:
+        """按当前待机动画列表重建打乱后的循环"""
+        idle_gifs = self.app.idle_gifs
+        self._idle_cycle = itertools.cycle(random.sample(idle_gifs, len(idle_gifs)))
+
+    def next_idle(self) -> Tuple[list, list]:
+        """按预先打乱的顺序取下一个待机动画（调用方需保证 idle_gifs 非空）"""
+        return next(self._idle_cycle)
+
     def pick_idle_gif(self) -> Tuple[list, list]:
         """选择待机动画（均匀轮换）"""
         app = self.app
@@ -272,7 +285,6 @@ class AnimationManager:
             app.x = 200
             app.y = 200
             app.root.geometry(f"{app.w}x{app.h}+{app.x}+{app.y}")
-        app.root.update_idletasks()
 
     def apply_scale_change(self) -> None:
         """缩放变更后的统一收尾逻辑（窗口/帧/音乐动画同步）"""
@@ -307,5 +319,4 @@ class AnimationManager:
                 app.current_delays = app.move_delays
 
         if app.current_frames:
-            app.label.config(image=app.current_frames[0])
-            app.root.update_idletasks()
\ No newline at end of file
+            app.label.config(image=app.current_frames[0])
\ No newline at end of file
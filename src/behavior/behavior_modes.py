@@ -9,6 +9,7 @@ from src.constants import (
     BEHAVIOR_MODE_ACTIVE,
     BEHAVIOR_MODE_CLINGY,
     BEHAVIOR_MODE_QUIET,
+    BehaviorMode,
     REST_CHANCE,
     STOP_CHANCE,
     TARGET_CHANGE_MAX,
@@ -27,7 +28,7 @@ class BehaviorParams:
     min_move_ticks: int
 
 
-def get_behavior_params(mode: str) -> BehaviorParams:
+def get_behavior_params(mode: BehaviorMode) -> BehaviorParams:
     """根据模式返回行为参数"""
     if mode == BEHAVIOR_MODE_QUIET:
         return BehaviorParams(
@@ -11,6 +11,7 @@ from src.constants import (
     BEHAVIOR_MODE_ACTIVE,
     BEHAVIOR_MODE_CLINGY,
     BEHAVIOR_MODE_QUIET,
+    BehaviorMode,
     FOLLOW_DISTANCE,
     FOLLOW_START_DIST,
     FOLLOW_STOP_DIST,
@@ -141,8 +142,7 @@ class MotionController:
                     REST_DURATION_MIN, REST_DURATION_MAX
                 )
                 self.app._switch_to_idle()
-                self.app.root.after(MOVE_INTERVAL, self.tick)
-                return
+                return self._schedule(MOVE_INTERVAL)
             self.app.target_x, self.app.target_y = self._get_random_target()
             self.app.target_timer = random.randint(TARGET_CHANGE_MIN, TARGET_CHANGE_MAX)
 
@@ -210,17 +210,16 @@ class MotionController:
             
             # 使用UI管理器更新所有UI组件的位置
             if hasattr(self.app, 'ui_manager'):
-                self.app.ui_manager.update_pet_info(ix, iy, self.app.w, self.app.h)
-                self.app.ui_manager.update_layout()
+                self.app.ui_manager.set_pet_info_and_relayout(ix, iy, self.app.w, self.app.h)
 
         self.app._move_ticks_since_move += 1
         return self._schedule(MOVE_INTERVAL)
 
     def _schedule(self, delay: int) -> None:
         if self.app._move_after_id:
-            self.app.root.after_cancel(self.app._move_after_id)
+            self.app.scheduler.cancel(self.app._move_after_id)
             self.app._move_after_id = None
-        self.app._move_after_id = self.app.root.after(delay, self.tick)
+        self.app._move_after_id = self.app.scheduler.call_later(delay, self.tick)
 
     def _get_random_target(self) -> Tuple[int, int]:
         if random.random() < OUTSIDE_TARGET_CHANCE:
@@ -296,7 +295,7 @@ class MotionController:
                 self.app.current_delays = self.app.move_delays
                 self.app.frame_index = 0
 
-    def apply_behavior_mode(self, mode: str) -> None:
+    def apply_behavior_mode(self, mode: BehaviorMode) -> None:
         """应用行为模式参数"""
         self.app.behavior_mode = mode
         params = get_behavior_params(mode)
@@ -322,13 +321,9 @@ class MotionController:
             self.app.motion_state = MOTION_WANDER
             self.app._switch_to_move()
 
-        if hasattr(self.app, "tray_controller") and self.app.tray_controller:
-            if self.app.tray_controller.icon:
-                self.app.tray_controller.icon.menu = (
-                    self.app.tray_controller.build_menu()
-                )
+        self.app.refresh_tray_menu()
 
-    def set_behavior_mode(self, mode: str) -> None:
+    def set_behavior_mode(self, mode: BehaviorMode) -> None:
         """设置行为模式"""
         if mode not in (
             BEHAVIOR_MODE_QUIET,
@@ -336,5 +331,6 @@ class MotionController:
             BEHAVIOR_MODE_CLINGY,
         ):
             return
+        mode = BehaviorMode(mode)
         self.apply_behavior_mode(mode)
-        update_config(behavior_mode=mode)
\ No newline at end of file
+        update_config(behavior_mode=mode.config_value)
\ No newline at end of file
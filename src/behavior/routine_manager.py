@@ -56,7 +56,6 @@ class RoutineManager:
 
     def tick(self) -> None:
         """检查作息状态（每分钟调用一次）"""
-        self.app._routine_after_id = None
         current_period = self.get_time_period()
         if current_period != self.app._current_time_period:
             self.app._current_time_period = current_period
@@ -110,4 +109,4 @@ class RoutineManager:
                 message = random.choice(EMYS_RESPONSES["random_chat"])
                 self.app.speech_bubble.show(message, duration=5000)
 
-        self.app._routine_after_id = self.app.root.after(60000, self.tick)
+        self.app.scheduler.call_later(60000, self.tick)
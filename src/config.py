@@ -1,6 +1,7 @@
 """配置管理模块"""
 
 import json
+import threading
 from typing import Any, Dict, Optional
 from src.constants import (
     AI_DEFAULT_MODELS,
@@ -15,6 +16,14 @@ from src.constants import (
 # 配置缓存
 _config_cache: Optional[Dict[str, Any]] = None
 
+# 延迟写盘：短时间内的多次 update_config 合并为一次磁盘写入
+_FLUSH_DELAY = 0.5
+_flush_timer: Optional[threading.Timer] = None
+_pending: Dict[str, Any] = {}
+_flush_lock = threading.Lock()
+# 串行化磁盘写入（只在写盘路径上持有，UI 线程读写缓存不会等待它）
+_write_lock = threading.Lock()
+
 
 def _default_config() -> Dict[str, Any]:
     """返回默认配置"""
@@ -90,6 +99,10 @@ def load_config(force_refresh: bool = False) -> Dict[str, Any]:
 
         data = _default_config()
 
+    # 尚未写盘的修改优先于磁盘内容
+    with _flush_lock:
+        data.update(_pending)
+
     _config_cache = data.copy()
     return data
 
@@ -102,6 +115,19 @@ def save_config(config: Dict[str, Any]) -> None:
     """
     global _config_cache
 
+    if _write_config_file(config):
+        _config_cache = config.copy()
+
+
+def _write_config_file(config: Dict[str, Any]) -> bool:
+    """把配置写入文件，不修改内存缓存
+
+    Args:
+        config: 配置字典
+
+    Returns:
+        是否写入成功
+    """
     try:
 
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -120,16 +146,16 @@ def save_config(config: Dict[str, Any]) -> None:
         
         with open(CONFIG_FILE, "w", encoding="utf-8") as f:
             json.dump(config, f, ensure_ascii=False, indent=2)
-        
-        _config_cache = config.copy()
+        return True
     
     except (OSError, IOError) as e:
         import traceback
         traceback.print_exc()
+        return False
 
 
 def update_config(**kwargs) -> Dict[str, Any]:
-    """更新配置并保存
+    """更新配置，内存缓存立即生效，磁盘写入延迟合并
 
     Args:
         **kwargs: 要更新的配置项
@@ -137,14 +163,62 @@ def update_config(**kwargs) -> Dict[str, Any]:
     Returns:
         更新后的配置字典
     """
-    print(f"🔧 调试: update_config被调用，参数: {kwargs}")
-    config = load_config()
-    print(f"🔧 调试: 当前配置: {config}")
-    config.update(kwargs)
-    print(f"🔧 调试: 更新后配置: {config}")
-    save_config(config)
-    print(f"🔧 调试: 配置已保存")
-    return config.copy()
+    if _config_cache is None:
+        load_config()
+
+    # 缓存与待写入项在同一把锁内原地合并，托盘线程与 Tk 线程并发更新时互不覆盖
+    with _flush_lock:
+        _config_cache.update(kwargs)
+        _pending.update(kwargs)
+        config = _config_cache.copy()
+    _schedule_flush(_FLUSH_DELAY)
+    return config
+
+
+def _schedule_flush(delay: float) -> None:
+    """调度一次延迟写盘，取消之前尚未执行的写盘任务
+
+    Args:
+        delay: 延迟秒数
+    """
+    global _flush_timer
+
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+        _flush_timer = threading.Timer(delay, _do_flush)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _do_flush() -> None:
+    """将待写入的配置合并后保存到文件
+
+    _flush_lock 内只取快照，写盘在锁外进行，避免慢速写盘阻塞 UI 线程的
+    load_config/update_config；_write_lock 保证快照按顺序落盘。
+    写盘用的是快照，不回写 _config_cache，以免覆盖期间新的修改。
+    """
+    global _flush_timer
+
+    with _write_lock:
+        with _flush_lock:
+            _flush_timer = None
+            if not _pending or _config_cache is None:
+                return
+            _pending.clear()
+            snapshot = dict(_config_cache)
+        _write_config_file(snapshot)
+
+
+def flush_config() -> None:
+    """立即写入所有待保存的配置（程序退出时调用）"""
+    global _flush_timer
+
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    _do_flush()
 
 
 def get_config_value(key: str, default=None) -> Any:
@@ -157,5 +231,9 @@ def get_config_value(key: str, default=None) -> Any:
     Returns:
         配置值
     """
-    config = load_config()
-    return config.get(key, default)
\ No newline at end of file
+    # 直接读取内存缓存，避免 load_config 每次复制整份配置
+    cache = _config_cache
+    if cache is None:
+        load_config()
+        cache = _config_cache
+    return cache.get(key, default)
\ No newline at end of file
@@ -1,7 +1,9 @@
 """常量定义模块"""
 
+from enum import IntEnum
 from pathlib import Path
 import os
+import sys
 
 # ============ 路径配置 ============
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -14,6 +16,7 @@ DEFAULT_SCALE_INDEX = 3
 TRANSPARENCY_OPTIONS = [1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3]
 DEFAULT_TRANSPARENCY_INDEX = 0
 TRANSPARENT_COLOR = "pink"
+TOPMOST_WATCHDOG_INTERVAL = 30000  # 置顶兜底检查间隔(ms)
 
 # ============ 运动配置 ============
 SPEED_X = 3
@@ -44,9 +47,32 @@ MOTION_CURIOUS = "curious"
 MOTION_REST = "rest"
 
 # ============ 行为模式 ============
-BEHAVIOR_MODE_QUIET = "quiet"
-BEHAVIOR_MODE_ACTIVE = "active"
-BEHAVIOR_MODE_CLINGY = "clingy"
+class BehaviorMode(IntEnum):
+    """行为模式（运行时用整数比较，配置文件中仍保存为字符串）"""
+
+    QUIET = 0
+    ACTIVE = 1
+    CLINGY = 2
+
+    @property
+    def config_value(self) -> str:
+        """写入配置文件的字符串形式"""
+        return self.name.lower()
+
+    @classmethod
+    def from_config(cls, value: object) -> "BehaviorMode":
+        """从配置值解析，兼容旧版字符串与整数，无法识别时回退为活跃模式"""
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper(), cls.ACTIVE)
+        try:
+            return cls(value)
+        except (TypeError, ValueError):
+            return cls.ACTIVE
+
+
+BEHAVIOR_MODE_QUIET = BehaviorMode.QUIET
+BEHAVIOR_MODE_ACTIVE = BehaviorMode.ACTIVE
+BEHAVIOR_MODE_CLINGY = BehaviorMode.CLINGY
 
 # ============ 番茄钟配置 ============
 POMODORO_WORK_MINUTES = 25
@@ -78,6 +104,7 @@ SWP_SHOWWINDOW = 0x0040
 GWL_EXSTYLE = -20
 WS_EX_LAYERED = 0x00080000
 WS_EX_TRANSPARENT = 0x00000020
+WS_EX_TOPMOST = 0x00000008
 
 # ============ 注册表配置 ============
 RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
@@ -136,13 +163,14 @@ AUTHOR_EMAIL = "1977184420@qq.com"
 GITEE_RELEASES_URL = "https://gitee.com/lzy-buaa-jdi/Aemeath/releases"
 
 # ============ AI配置 ============
-AI_PROVIDER_DEEPSEEK = "deepseek"
-AI_PROVIDER_OPENAI = "openai"
-AI_PROVIDER_QWEN = "qwen"
-AI_PROVIDER_GLM = "glm"
-AI_PROVIDER_KIMI = "kimi"
-AI_PROVIDER_DOUBAO = "doubao"
-AI_PROVIDER_CUSTOM = "custom"
+# 服务商标识显式驻留，配置中读取的同名字符串驻留后可直接按身份命中字典
+AI_PROVIDER_DEEPSEEK = sys.intern("deepseek")
+AI_PROVIDER_OPENAI = sys.intern("openai")
+AI_PROVIDER_QWEN = sys.intern("qwen")
+AI_PROVIDER_GLM = sys.intern("glm")
+AI_PROVIDER_KIMI = sys.intern("kimi")
+AI_PROVIDER_DOUBAO = sys.intern("doubao")
+AI_PROVIDER_CUSTOM = sys.intern("custom")
 
 AI_PROVIDERS = [
     AI_PROVIDER_DEEPSEEK,
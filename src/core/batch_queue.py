@@ -0,0 +1,69 @@
+"""分帧执行的延迟任务队列
+
+启动阶段只在关键路径上做窗口与动画初始化，其余非关键的初始化步骤入队，
+在首帧绘制后的空闲时机分批执行，每批不超过给定的时间预算。
+"""
+
+from __future__ import annotations
+
+import time
+import traceback
+from collections import deque
+from typing import Callable, Deque, Optional
+
+import tkinter as tk
+
+
+class BatchQueue:
+    """基于 ``after_idle`` 的分帧任务队列
+
+    任务按入队顺序执行；单次空闲回调内累计耗时超过预算后让出事件循环，
+    剩余任务在下一次空闲时继续执行。
+    """
+
+    def __init__(self, root: tk.Misc, budget_ms: float = 8.0) -> None:
+        """初始化队列
+
+        Args:
+            root: 用于调度的 tkinter 组件
+            budget_ms: 单次空闲回调允许占用的时间（毫秒）
+        """
+        self.root = root
+        self._budget = budget_ms / 1000.0
+        self._tasks: Deque[Callable[[], object]] = deque()
+        self._after_id: Optional[str] = None
+
+    def enqueue(self, task: Callable[[], object]) -> None:
+        """追加一个任务，并确保已安排执行"""
+        self._tasks.append(task)
+        self._schedule()
+
+    def cancel(self) -> None:
+        """取消尚未执行的任务（退出时调用）"""
+        self._tasks.clear()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _schedule(self) -> None:
+        if self._after_id is None and self._tasks:
+            self._after_id = self.root.after_idle(self._drain)
+
+    def _drain(self) -> None:
+        """在时间预算内依次执行任务"""
+        self._after_id = None
+        deadline = time.perf_counter() + self._budget
+        while self._tasks:
+            task = self._tasks.popleft()
+            try:
+                task()
+            except Exception as e:
+                # 单个初始化步骤失败不应阻断后续步骤
+                print(f"延迟初始化任务执行失败: {e}")
+                traceback.print_exc()
+            if time.perf_counter() >= deadline:
+                break
+        self._schedule()
@@ -0,0 +1,115 @@
+"""统一定时调度器
+
+宠物的各个周期任务（动画、移动、作息、番茄钟、音乐检测、置顶兜底）原本各自
+持有一个 ``root.after`` 定时器。此调度器用一个最小堆保存所有待执行回调，
+任意时刻只向 Tk 注册一个定时器，到期时一次性执行所有已到期的回调。
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import sys
+import time
+from typing import Callable, List, Optional, Set, Tuple
+
+import tkinter as tk
+
+
+def _now_ms() -> float:
+    return time.monotonic() * 1000.0
+
+
+class FrameScheduler:
+    """基于单个 ``after`` 定时器的回调调度器
+
+    ``call_later`` 返回的句柄为正整数，可直接存放在原先保存 after id 的字段中，
+    并通过 ``cancel`` 取消。相差不足半帧的回调会合并到同一次唤醒中执行。
+    """
+
+    def __init__(self, root: tk.Misc, frame_ms: int = 16) -> None:
+        """初始化调度器
+
+        Args:
+            root: 用于注册定时器的 tkinter 组件
+            frame_ms: 帧间隔（毫秒），到期时间相差半帧以内的回调合并执行
+        """
+        self.root = root
+        self._slack = frame_ms / 2
+        self._heap: List[Tuple[float, int, Callable[[], object]]] = []
+        self._live: Set[int] = set()
+        self._seq = itertools.count(1)
+        self._after_id: Optional[str] = None
+        self._armed_due: Optional[float] = None
+
+    def call_later(self, delay_ms: int, callback: Callable[[], object]) -> int:
+        """在 delay_ms 毫秒后执行回调
+
+        Returns:
+            可用于 cancel 的句柄
+        """
+        handle = next(self._seq)
+        heapq.heappush(self._heap, (_now_ms() + delay_ms, handle, callback))
+        self._live.add(handle)
+        self._arm()
+        return handle
+
+    def cancel(self, handle: Optional[int]) -> None:
+        """取消尚未执行的回调（堆中的条目在到期时丢弃）"""
+        if handle:
+            self._live.discard(handle)
+
+    def shutdown(self) -> None:
+        """取消全部回调与底层定时器（退出时调用）"""
+        self._heap.clear()
+        self._live.clear()
+        self._disarm()
+
+    def _disarm(self) -> None:
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        self._after_id = None
+        self._armed_due = None
+
+    def _arm(self) -> None:
+        """确保底层定时器对准最早到期的回调"""
+        heap = self._heap
+        live = self._live
+        while heap and heap[0][1] not in live:
+            heapq.heappop(heap)
+        if not heap:
+            self._disarm()
+            return
+
+        due = heap[0][0]
+        if self._after_id is not None and self._armed_due is not None and self._armed_due <= due:
+            return
+        self._disarm()
+        delay = max(0, int(due - _now_ms()))
+        self._after_id = self.root.after(delay, self._tick)
+        self._armed_due = due
+
+    def _tick(self) -> None:
+        """执行所有已到期的回调，然后重新对准下一个到期时间"""
+        self._after_id = None
+        self._armed_due = None
+        heap = self._heap
+        live = self._live
+        horizon = _now_ms() + self._slack
+        # 先取出本轮到期的回调，回调中新加入的任务留到下一次唤醒
+        due_now = []
+        while heap and heap[0][0] <= horizon:
+            due_now.append(heapq.heappop(heap))
+        for _, handle, callback in due_now:
+            if handle not in live:
+                continue
+            live.discard(handle)
+            try:
+                callback()
+            except Exception:
+                # 与 Tk 原生 after 回调保持一致的异常上报方式
+                self.root.report_callback_exception(*sys.exc_info())
+        self._arm()
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import random
+import threading
 import tkinter as tk
-from typing import Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from tkinter import ttk
+from typing import TYPE_CHECKING, Any, Callable, Tuple
 
-from src.config import load_config, update_config
+from src.config import flush_config, load_config, update_config
 from src.constants import (
     BEHAVIOR_MODE_ACTIVE,
     BEHAVIOR_MODE_CLINGY,
     BEHAVIOR_MODE_QUIET,
     DEFAULT_SCALE_INDEX,
+    BehaviorMode,
     DEFAULT_TRANSPARENCY_INDEX,
     SCALE_OPTIONS,
+    TOPMOST_WATCHDOG_INTERVAL,
     TRANSPARENCY_OPTIONS,
 )
 from src.startup import check_and_fix_startup, set_auto_startup
@@ -21,6 +26,8 @@ from src.startup import check_and_fix_startup, set_auto_startup
 from src.animation.animation_manager import AnimationManager
 from src.behavior.routine_manager import RoutineManager
 from src.behavior.motion_controller import MotionController
+from src.core.batch_queue import BatchQueue
+from src.core.frame_scheduler import FrameScheduler
 from src.core.state_manager import StateManager
 from src.core.window_manager import WindowManager
 from src.interaction.click_handler import ClickHandler
@@ -28,13 +35,26 @@ from src.interaction.drag_handler import DragHandler
 from src.media.music_controller import MusicController
 from src.productivity.pomodoro import PomodoroManager
 from src.ai.config_dialog import AIConfigDialog
+from src.ai.emys_character import EMYS_RESPONSES, get_quick_reply
 from src.ai.llm_engine import LLMEngine
 from src.ui.ai_chat_panel import AIChatPanel
 from src.ui.music_panel import MusicPanel
 from src.ui.pomodoro_indicator import PomodoroIndicator
+from src.ui.quick_menu import QuickMenu
+from src.ui.speech_bubble import SpeechBubble
 from src.ui.ui_manager import UIManager
 from src.translate import TranslateWindow
-from src.voice import VoiceAssistant
+
+if TYPE_CHECKING:
+    from src.ai.chat_engine import QuickChatManager
+    from src.voice import VoiceAssistant
+
+# 关闭聊天面板时的告别语（固定不变，导入时取一次）
+_FAREWELLS = tuple(EMYS_RESPONSES["farewell"])
+
+# 档位数量为常量，预先计算供索引校验使用
+_SCALE_LEN = len(SCALE_OPTIONS)
+_TRANSPARENCY_LEN = len(TRANSPARENCY_OPTIONS)
 
 
 class DesktopPet:
@@ -43,6 +63,9 @@ class DesktopPet:
     # 类变量用于系统托盘
     tray_icon: Any = None
 
+    # 缩放后需要同步可见性的 UI 组件（与 UIManager 注册名一致）
+    _UI_COMPONENT_NAMES = ("music_panel", "pomodoro_indicator", "ai_chat_panel", "speech_bubble")
+
     def __init__(self, root: tk.Tk):
         """初始化桌面宠物
 
@@ -50,9 +73,19 @@ class DesktopPet:
             root: tkinter 根窗口
         """
         self.root = root
-        self._request_quit = False
+        # 退出请求标记（托盘、语音等后台线程会设置/读取）
+        self._quit_event = threading.Event()
+        self._quitting = False
         self._resizing = False
 
+        # 面板、翻译窗口与语音助手在首次访问时创建（见下方同名属性）；
+        # 最先赋值，保证初始化中途出错时退出流程也能安全读取
+        self._ai_chat_panel: AIChatPanel | None = None
+        self._music_panel: MusicPanel | None = None
+        self._pomodoro_indicator: PomodoroIndicator | None = None
+        self._translate_window: TranslateWindow | None = None
+        self._voice_assistant: VoiceAssistant | None = None
+
         # 组合式管理器
         self.window = WindowManager(self)
         self.state = StateManager(self)
@@ -69,48 +102,44 @@ class DesktopPet:
 
         # AI对话引擎
         self.ai_chat = LLMEngine(self)
+        self._quick_chat_manager: QuickChatManager | None = None
+        self._quick_chat_personality = ""
 
-        # AI聊天面板
-        self.ai_chat_panel: AIChatPanel | None = None
-        
-        # 音乐面板
-        self.music_panel: MusicPanel | None = None
-        
-        # 番茄钟指示器
-        self.pomodoro_indicator: PomodoroIndicator | None = None
+        # 聊天输入对话框（首次打开时创建，之后隐藏复用）
+        self._chat_input_dialog: tk.Toplevel | None = None
+        self._chat_input_prompt: ttk.Label | None = None
+        self._chat_input_var: tk.StringVar | None = None
+        self._chat_input_entry: ttk.Entry | None = None
 
-        # 翻译窗口
-        self.translate_window = TranslateWindow(self)
-        
-        # 语音助手
-        self.voice_assistant = VoiceAssistant(self)
 
-        # 初始化窗口
-        self.window.init_window()
+        # 阻塞型 I/O（音频设备打开/关闭等）放到后台线程，避免卡住 Tk 事件循环
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pet-io")
 
-        # 加载配置
-        self._load_config()
+        # 周期任务统一调度（只占用一个 Tk 定时器）
+        self.scheduler = FrameScheduler(root, 16)
 
-        # 检查开机自启
-        check_and_fix_startup()
+        # 直接挂在 root 上的一次性 after 任务（退出时统一取消）
+        self._pending_afters: set[str] = set()
 
-        # 加载动画资源
-        self.animation.load_animations()
+        # 非关键初始化步骤的分帧队列
+        self._init_queue = BatchQueue(root)
 
-        # 初始化状态
+        # 关键路径：窗口、配置、动画资源、状态与基础UI
+        self.window.init_window()
+        self._load_config()
+        self.animation.load_animations()
         self.state.init_state()
-
-        # 创建UI组件
         self._create_ui_components()
-
-        # 预加载音乐原始帧，避免切换倍率时重复解码
-        self.animation.preload_raw_gifs()
-
-        # 绑定事件
         self._bind_events()
 
-        # 启动循环
-        self._start_loops()
+        # 先显示首帧，动画循环稍后才启动
+        if self.current_frames:
+            self.label.config(image=self.current_frames[0])
+
+        # 其余初始化在首帧绘制后的空闲时机分批执行，启动循环放在最后
+        self._init_queue.enqueue(check_and_fix_startup)
+        self._init_queue.enqueue(self.animation.preload_raw_gifs)
+        self._init_queue.enqueue(self._start_loops)
 
     def _init_window(self) -> None:
         """初始化窗口"""
@@ -128,7 +157,9 @@ class DesktopPet:
         self.auto_startup = config.get("auto_startup", False)
         self.click_through = config.get("click_through", True)
         self.follow_mouse = config.get("follow_mouse", False)
-        self.behavior_mode = config.get("behavior_mode", BEHAVIOR_MODE_ACTIVE)
+        self.behavior_mode = BehaviorMode.from_config(
+            config.get("behavior_mode", BEHAVIOR_MODE_ACTIVE)
+        )
         self.scale = SCALE_OPTIONS[self.scale_index]
 
         # 应用透明度
@@ -141,31 +172,55 @@ class DesktopPet:
         self.state.init_state()
 
     def _create_ui_components(self) -> None:
-        """创建UI组件"""
-        from src.ui.quick_menu import QuickMenu
-        from src.ui.speech_bubble import SpeechBubble
-        from src.ui.music_panel import MusicPanel
-        from src.ui.pomodoro_indicator import PomodoroIndicator
-        from src.ui.ai_chat_panel import AIChatPanel
-        
+        """创建首帧所需的基础UI组件"""
         self.quick_menu = QuickMenu(self)
         self.speech_bubble = SpeechBubble(self)
-        self.music_panel = MusicPanel(self)
-        self.pomodoro_indicator = PomodoroIndicator(self)
-        self.ai_chat_panel = AIChatPanel(self)
-        
-        # 注册UI组件到管理器
-        # 语音气泡优先级最低，音乐面板优先级中等，番茄钟优先级高，AI聊天面板优先级最高
-        if hasattr(self, 'ui_manager'):
-            self.ui_manager.register_component("speech_bubble", self.speech_bubble, 200, 50, "auto", 0)
-            self.ui_manager.register_component("music_panel", self.music_panel, 248, 100, "auto", 2)
-            self.ui_manager.register_component("pomodoro_indicator", self.pomodoro_indicator, 200, 20, "auto", 1)
-            self.ui_manager.register_component("ai_chat_panel", self.ai_chat_panel, 260, 45, "right", 3)
-            
-            # 初始化UI管理器的宠物信息
-            # 确保宠物位置和尺寸已正确设置
-            self.root.update_idletasks()
-            self.ui_manager.update_pet_info(self.x, self.y, self.w, self.h)
+
+        # 语音气泡优先级最低
+        self.ui_manager.register_component("speech_bubble", self.speech_bubble, 200, 50, "auto", 0)
+
+    # ============ 按需创建的组件 ============
+
+    @property
+    def ai_chat_panel(self) -> AIChatPanel:
+        """AI聊天面板（首次访问时创建并注册，优先级最高）"""
+        if self._ai_chat_panel is None:
+            self._ai_chat_panel = AIChatPanel(self)
+            self.ui_manager.register_component("ai_chat_panel", self._ai_chat_panel, 260, 45, "right", 3)
+        return self._ai_chat_panel
+
+    @property
+    def music_panel(self) -> MusicPanel:
+        """音乐面板（首次访问时创建并注册，优先级中等）"""
+        if self._music_panel is None:
+            self._music_panel = MusicPanel(self)
+            self.ui_manager.register_component("music_panel", self._music_panel, 248, 100, "auto", 2)
+        return self._music_panel
+
+    @property
+    def pomodoro_indicator(self) -> PomodoroIndicator:
+        """番茄钟指示器（首次访问时创建并注册，优先级高）"""
+        if self._pomodoro_indicator is None:
+            self._pomodoro_indicator = PomodoroIndicator(self)
+            self.ui_manager.register_component("pomodoro_indicator", self._pomodoro_indicator, 200, 20, "auto", 1)
+        return self._pomodoro_indicator
+
+    @property
+    def translate_window(self) -> TranslateWindow:
+        """翻译窗口（首次访问时创建）"""
+        if self._translate_window is None:
+            self._translate_window = TranslateWindow(self)
+        return self._translate_window
+
+    @property
+    def voice_assistant(self) -> VoiceAssistant:
+        """语音助手（首次访问时创建）"""
+        if self._voice_assistant is None:
+            # 语音模块依赖较重，首次使用时才导入
+            from src.voice import VoiceAssistant
+
+            self._voice_assistant = VoiceAssistant(self)
+        return self._voice_assistant
 
     # 动画加载/缓存/音乐帧相关逻辑已迁移至 src/animation/animation_manager.py
 
@@ -176,21 +231,50 @@ class DesktopPet:
         self.label.bind("<ButtonRelease-1>", self.click.on_mouse_up)
         # 右键点击事件
         self.label.bind("<ButtonPress-3>", self.click.on_right_click)
+        # 被其他窗口遮挡或失去焦点时重新置顶
+        self.root.bind("<Visibility>", self._on_visibility)
+        self.root.bind("<FocusOut>", self._on_focus_out)
+        # 退出请求（由 request_quit 通过 Tk 事件队列投递）
+        self.root.bind("<<RequestQuit>>", lambda e: self._do_quit())
+        # 语音助手在后台线程启动完成
+        self.root.bind("<<VoiceReady>>", self._on_voice_ready)
 
     def _start_loops(self) -> None:
         """启动循环"""
         self.music.init_backend()
         self.animation.animate()
         self.motion.tick()
-        self._topmost_after_id = self.root.after(2000, self._ensure_topmost)
-        self._quit_after_id = self.root.after(100, self._check_quit)
-        self._routine_after_id = self.root.after(
-            1000, self.routine.tick
-        )  # 1秒后开始作息检查
+        # 兜底检查，常规情况由 <Visibility>/<FocusOut> 触发
+        self.scheduler.call_later(TOPMOST_WATCHDOG_INTERVAL, self._ensure_topmost)
+        # 1秒后开始作息检查
+        self.scheduler.call_later(1000, self.routine.tick)
         
-        # 启动语音助手
-        if self.voice_assistant:
-            self.voice_assistant.start()
+        # 启动语音助手（未启用语音时不创建；打开音频设备在后台线程进行）
+        if load_config().get("voice_enabled", False):
+            self._executor.submit(self._start_voice_assistant, self.voice_assistant)
+
+    def _start_voice_assistant(self, voice: VoiceAssistant) -> None:
+        """在后台线程启动语音助手，完成后通知 Tk 主线程"""
+        if not voice.start() or self._quit_event.is_set():
+            return
+        try:
+            self.root.event_generate("<<VoiceReady>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # 启动期间已退出
+            pass
+
+    def _on_voice_ready(self, event: tk.Event | None = None) -> None:
+        """语音助手启动完成后刷新托盘菜单状态"""
+        self.refresh_tray_menu()
+
+    def refresh_tray_menu(self) -> None:
+        """状态变化后通知托盘重新读取菜单项状态（托盘未启动时忽略）
+
+        托盘菜单可能由托盘、快捷菜单、全局快捷键或定时器改变的状态驱动，
+        统一在状态改变处刷新，各调用方无需各自处理。
+        """
+        if hasattr(self, "tray_controller") and self.tray_controller:
+            self.tray_controller.refresh_menu()
 
     # ============ 番茄钟（兼容对外方法名） ============
 
@@ -199,6 +283,7 @@ class DesktopPet:
     def toggle_pomodoro(self) -> None:
         """开始/停止番茄钟"""
         self.pomodoro.toggle()
+        self.refresh_tray_menu()
 
     def reset_pomodoro(self) -> None:
         """重置番茄钟"""
@@ -220,7 +305,7 @@ class DesktopPet:
         """切换到移动动画"""
         self.animation.switch_to_move()
 
-    def set_behavior_mode(self, mode: str) -> None:
+    def set_behavior_mode(self, mode: BehaviorMode) -> None:
         """设置行为模式"""
         self.motion.set_behavior_mode(mode)
 
@@ -243,7 +328,7 @@ class DesktopPet:
         if not self._is_showing_greeting:
             self._is_showing_greeting = True
             self.speech_bubble.show_greeting()
-            self.root.after(5000, lambda: setattr(self, "_is_showing_greeting", False))
+            self._after(5000, lambda: setattr(self, "_is_showing_greeting", False))
 
     # ============ 公共方法 ============
 
@@ -253,9 +338,7 @@ class DesktopPet:
         if self.is_paused:
             self.is_moving = False
             if self.idle_gifs:
-                frames, delays = random.choice(self.idle_gifs)
-                self.current_frames = frames
-                self.current_delays = delays
+                self.current_frames, self.current_delays = self.animation.next_idle()
                 self.frame_index = 0
         else:
             self.animation.switch_to_move()
@@ -265,6 +348,7 @@ class DesktopPet:
         self.click_through = not self.click_through
         self.window.set_click_through(self.click_through)
         update_config(click_through=self.click_through)
+        self.refresh_tray_menu()
 
     def toggle_follow_mouse(self) -> None:
         """切换跟随鼠标"""
@@ -278,7 +362,7 @@ class DesktopPet:
 
     def set_scale(self, index: int) -> None:
         """设置缩放"""
-        if not (0 <= index < len(SCALE_OPTIONS)):
+        if not 0 <= index < _SCALE_LEN:
             return
 
         self._resizing = True
@@ -289,13 +373,11 @@ class DesktopPet:
         # 重新加载动画
         self.animation.load_animations()
 
-        if hasattr(self, "tray_controller") and self.tray_controller:
-            if self.tray_controller.icon:
-                self.tray_controller.icon.menu = self.tray_controller.build_menu()
+        self.refresh_tray_menu()
 
         self.animation.apply_scale_change()
         
-        # 确保窗口大小已更新
+        # 统一刷新一次几何信息（加载/同步阶段不再各自刷新）
         self.root.update_idletasks()
         
         # 更新所有UI组件的位置
@@ -308,38 +390,20 @@ class DesktopPet:
         # 更新宠物信息到UI管理器
         self.ui_manager.update_pet_info(self.x, self.y, self.w, self.h)
         
-        # 更新各组件的可见性
-        if hasattr(self, "music_panel") and self.music_panel and self.music_panel.window and self.music_panel.window.winfo_exists():
-            self.ui_manager.set_component_visibility("music_panel", self.music_panel.window.state() != "withdrawn")
-        else:
-            self.ui_manager.set_component_visibility("music_panel", False)
-            
-        if hasattr(self, "pomodoro_indicator") and self.pomodoro_indicator and self.pomodoro_indicator.window and self.pomodoro_indicator.window.winfo_exists():
-            self.ui_manager.set_component_visibility("pomodoro_indicator", self.pomodoro_indicator.window.state() != "withdrawn")
-        else:
-            self.ui_manager.set_component_visibility("pomodoro_indicator", False)
-            
-        if hasattr(self, "ai_chat_panel") and self.ai_chat_panel and self.ai_chat_panel.window and self.ai_chat_panel.window.winfo_exists():
-            self.ui_manager.set_component_visibility("ai_chat_panel", self.ai_chat_panel.window.state() != "withdrawn")
-        else:
-            self.ui_manager.set_component_visibility("ai_chat_panel", False)
-            
-        if hasattr(self, "speech_bubble") and self.speech_bubble and self.speech_bubble.window and self.speech_bubble.window.winfo_exists():
-            self.ui_manager.set_component_visibility("speech_bubble", self.speech_bubble.window.state() != "withdrawn")
-        else:
-            self.ui_manager.set_component_visibility("speech_bubble", False)
-            
-        # 更新快捷菜单位置（如果显示中）
-        if hasattr(self, "quick_menu") and self.quick_menu and self.quick_menu.window and self.quick_menu.window.winfo_exists():
-            # 快捷菜单会在下次显示时自动更新位置
-            pass
-            
+        # 更新各组件的可见性（读取组件自身维护的可见标记，不查询 Tk 窗口状态；
+        # 从管理器的注册表取组件，避免触发尚未创建的面板）
+        components = self.ui_manager.components
+        for name in self._UI_COMPONENT_NAMES:
+            component = components.get(name)
+            if component is not None:
+                self.ui_manager.set_component_visibility(name, bool(component.obj._visible))
+
         # 使用UI管理器更新布局
         self.ui_manager.update_layout()
 
     def set_transparency(self, index: int, persist: bool = True) -> None:
         """设置透明度"""
-        if not (0 <= index < len(TRANSPARENCY_OPTIONS)):
+        if not 0 <= index < _TRANSPARENCY_LEN:
             return
 
         self.transparency_index = index
@@ -347,69 +411,108 @@ class DesktopPet:
 
         if persist:
             update_config(transparency_index=index)
+        self.refresh_tray_menu()
 
     def set_auto_startup_flag(self, enable: bool) -> bool:
         """设置开机自启"""
         return set_auto_startup(enable)
 
     def request_quit(self) -> None:
-        """请求退出"""
-        self._request_quit = True
+        """请求退出（可在其他线程调用，经 Tk 事件队列切回主线程执行）"""
+        self._quit_event.set()
+        self.root.event_generate("<<RequestQuit>>", when="tail")
 
     def _ensure_topmost(self) -> None:
-        """确保窗口置顶"""
-        self._topmost_after_id = None
+        """确保窗口置顶（低频兜底检查），顺带刷新缓存的屏幕尺寸"""
+        self.state.refresh_screen_size()
         if not self.is_paused:
             self.window.ensure_topmost()
-        self._topmost_after_id = self.root.after(2000, self._ensure_topmost)
+        self.scheduler.call_later(TOPMOST_WATCHDOG_INTERVAL, self._ensure_topmost)
 
-    def _check_quit(self) -> None:
-        """检查退出标志"""
-        self._quit_after_id = None
-        if self._request_quit:
-            self._cancel_pending_afters()
-            self.music.stop()
-            # 注销全局快捷键
-            from src.src_platform.hotkey import hotkey_manager
+    def _on_visibility(self, event: tk.Event) -> None:
+        """窗口被遮挡时重新置顶"""
+        if event.widget is not self.root or self.is_paused:
+            return
+        if event.state != "VisibilityUnobscured":
+            self.window.ensure_topmost()
 
-            hotkey_manager.unregister_all()
+    def _on_focus_out(self, event: tk.Event) -> None:
+        """失去焦点后若置顶样式丢失则重新置顶"""
+        if event.widget is not self.root or self.is_paused:
+            return
+        if self.window.needs_topmost():
+            self.window.ensure_topmost()
 
-            # 关闭AI聊天面板
-            self.close_ai_chat_panel()
-            
-            # 停止语音助手
-            if hasattr(self, "voice_assistant") and self.voice_assistant:
-                self.voice_assistant.stop()
-                self.voice_assistant.cleanup()
-
-            if hasattr(self, "tray_controller") and self.tray_controller:
-                self.tray_controller.stop()
-            if hasattr(self, "music_panel") and self.music_panel:
-                self.music_panel.hide()
-            self.root.destroy()
+    def _do_quit(self) -> None:
+        """执行退出流程"""
+        if self._quitting:
             return
-        self._quit_after_id = self.root.after(100, self._check_quit)
+        self._quitting = True
+        self._cancel_pending_afters()
+        self.music.stop()
+        # 注销全局快捷键
+        from src.src_platform.hotkey import hotkey_manager
+
+        hotkey_manager.unregister_all()
+
+        # 销毁AI聊天面板（退出时不显示告别语）
+        if self._ai_chat_panel:
+            self._ai_chat_panel.destroy()
+
+        # 关闭AI引擎的后台线程池
+        if self.ai_chat:
+            self.ai_chat.shutdown()
+        
+        # 停止语音助手（在后台线程释放音频资源，销毁窗口前最多等待 2 秒）
+        voice_future = None
+        if self._voice_assistant:
+            voice_future = self._executor.submit(self._stop_voice_assistant, self._voice_assistant)
+
+        if hasattr(self, "tray_controller") and self.tray_controller:
+            self.tray_controller.stop()
+        if self._music_panel:
+            self._music_panel.hide()
+        # 写入尚未落盘的配置
+        flush_config()
+        if voice_future is not None:
+            wait([voice_future], timeout=2.0)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    @staticmethod
+    def _stop_voice_assistant(voice: VoiceAssistant) -> None:
+        """在后台线程停止语音助手并释放资源"""
+        voice.stop()
+        voice.cleanup()
+
+    def _after(self, ms: int, func: Callable[[], object]) -> str:
+        """注册一次性 after 任务，并记录到 _pending_afters 以便退出时取消"""
+        after_id = ""
+
+        def run() -> None:
+            self._pending_afters.discard(after_id)
+            func()
+
+        after_id = self.root.after(ms, run)
+        self._pending_afters.add(after_id)
+        return after_id
 
     def _cancel_pending_afters(self) -> None:
-        """取消已调度的 after 任务，避免退出时报 TclError"""
-        after_ids: list[tuple[str, Optional[str]]] = [
-            ("_animate_after_id", getattr(self, "_animate_after_id", None)),
-            ("_move_after_id", getattr(self, "_move_after_id", None)),
-            ("_routine_after_id", getattr(self, "_routine_after_id", None)),
-            ("_topmost_after_id", getattr(self, "_topmost_after_id", None)),
-            ("_quit_after_id", getattr(self, "_quit_after_id", None)),
-            ("_pomodoro_after_id", getattr(self, "_pomodoro_after_id", None)),
-            ("_music_after_id", getattr(self, "_music_after_id", None)),
-        ]
-
-        for name, after_id in after_ids:
-            if not after_id:
-                continue
+        """取消所有已调度的任务，避免退出时报 TclError"""
+        # 周期任务全部由调度器持有
+        self.scheduler.shutdown()
+        self._move_after_id = None
+        self._pomodoro_after_id = None
+
+        for after_id in list(self._pending_afters):
             try:
                 self.root.after_cancel(after_id)
             except tk.TclError:
                 pass
-            setattr(self, name, None)
+        self._pending_afters.clear()
+
+        # 尚未执行的延迟初始化任务
+        self._init_queue.cancel()
 
     
 
@@ -441,22 +544,20 @@ class DesktopPet:
     def next_music(self) -> None:
         """切换到下一首"""
         self.music.next()
-        if self._music_playing and self.speech_bubble.is_visible():
-            title = self.get_current_music_title()
-            if title:
-                self.speech_bubble.show(
-                    f"🎵 {title}", duration=None, allow_during_music=True
-                )
+        self._show_track_title_bubble()
 
     def prev_music(self) -> None:
         """切换到上一首"""
         self.music.prev()
-        if self._music_playing and self.speech_bubble.is_visible():
-            title = self.get_current_music_title()
-            if title:
-                self.speech_bubble.show(
-                    f"🎵 {title}", duration=None, allow_during_music=True
-                )
+        self._show_track_title_bubble()
+
+    def _show_track_title_bubble(self) -> None:
+        """切歌后刷新气泡中的歌名（气泡未显示时不处理）"""
+        if not (self._music_playing and self.speech_bubble.is_visible()):
+            return
+        title = self.music.get_current_title()
+        if title:
+            self.speech_bubble.show(f"🎵 {title}", duration=None, allow_during_music=True)
 
     def get_current_music_path(self) -> str:
         """获取当前音乐路径"""
@@ -478,13 +579,14 @@ class DesktopPet:
         """跳转到指定位置（秒）"""
         self.music.seek(seconds)
     
-    def set_music_volume(self, volume: int) -> None:
+    def set_music_volume(self, volume: int, persist: bool = True) -> None:
         """设置音乐音量
         
         Args:
             volume: 音量值 (0-100)
+            persist: 是否写入配置
         """
-        self.music.set_volume(volume)
+        self.music.set_volume(volume, persist)
     
     def get_music_volume(self) -> int:
         """获取当前音乐音量
@@ -513,10 +615,7 @@ class DesktopPet:
         self._show_chat_input_dialog()
 
     def _show_chat_input_dialog(self) -> None:
-        """显示聊天输入对话框"""
-        import tkinter as tk
-        from tkinter import ttk
-
+        """显示聊天输入对话框（首次创建，之后复用隐藏的窗口）"""
         # 根据人设选择标题和提示
         if (
             hasattr(self, "ai_chat")
@@ -529,40 +628,49 @@ class DesktopPet:
             title = "和阿米聊天"
             prompt = "想和阿米说点什么？"
 
-        dialog = tk.Toplevel(self.root)
+        dialog = self._chat_input_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._build_chat_input_dialog()
+
         dialog.title(title)
-        dialog.geometry("350x150")
-        dialog.resizable(False, False)
-        dialog.transient(self.root)
-        dialog.grab_set()
+        self._chat_input_prompt.config(text=prompt)
+        self._chat_input_var.set("")
 
         # 居中
-        dialog.update_idletasks()
         x = (dialog.winfo_screenwidth() - 350) // 2
         y = (dialog.winfo_screenheight() - 150) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.geometry(f"350x150+{x}+{y}")
+
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        self._chat_input_entry.focus()
+
+    def _build_chat_input_dialog(self) -> tk.Toplevel:
+        """创建聊天输入对话框（只创建一次）"""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
 
         # 提示文字
-        ttk.Label(
-            dialog,
-            text=prompt,
-            font=("Microsoft YaHei", 11, "bold"),
-        ).pack(pady=(15, 10))
+        prompt_label = ttk.Label(dialog, font=("Microsoft YaHei", 11, "bold"))
+        prompt_label.pack(pady=(15, 10))
 
         # 输入框
         input_var = tk.StringVar()
         entry = ttk.Entry(dialog, textvariable=input_var, font=("Microsoft YaHei", 10))
         entry.pack(fill=tk.X, padx=20, pady=5)
-        entry.focus()
 
         def on_send():
             message = input_var.get().strip()
             if message:
-                dialog.destroy()
+                on_cancel()
                 self._send_ai_message(message)
 
         def on_cancel():
-            dialog.destroy()
+            dialog.grab_release()
+            dialog.withdraw()
 
         # 按钮
         btn_frame = ttk.Frame(dialog)
@@ -575,6 +683,14 @@ class DesktopPet:
         entry.bind("<Return>", lambda e: on_send())
         # ESC取消
         entry.bind("<Escape>", lambda e: on_cancel())
+        # 关闭按钮只隐藏，下次直接复用
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+
+        self._chat_input_dialog = dialog
+        self._chat_input_prompt = prompt_label
+        self._chat_input_var = input_var
+        self._chat_input_entry = entry
+        return dialog
 
     def _send_ai_message(self, message: str) -> None:
         """发送消息给AI"""
@@ -607,15 +723,10 @@ class DesktopPet:
 
         if question is None:
             # 使用随机快捷问题
-            from src.ai.chat_engine import QuickChatManager
-
-            quick_manager = QuickChatManager(self.ai_chat)
-            question = quick_manager.get_random_question()
+            question = self._get_quick_chat_manager().get_random_question()
 
         # 如果是爱弥斯人设，检查是否有本地预设回复
         if self.ai_chat.current_personality == "aemeath":
-            from src.ai.emys_character import get_quick_reply
-
             quick_reply = get_quick_reply(question)
             if quick_reply:
                 # 使用打字机效果显示预设回复
@@ -624,6 +735,17 @@ class DesktopPet:
 
         self._send_ai_message(question)
 
+    def _get_quick_chat_manager(self) -> "QuickChatManager":
+        """获取快捷问题管理器（首次使用或切换人设后导入并创建）"""
+        personality = self.ai_chat.current_personality
+        if self._quick_chat_manager is None or self._quick_chat_personality != personality:
+            # chat_engine 依赖 requests，空闲启动时不导入
+            from src.ai.chat_engine import QuickChatManager
+
+            self._quick_chat_manager = QuickChatManager(self.ai_chat)
+            self._quick_chat_personality = personality
+        return self._quick_chat_manager
+
     def show_ai_config_dialog(self) -> None:
         """显示AI配置对话框"""
         config_dialog = AIConfigDialog(self)
@@ -650,7 +772,7 @@ class DesktopPet:
             return
 
         # 切换面板状态
-        if self.ai_chat_panel and self.ai_chat_panel.is_visible():
+        if self.is_ai_chat_panel_visible():
             # 关闭面板
             self.close_ai_chat_panel()
         else:
@@ -662,34 +784,30 @@ class DesktopPet:
         # 关闭气泡对话框
         self.speech_bubble.hide()
 
-        # 创建或显示面板
-        if not self.ai_chat_panel:
-            self.ai_chat_panel = AIChatPanel(self)
-            # 重新注册到UI管理器，确保引用正确
-            if hasattr(self, 'ui_manager'):
-                self.ui_manager.register_component("ai_chat_panel", self.ai_chat_panel, 260, 45, "right", 3)
-
+        # 创建（首次访问时注册到UI管理器）并显示面板
         self.ai_chat_panel.show()
 
-    def close_ai_chat_panel(self) -> None:
-        """关闭AI聊天面板"""
-        if self.ai_chat_panel:
-            # 触发告别语
-            import random
-            from src.ai.emys_character import EMYS_RESPONSES
+    def close_ai_chat_panel(self, announce: bool = True) -> None:
+        """关闭AI聊天面板
 
-            farewell_text = random.choice(EMYS_RESPONSES["farewell"])
-            self.speech_bubble.show(farewell_text, duration=3000)
+        Args:
+            announce: 是否显示告别语气泡（退出流程中传 False）
+        """
+        if self._ai_chat_panel:
+            # 触发告别语
+            if announce:
+                farewell_text = random.choice(_FAREWELLS)
+                self.speech_bubble.show(farewell_text, duration=3000)
 
-            self.ai_chat_panel.close()
-            self.ai_chat_panel = None
+            # 只隐藏窗口，面板实例与窗口保留供下次打开复用
+            self._ai_chat_panel.close()
         else:
             # 关闭气泡
             self.speech_bubble.hide()
 
     def is_ai_chat_panel_visible(self) -> bool:
         """检查AI聊天面板是否可见"""
-        return self.ai_chat_panel is not None and self.ai_chat_panel.is_visible()
+        return self._ai_chat_panel is not None and self._ai_chat_panel.is_visible()
     
     # ============ 语音助手功能 ============
     
@@ -699,10 +817,6 @@ class DesktopPet:
         Returns:
             True 表示已启动，False 表示已停止
         """
-        if not hasattr(self, "voice_assistant") or not self.voice_assistant:
-            self.speech_bubble.show("语音助手功能未初始化~", duration=3000)
-            return False
-        
         return self.voice_assistant.toggle_voice_assistant()
     
     def start_voice_recognition(self) -> bool:
@@ -711,10 +825,6 @@ class DesktopPet:
         Returns:
             True 表示成功开始，False 表示失败
         """
-        if not hasattr(self, "voice_assistant") or not self.voice_assistant:
-            self.speech_bubble.show("语音助手功能未初始化~", duration=3000)
-            return False
-        
         return self.voice_assistant.start_voice_recognition()
     
     def stop_voice_recognition(self) -> bool:
@@ -723,10 +833,6 @@ class DesktopPet:
         Returns:
             True 表示成功停止，False 表示失败
         """
-        if not hasattr(self, "voice_assistant") or not self.voice_assistant:
-            self.speech_bubble.show("语音助手功能未初始化~", duration=3000)
-            return False
-        
         return self.voice_assistant.stop_voice_recognition()
     
     def is_voice_assistant_available(self) -> bool:
@@ -735,9 +841,6 @@ class DesktopPet:
         Returns:
             True 表示可用，False 表示不可用
         """
-        if not hasattr(self, "voice_assistant") or not self.voice_assistant:
-            return False
-        
         return self.voice_assistant.is_available()
     
     def is_voice_assistant_running(self) -> bool:
@@ -746,7 +849,7 @@ class DesktopPet:
         Returns:
             True 表示正在运行，False 表示未运行
         """
-        if not hasattr(self, "voice_assistant") or not self.voice_assistant:
+        if self._voice_assistant is None:
             return False
         
-        return self.voice_assistant.is_running
\ No newline at end of file
+        return self._voice_assistant.is_running
\ No newline at end of file
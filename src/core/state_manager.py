@@ -10,10 +10,6 @@ from src.constants import (
     SPEED_X,
     SPEED_Y,
 )
-from src.ui.music_panel import MusicPanel
-from src.ui.pomodoro_indicator import PomodoroIndicator
-from src.ui.quick_menu import QuickMenu
-from src.ui.speech_bubble import SpeechBubble
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
@@ -28,13 +24,22 @@ class StateManager:
     def __init__(self, app: "DesktopPet") -> None:
         self.app = app
 
+    def refresh_screen_size(self) -> None:
+        """重新读取屏幕尺寸
+
+        布局计算统一使用 app.screen_w/screen_h，避免每次定位都同步查询 Tk；
+        分辨率变化由低频兜底检查调用此方法刷新。
+        """
+        app = self.app
+        app.screen_w = app.root.winfo_screenwidth()
+        app.screen_h = app.root.winfo_screenheight()
+
     def init_state(self) -> None:
         """初始化状态变量"""
         app = self.app
 
         # 屏幕尺寸（必须先初始化）
-        app.screen_w = app.root.winfo_screenwidth()
-        app.screen_h = app.root.winfo_screenheight()
+        self.refresh_screen_size()
 
         # 运动状态
         app.is_moving = True
@@ -85,14 +90,9 @@ class StateManager:
         app._jitter_y = 0.0
 
         # 待机动画轮换
-        app._idle_cycle = []
         app._last_idle_index: Optional[int] = None
 
-        # 互动系统
-        app.speech_bubble = SpeechBubble(app)
-        app.quick_menu = QuickMenu(app)
-        app.pomodoro_indicator = PomodoroIndicator(app)
-        app.music_panel = MusicPanel(app)
+        # 互动系统（气泡/菜单由 DesktopPet._create_ui_components 创建，面板按需创建）
         app._last_click_time = 0
         app._click_count = 0
         app._is_showing_greeting = False
@@ -112,13 +112,6 @@ class StateManager:
         app._move_after_id = None
         app._move_ticks_since_move = 0
 
-        # after 任务句柄（用于退出时取消，避免 TclError）
-        app._animate_after_id = None
-        app._routine_after_id = None
-        app._topmost_after_id = None
-        app._quit_after_id = None
-        app._music_after_id = None
-
         # 番茄钟状态
         app._pomodoro_enabled = False
         app._pomodoro_phase = "work"
@@ -127,8 +120,6 @@ class StateManager:
         app._pomodoro_after_id = None
         app._pomodoro_total = 0
 
-        app._idle_after_id = None
-
         # 应用行为模式（读取自配置）
         if getattr(app, "behavior_mode", None) is None:
             app.behavior_mode = BEHAVIOR_MODE_ACTIVE
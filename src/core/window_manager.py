@@ -7,11 +7,18 @@ from typing import TYPE_CHECKING, Optional
 import tkinter as tk
 
 from src.constants import TRANSPARENT_COLOR, TRANSPARENCY_OPTIONS
-from src.src_platform.system import get_window_handle, set_click_through, set_window_topmost
+from src.src_platform.system import (
+    get_window_handle,
+    is_window_topmost,
+    set_click_through,
+    set_window_topmost,
+)
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+_TRANSPARENCY_LEN = len(TRANSPARENCY_OPTIONS)
+
 
 class WindowManager:
     """窗口管理器
@@ -45,7 +52,7 @@ class WindowManager:
 
     def set_transparency(self, index: int) -> None:
         """设置窗口透明度（不负责持久化）"""
-        if not (0 <= index < len(TRANSPARENCY_OPTIONS)):
+        if not 0 <= index < _TRANSPARENCY_LEN:
             return
         alpha = TRANSPARENCY_OPTIONS[index]
         self.app.root.attributes("-alpha", alpha)
@@ -56,6 +63,13 @@ class WindowManager:
         if hwnd:
             set_click_through(hwnd, enable)
 
+    def needs_topmost(self) -> bool:
+        """窗口是否丢失了置顶样式（仅一次 Win32 查询，不改变窗口状态）"""
+        hwnd: Optional[int] = getattr(self.app, "hwnd", None)
+        if not hwnd:
+            return False
+        return not is_window_topmost(hwnd)
+
     def ensure_topmost(self) -> None:
         """确保窗口置顶"""
         hwnd: Optional[int] = getattr(self.app, "hwnd", None)
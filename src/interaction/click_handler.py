@@ -109,7 +109,7 @@ class ClickHandler:
         app.speech_bubble.show_click_reaction()
         
         # 在活泼模式和粘人模式下，确保UI管理器立即更新布局
-        if app.behavior_mode in ["active", "clingy"]:
+        if app.behavior_mode != BEHAVIOR_MODE_QUIET:
             if hasattr(app, 'ui_manager'):
                 # 确保主窗口已更新
                 app.root.update_idletasks()
@@ -52,22 +52,15 @@ class DragHandler:
             
             # 使用UI管理器更新布局
             if hasattr(app, 'ui_manager'):
-                app.ui_manager.update_pet_info(app.x, app.y, app.w, app.h)
-                app.ui_manager.update_layout()
+                app.ui_manager.set_pet_info_and_relayout(app.x, app.y, app.w, app.h)
             else:
                 # 如果没有UI管理器，使用旧的方法
                 if hasattr(app, "speech_bubble") and app.speech_bubble:
                     app.speech_bubble.update_position()
-                if hasattr(app, "pomodoro_indicator") and app.pomodoro_indicator:
-                    app.pomodoro_indicator.update_position()
-                if hasattr(app, "music_panel") and app.music_panel:
-                    app.music_panel.update_position()
-                if (
-                    hasattr(app, "ai_chat_panel")
-                    and app.ai_chat_panel
-                    and app.ai_chat_panel.is_visible()
-                ):
-                    app.ai_chat_panel._update_position()
+                if app._music_panel:
+                    app._music_panel.update_position()
+                if app.is_ai_chat_panel_visible():
+                    app._ai_chat_panel._update_position()
 
     def stop_drag(self, event: tk.Event) -> None:
         """停止拖动"""
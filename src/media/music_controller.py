@@ -177,7 +177,7 @@ class MusicController:
 
         app.animation.ensure_music_frames()
         app.animation.switch_to_music_animation()
-        app._music_after_id = app.root.after(500, self._check_end)
+        app.scheduler.call_later(500, self._check_end)
         return True
 
     def stop(self) -> None:
@@ -203,8 +203,8 @@ class MusicController:
         app._music_paused_total = 0.0
 
         app.animation.restore_animation_after_music()
-        if hasattr(app, "music_panel") and app.music_panel:
-            app.music_panel.hide()
+        if app._music_panel:
+            app._music_panel.hide()
         if hasattr(app, "speech_bubble") and app.speech_bubble:
             app.speech_bubble.hide()
 
@@ -250,11 +250,10 @@ class MusicController:
     def _check_end(self) -> None:
         """检查音乐是否播放完毕"""
         app = self.app
-        app._music_after_id = None
         if not app._music_playing:
             return
         if app._music_paused:
-            app._music_after_id = app.root.after(500, self._check_end)
+            app.scheduler.call_later(500, self._check_end)
             return
 
         if not pygame.mixer.music.get_busy():
@@ -281,31 +280,29 @@ class MusicController:
                         app.ui_manager.update_pet_info(app.x, app.y, app.w, app.h)
                     app.speech_bubble.show(f"🎵 {title}", duration=None, allow_during_music=True)
 
-        app._music_after_id = app.root.after(500, self._check_end)
+        app.scheduler.call_later(500, self._check_end)
 
 
     
-    def set_volume(self, volume: int) -> None:
+    def set_volume(self, volume: int, persist: bool = True) -> None:
         """设置音乐音量
         
         Args:
             volume: 音量值 (0-100)
+            persist: 是否写入配置（拖动滑块过程中只应用，松开时再保存）
         """
         # 确保音量在有效范围内
         volume = max(0, min(100, volume))
         self._music_volume = volume
         
-        print(f"🔧 调试: 设置音乐音量为 {volume}")
-        
         # 应用音量设置
         if pygame.mixer.get_init():
             pygame.mixer.music.set_volume(volume / 100.0)
         
         # 保存到配置
-        from src.config import update_config
-        print(f"🔧 调试: 准备保存音乐音量到配置文件")
-        update_config(music_volume=volume)
-        print(f"🔧 调试: 音乐音量已保存到配置文件")
+        if persist:
+            from src.config import update_config
+            update_config(music_volume=volume)
     
     def get_volume(self) -> int:
         """获取当前音乐音量
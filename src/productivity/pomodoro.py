@@ -57,19 +57,20 @@ class PomodoroManager:
         self.app._pomodoro_remaining = 0
         self.app._pomodoro_total = 0
         if self.app._pomodoro_after_id:
-            self.app.root.after_cancel(self.app._pomodoro_after_id)
+            self.app.scheduler.cancel(self.app._pomodoro_after_id)
             self.app._pomodoro_after_id = None
-        self.app.pomodoro_indicator.hide()
+        if self.app._pomodoro_indicator:
+            self.app._pomodoro_indicator.hide()
         self.app.speech_bubble.show("番茄钟已停止", duration=2000)
 
     def _schedule_tick(self) -> None:
         """调度番茄钟计时"""
         if self.app._pomodoro_after_id:
-            self.app.root.after_cancel(self.app._pomodoro_after_id)
+            self.app.scheduler.cancel(self.app._pomodoro_after_id)
             self.app._pomodoro_after_id = None
         if not self.app._pomodoro_enabled or self.app._pomodoro_paused:
             return
-        self.app._pomodoro_after_id = self.app.root.after(1000, self._tick)
+        self.app._pomodoro_after_id = self.app.scheduler.call_later(1000, self._tick)
 
     def _tick(self) -> None:
         """番茄钟计时回调"""
@@ -100,7 +101,8 @@ class PomodoroManager:
     def _update_indicator(self) -> None:
         """更新番茄钟进度显示"""
         if not self.app._pomodoro_enabled:
-            self.app.pomodoro_indicator.hide()
+            if self.app._pomodoro_indicator:
+                self.app._pomodoro_indicator.hide()
             return
 
         phase_text = "专注" if self.app._pomodoro_phase == "work" else "休息"
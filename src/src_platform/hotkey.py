@@ -535,8 +535,8 @@ class GlobalHotkey:
             if self.app.root.state() == "withdrawn":
                 self.app.root.deiconify()
                 # 显示宠物时，如果音乐面板之前是显示的，也显示音乐面板
-                if hasattr(self.app, "music_panel") and self.app.music_panel and hasattr(self.app.music_panel, "_was_visible") and self.app.music_panel._was_visible:
-                    self.app.music_panel.show()
+                if self.app._music_panel and hasattr(self.app._music_panel, "_was_visible") and self.app._music_panel._was_visible:
+                    self.app._music_panel.show()
                 # 显示宠物时，如果语音气泡之前是显示的，也显示语音气泡
                 if hasattr(self.app, "speech_bubble") and self.app.speech_bubble and hasattr(self.app.speech_bubble, "_was_visible") and self.app.speech_bubble._was_visible:
                     # 重新显示歌名
@@ -545,12 +545,12 @@ class GlobalHotkey:
                         self.app.speech_bubble.show(f"🎵 {title}", duration=None, allow_during_music=True)
             else:
                 # 隐藏宠物时，记录音乐面板的显示状态并隐藏音乐面板
-                if hasattr(self.app, "music_panel") and self.app.music_panel and self.app.music_panel.window and self.app.music_panel.window.winfo_exists() and self.app.music_panel.window.state() != "withdrawn":
-                    self.app.music_panel._was_visible = True
-                    self.app.music_panel.hide()
+                if self.app._music_panel and self.app._music_panel.window and self.app._music_panel.window.winfo_exists() and self.app._music_panel.window.state() != "withdrawn":
+                    self.app._music_panel._was_visible = True
+                    self.app._music_panel.hide()
                 else:
-                    if hasattr(self.app, "music_panel") and self.app.music_panel:
-                        self.app.music_panel._was_visible = False
+                    if self.app._music_panel:
+                        self.app._music_panel._was_visible = False
                 # 隐藏宠物时，记录语音气泡的显示状态并隐藏语音气泡
                 if hasattr(self.app, "speech_bubble") and self.app.speech_bubble and self.app.speech_bubble.window and self.app.speech_bubble.window.winfo_exists() and self.app.speech_bubble.window.state() != "withdrawn":
                     self.app.speech_bubble._was_visible = True
@@ -559,6 +559,7 @@ class GlobalHotkey:
                     if hasattr(self.app, "speech_bubble") and self.app.speech_bubble:
                         self.app.speech_bubble._was_visible = False
                 self.app.root.withdraw()
+            self.app.refresh_tray_menu()
 
     def _quit(self) -> None:
         """退出程序"""
@@ -680,7 +681,7 @@ class GlobalHotkey:
                 self._translate_panel_shown = True
 
                 # 显示翻译窗口
-                if hasattr(self.app, "translate_window"):
+                if getattr(self.app, "translate_window", None):
                     self.app.translate_window.show(text)
 
                 # 300ms后允许再次触发
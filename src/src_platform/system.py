@@ -11,6 +11,7 @@ from src.constants import (
     SWP_NOSIZE,
     SWP_SHOWWINDOW,
     WS_EX_LAYERED,
+    WS_EX_TOPMOST,
     WS_EX_TRANSPARENT,
 )
 
@@ -53,6 +54,23 @@ def set_window_topmost(hwnd: int) -> bool:
         return False
 
 
+def is_window_topmost(hwnd: int) -> bool:
+    """检查窗口是否仍带有置顶样式
+
+    Args:
+        hwnd: 窗口句柄
+
+    Returns:
+        是否置顶（查询失败时返回 True，避免误触发重设）
+    """
+    try:
+        style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+        return bool(style & WS_EX_TOPMOST)
+    except (OSError, ctypes.WinError) as e:
+        print(f"查询窗口置顶状态失败: {e}")
+        return True
+
+
 def set_click_through(hwnd: int, enable: bool) -> bool:
     """设置鼠标穿透
 
@@ -2,57 +2,132 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from typing import TYPE_CHECKING
-
-import pystray
-from PIL import Image
+import tempfile
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
 
+from src.config import get_config_value, update_config
 from src.constants import (
     BEHAVIOR_MODE_ACTIVE,
     BEHAVIOR_MODE_CLINGY,
     BEHAVIOR_MODE_QUIET,
+    BehaviorMode,
     SCALE_OPTIONS,
     TRANSPARENCY_OPTIONS,
 )
 from src.utils import resource_path
 
 if TYPE_CHECKING:
+    import pystray
+    from PIL import Image
+
     from src.core.pet_core import DesktopPet
 
+# 缩放后的托盘图标缓存到临时目录，下次启动直接读取，跳过 GIF 解码与 LANCZOS 缩放
+_ICON_CACHE_PATH = os.path.join(tempfile.gettempdir(), "aemeath_tray_64.png")
+
+
+@functools.lru_cache(maxsize=None)
+def _pystray():
+    """延迟导入 pystray（导入时会加载平台后端），首次用到托盘菜单时才导入"""
+    import pystray
+
+    return pystray
+
+
+# 缩放/不透明度菜单的文字，导入时计算一次
+SCALE_LABELS = tuple(f"{scale}x" for scale in SCALE_OPTIONS)
+TRANSPARENCY_LABELS = tuple(f"{int(alpha * 100)}%" for alpha in TRANSPARENCY_OPTIONS)
+
+# 菜单项文字 -> 选项下标。pystray 只接受 (icon, item) 形式的回调且不支持 partial，
+# 因此单选菜单共用一个绑定方法，通过 item.text 还原下标
+_SCALE_INDEX_BY_LABEL = {label: i for i, label in enumerate(SCALE_LABELS)}
+_TRANSPARENCY_INDEX_BY_LABEL = {label: i for i, label in enumerate(TRANSPARENCY_LABELS)}
+
 
 class TrayController:
     """系统托盘控制器"""
 
+    # 进程内的托盘图标缓存（图标内容与实例无关）
+    _icon_cache: Optional[Image.Image] = None
+
+    # 快捷提问：(菜单文字, 发送给 AI 的问题)
+    _QUICK_QUESTIONS = (
+        ("讲个笑话", "讲个笑话"),
+        ("今天星期几", "今天星期几？"),
+        ("给我建议", "给我点建议"),
+        ("我累了", "我累了"),
+    )
+    _QUICK_QUESTION_BY_LABEL = dict(_QUICK_QUESTIONS)
+
+    # 只需翻转配置、无其他副作用的开关：菜单文字 -> 配置键
+    _CONFIG_TOGGLES = {
+        "语音唤醒": "voice_wakeup_enabled",
+        "语音识别": "voice_asr_enabled",
+        "语音合成": "voice_tts_enabled",
+        "开启/关闭翻译": "translate_enabled",
+        "开启/关闭": "quick_launch_enabled",
+    }
+
     def __init__(self, app: DesktopPet):
         self.app = app
         self.icon: pystray.Icon | None = None
+        self._menu: pystray.Menu | None = None
 
     def _create_icon_image(self) -> Image.Image:
-        """创建托盘图标"""
+        """创建托盘图标（进程内缓存，并在磁盘上缓存缩放结果）"""
+        cls = type(self)
+        if cls._icon_cache is None:
+            cls._icon_cache = self._load_icon_image()
+        return cls._icon_cache
+
+    @staticmethod
+    def _load_icon_image() -> Image.Image:
+        """读取托盘图标：磁盘缓存比 GIF 新时直接使用，否则重新缩放并写入缓存"""
+        from PIL import Image
+
+        gif_path = resource_path("assets/gifs/Aemeath.gif")
         try:
-            icon_gif = Image.open(resource_path("assets/gifs/Aemeath.gif"))
-            icon_gif.seek(0)
-            icon_image = icon_gif.convert("RGBA")
-            return icon_image.resize((64, 64), Image.Resampling.LANCZOS)
+            if os.path.getmtime(_ICON_CACHE_PATH) >= os.path.getmtime(gif_path):
+                # 单帧 PNG 在 load() 后即关闭文件
+                cached = Image.open(_ICON_CACHE_PATH)
+                cached.load()
+                return cached
+        except OSError:
+            pass
+
+        try:
+            # 在 with 内完成解码与缩放，返回的图像不再持有 GIF 文件句柄
+            with Image.open(gif_path) as icon_gif:
+                icon_image = icon_gif.convert("RGBA").resize((64, 64), Image.Resampling.LANCZOS)
+                icon_image.load()
         except Exception as e:
             print(f"加载托盘图标失败，使用默认图标: {e}")
             return Image.new("RGB", (64, 64), color="pink")
 
+        try:
+            icon_image.save(_ICON_CACHE_PATH, format="PNG")
+        except OSError as e:
+            print(f"写入托盘图标缓存失败: {e}")
+        return icon_image
+
     def _toggle_startup(self, icon: pystray.Icon):
         """切换开机自启"""
         self.app.auto_startup = not self.app.auto_startup
         self.app.set_auto_startup_flag(self.app.auto_startup)
         self.app.update_config(auto_startup=self.app.auto_startup)
-        icon.menu = self.build_menu()
+        self.refresh_menu()
 
     def _toggle_visible(self, icon: pystray.Icon):
         """切换隐藏/显示"""
         if self.app.root.state() == "withdrawn":
             self.app.root.deiconify()
             # 显示宠物时，如果音乐面板之前是显示的，也显示音乐面板
-            if hasattr(self.app, "music_panel") and self.app.music_panel and hasattr(self.app.music_panel, "_was_visible") and self.app.music_panel._was_visible:
-                self.app.music_panel.show()
+            if self.app._music_panel and hasattr(self.app._music_panel, "_was_visible") and self.app._music_panel._was_visible:
+                self.app._music_panel.show()
             # 显示宠物时，如果语音气泡之前是显示的，也显示语音气泡
             if hasattr(self.app, "speech_bubble") and self.app.speech_bubble and hasattr(self.app.speech_bubble, "_was_visible") and self.app.speech_bubble._was_visible:
                 # 重新显示歌名
@@ -61,12 +136,12 @@ class TrayController:
                     self.app.speech_bubble.show(f"🎵 {title}", duration=None, allow_during_music=True)
         else:
             # 隐藏宠物时，记录音乐面板的显示状态并隐藏音乐面板
-            if hasattr(self.app, "music_panel") and self.app.music_panel and self.app.music_panel.window and self.app.music_panel.window.winfo_exists() and self.app.music_panel.window.state() != "withdrawn":
-                self.app.music_panel._was_visible = True
-                self.app.music_panel.hide()
+            if self.app._music_panel and self.app._music_panel.window and self.app._music_panel.window.winfo_exists() and self.app._music_panel.window.state() != "withdrawn":
+                self.app._music_panel._was_visible = True
+                self.app._music_panel.hide()
             else:
-                if hasattr(self.app, "music_panel") and self.app.music_panel:
-                    self.app.music_panel._was_visible = False
+                if self.app._music_panel:
+                    self.app._music_panel._was_visible = False
             # 隐藏宠物时，记录语音气泡的显示状态并隐藏语音气泡
             if hasattr(self.app, "speech_bubble") and self.app.speech_bubble and self.app.speech_bubble.window and self.app.speech_bubble.window.winfo_exists() and self.app.speech_bubble.window.state() != "withdrawn":
                 self.app.speech_bubble._was_visible = True
@@ -75,27 +150,23 @@ class TrayController:
                 if hasattr(self.app, "speech_bubble") and self.app.speech_bubble:
                     self.app.speech_bubble._was_visible = False
             self.app.root.withdraw()
-        icon.menu = self.build_menu()
+        self.refresh_menu()
 
     def _toggle_click_through(self, icon: pystray.Icon):
         """切换鼠标穿透"""
         self.app.toggle_click_through()
-        icon.menu = self.build_menu()
 
-    def _set_behavior_mode(self, icon: pystray.Icon, mode: str):
+    def _set_behavior_mode(self, icon: pystray.Icon, mode: BehaviorMode):
         """设置行为模式"""
         self.app.set_behavior_mode(mode)
-        icon.menu = self.build_menu()
 
     def _toggle_pomodoro(self, icon: pystray.Icon):
         """开始/停止番茄钟"""
         self.app.toggle_pomodoro()
-        icon.menu = self.build_menu()
 
     def _reset_pomodoro(self, icon: pystray.Icon):
         """重置番茄钟"""
         self.app.reset_pomodoro()
-        icon.menu = self.build_menu()
 
     def _quit(self, icon: pystray.Icon):
         """退出程序"""
@@ -104,69 +175,60 @@ class TrayController:
     def _on_set_scale(self, icon: pystray.Icon, index: int):
         """设置缩放"""
         self.app.set_scale(index)
-        icon.menu = self.build_menu()
 
     def _on_set_transparency(self, icon: pystray.Icon, index: int):
         """设置透明度"""
         self.app.set_transparency(index)
-        icon.menu = self.build_menu()
-
-    def _create_scale_menu(self) -> pystray.Menu:
-        """创建设置缩放子菜单"""
-        items = []
-        for i, scale in enumerate(SCALE_OPTIONS):
 
-            def make_handler(idx):
-                def handler(icon, item):
-                    self._on_set_scale(icon, idx)
+    def _on_scale_item(self, icon: pystray.Icon, item: pystray.MenuItem):
+        """缩放菜单项回调"""
+        self._on_set_scale(icon, _SCALE_INDEX_BY_LABEL[item.text])
 
-                return handler
+    def _is_scale_checked(self, index: int, item: pystray.MenuItem) -> bool:
+        """缩放菜单项是否选中"""
+        return self.app.scale_index == index
 
-            def make_checker(idx):
-                def checker(item):
-                    return self.app.scale_index == idx
+    def _on_transparency_item(self, icon: pystray.Icon, item: pystray.MenuItem):
+        """透明度菜单项回调"""
+        self._on_set_transparency(icon, _TRANSPARENCY_INDEX_BY_LABEL[item.text])
 
-                return checker
+    def _is_transparency_checked(self, index: int, item: pystray.MenuItem) -> bool:
+        """透明度菜单项是否选中"""
+        return self.app.transparency_index == index
 
-            items.append(
+    def _create_scale_menu(self) -> pystray.Menu:
+        """创建设置缩放子菜单"""
+        pystray = _pystray()
+        return pystray.Menu(
+            *(
                 pystray.MenuItem(
-                    f"{scale}x",
-                    make_handler(i),
-                    checked=make_checker(i),
+                    label,
+                    self._on_scale_item,
+                    checked=functools.partial(self._is_scale_checked, i),
                     radio=True,
                 )
+                for i, label in enumerate(SCALE_LABELS)
             )
-        return pystray.Menu(*items)
+        )
 
     def _create_transparency_menu(self) -> pystray.Menu:
         """创建透明度子菜单"""
-        items = []
-        for i, alpha in enumerate(TRANSPARENCY_OPTIONS):
-
-            def make_handler(idx):
-                def handler(icon, item):
-                    self._on_set_transparency(icon, idx)
-
-                return handler
-
-            def make_checker(idx):
-                def checker(item):
-                    return self.app.transparency_index == idx
-
-                return checker
-
-            items.append(
+        pystray = _pystray()
+        return pystray.Menu(
+            *(
                 pystray.MenuItem(
-                    f"{int(alpha * 100)}%",
-                    make_handler(i),
-                    checked=make_checker(i),
+                    label,
+                    self._on_transparency_item,
+                    checked=functools.partial(self._is_transparency_checked, i),
                     radio=True,
                 )
+                for i, label in enumerate(TRANSPARENCY_LABELS)
             )
-        return pystray.Menu(*items)
+        )
 
     def _create_behavior_mode_menu(self) -> pystray.Menu:
         """创建行为模式子菜单"""
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
                 "安静模式",
@@ -190,9 +252,10 @@ class TrayController:
 
     def _create_pomodoro_menu(self) -> pystray.Menu:
         """创建番茄钟子菜单"""
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
-                "开始" if not self.app._pomodoro_enabled else "停止",
+                lambda item: "停止" if self.app._pomodoro_enabled else "开始",
                 self._toggle_pomodoro,
             ),
             pystray.MenuItem(
@@ -204,25 +267,12 @@ class TrayController:
 
     def _create_ai_menu(self) -> pystray.Menu:
         """创建AI助手子菜单"""
+        pystray = _pystray()
         # 快捷提问
-        quick_questions = [
-            ("讲个笑话", "讲个笑话"),
-            ("今天星期几", "今天星期几？"),
-            ("给我建议", "给我点建议"),
-            ("我累了", "我累了"),
-        ]
-
-        quick_items = []
-        for label, question in quick_questions:
-
-            def make_handler(q):
-                def handler(icon, item):
-                    self.app.quick_ai_chat(q)
-
-                return handler
+        quick_menu = pystray.Menu(
+            *(pystray.MenuItem(label, self._ai_quick_handler) for label, _ in self._QUICK_QUESTIONS)
+        )
 
-            quick_items.append(pystray.MenuItem(label, make_handler(question)))
-        
         # 人设菜单
         personality_menu = pystray.Menu(
             pystray.MenuItem(
@@ -246,7 +296,7 @@ class TrayController:
             ),
             pystray.MenuItem(
                 "快捷提问",
-                pystray.Menu(*quick_items),
+                quick_menu,
             ),
             pystray.MenuItem(
                 "随机话题",
@@ -264,15 +314,13 @@ class TrayController:
             ),
         )
     
+    def _ai_quick_handler(self, icon: pystray.Icon, item: pystray.MenuItem):
+        """快捷提问菜单项回调"""
+        self.app.quick_ai_chat(self._QUICK_QUESTION_BY_LABEL[item.text])
+
     def _create_config_menu(self) -> pystray.Menu:
         """创建配置子菜单"""
-        from src.config import load_config
-        config = load_config()
-        
-        # 获取当前配置状态
-        system_commands_enabled = config.get("system_commands_enabled", True)
-        llm_assistance_enabled = config.get("llm_command_assistance_enabled", True)
-        
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
                 "配置AI",
@@ -296,189 +344,175 @@ class TrayController:
             ),
         )
     
+    def _volume_specs(self) -> Tuple[Tuple[str, str, int, Callable[[int], None]], ...]:
+        """音量对话框的各项：(标题, 配置键, 默认值, 应用函数)，音量范围均为 0-100"""
+        return (
+            ("TTS音量", "tts_volume", 50, self._apply_tts_volume),
+            ("音乐音量", "music_volume", 70, self.app.set_music_volume),
+        )
+
+    def _apply_tts_volume(self, volume: int) -> None:
+        """应用TTS音量（语音助手未启动时只保存配置）"""
+        if self.app._voice_assistant:
+            self.app._voice_assistant.set_tts_volume(volume)
+
     def _create_volume_menu(self) -> pystray.Menu:
         """创建音量控制子菜单"""
-        from src.config import load_config
-        
-        config = load_config()
-        music_volume = config.get("music_volume", 0.7)
-        voice_volume = config.get("voice_volume", 0.8)
-        
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
-                f"音乐音量: {int(music_volume * 100)}%",
-                lambda icon, item: self._show_volume_config_dialog("music"),
+                lambda item: f"音乐音量: {self._get_config_value('music_volume', 70)}%",
+                lambda icon, item: self._show_volume_dialog(focus_key="music_volume"),
             ),
             pystray.MenuItem(
-                f"语音音量: {int(voice_volume * 100)}%",
-                lambda icon, item: self._show_volume_config_dialog("voice"),
+                lambda item: f"语音音量: {self._get_config_value('tts_volume', 50)}%",
+                lambda icon, item: self._show_volume_dialog(focus_key="tts_volume"),
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
                 "音量设置",
-                lambda icon, item: self._show_volume_config_dialog(),
+                lambda icon, item: self._show_volume_dialog(),
             ),
         )
-    
-    def _show_volume_config_dialog(self, volume_type=None):
-        """显示音量配置对话框"""
-        import tkinter as tk
-        from tkinter import ttk
-        from src.config import load_config, update_config
-        
+
+    def _show_volume_dialog(self, specs=None, focus_key: Optional[str] = None) -> None:
+        """显示音量控制对话框
+
+        Args:
+            specs: 对话框中的音量项，格式同 _volume_specs，默认为TTS与音乐音量
+            focus_key: 打开后获得焦点的音量项配置键
+        """
+        if specs is None:
+            specs = self._volume_specs()
+
         # 创建对话框窗口
         dialog = tk.Toplevel()
-        dialog.title("音量设置")
-        dialog.geometry("400x300")
+        dialog.title("音量控制")
         dialog.resizable(False, False)
-        
-        # 设置窗口居中
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-        
-        # 加载当前配置
-        config = load_config()
-        music_volume = tk.DoubleVar(value=config.get("music_volume", 0.7))
-        voice_volume = tk.DoubleVar(value=config.get("voice_volume", 0.8))
-        
+
         # 创建主框架
         main_frame = ttk.Frame(dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # 音乐音量控制
-        music_frame = ttk.LabelFrame(main_frame, text="音乐音量", padding="10")
-        music_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        music_label = ttk.Label(music_frame, text=f"当前音量: {int(music_volume.get() * 100)}%")
-        music_label.pack(anchor=tk.W)
-        
-        music_scale = ttk.Scale(
-            music_frame,
-            from_=0.0,
-            to=1.0,
-            variable=music_volume,
-            orient=tk.HORIZONTAL,
-            command=lambda value: music_label.config(text=f"当前音量: {int(float(value) * 100)}%")
-        )
-        music_scale.pack(fill=tk.X, pady=(5, 0))
-        
-        # 语音音量控制
-        voice_frame = ttk.LabelFrame(main_frame, text="语音音量", padding="10")
-        voice_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        voice_label = ttk.Label(voice_frame, text=f"当前音量: {int(voice_volume.get() * 100)}%")
-        voice_label.pack(anchor=tk.W)
-        
-        voice_scale = ttk.Scale(
-            voice_frame,
-            from_=0.0,
-            to=1.0,
-            variable=voice_volume,
-            orient=tk.HORIZONTAL,
-            command=lambda value: voice_label.config(text=f"当前音量: {int(float(value) * 100)}%")
+
+        # 标题
+        title_label = ttk.Label(
+            main_frame,
+            text="音量控制",
+            font=("Microsoft YaHei UI", 12, "bold")
         )
-        voice_scale.pack(fill=tk.X, pady=(5, 0))
-        
+        title_label.pack(pady=(0, 15))
+
+        # 每个音量项一行：标签、滑块、数值
+        volume_vars = []
+        for title, key, default, _ in specs:
+            frame = ttk.LabelFrame(main_frame, text=title, padding="10")
+            frame.pack(fill=tk.X, pady=(0, 10))
+
+            ttk.Label(frame, text="音量:").pack(side=tk.LEFT, padx=(0, 10))
+
+            volume_var = tk.IntVar(value=self._get_config_value(key, default))
+            slider = ttk.Scale(
+                frame,
+                from_=0,
+                to=100,
+                orient=tk.HORIZONTAL,
+                variable=volume_var,
+                length=150
+            )
+            slider.pack(side=tk.LEFT, padx=(0, 10))
+
+            ttk.Label(frame, textvariable=volume_var).pack(side=tk.LEFT)
+
+            if key == focus_key:
+                slider.focus_set()
+            volume_vars.append(volume_var)
+
         # 按钮框架
-        print(f"🔧 调试: 创建按钮框架")
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(15, 0))
-        print(f"🔧 调试: 按钮框架已创建并打包")
-        
+
         # 保存按钮
-        def save_volume_config():
+        def save_volumes():
+            volumes = [volume_var.get() for volume_var in volume_vars]
+
             # 保存配置
-            update_config(
-                music_volume=music_volume.get(),
-                voice_volume=voice_volume.get()
-            )
-            
-            # 应用音乐音量
-            if hasattr(self.app, 'music_controller') and self.app.music_controller:
-                self.app.music_controller.set_volume(music_volume.get())
-            
-            # 应用语音音量
-            if hasattr(self.app, 'voice_assistant') and self.app.voice_assistant:
-                self.app.voice_assistant.set_voice_volume(voice_volume.get())
-            
+            update_config(**{key: volume for (_, key, _, _), volume in zip(specs, volumes)})
+
+            # 应用到各个模块
+            for (_, _, _, apply), volume in zip(specs, volumes):
+                apply(volume)
+
             # 更新托盘菜单
-            if self.icon:
-                self.icon.menu = self.build_menu()
-            
+            self.refresh_menu()
+
             # 显示保存成功提示
-            from tkinter import messagebox
-            messagebox.showinfo("音量设置", "音量配置已保存并应用！")
-            
+            messagebox.showinfo(
+                "音量控制",
+                "\n".join(f"{title}: {volume}" for (title, _, _, _), volume in zip(specs, volumes)),
+            )
+
             # 关闭对话框
             dialog.destroy()
-        
-        save_button = ttk.Button(button_frame, text="保存", command=save_volume_config)
+
+        save_button = ttk.Button(button_frame, text="保存", command=save_volumes)
         save_button.pack(side=tk.RIGHT)
-        
+
         # 取消按钮
-        print(f"🔧 调试: 创建取消按钮")
         cancel_button = ttk.Button(button_frame, text="取消", command=dialog.destroy)
         cancel_button.pack(side=tk.RIGHT, padx=(0, 10))
-        print(f"🔧 调试: 取消按钮已创建并打包")
-        
-        # 如果指定了音量类型，则直接跳转到相应设置
-        if volume_type == "music":
-            music_scale.focus_set()
-        elif volume_type == "voice":
-            voice_scale.focus_set()
-        
-        # 设置窗口模态
-        dialog.transient(dialog.master)
-        dialog.grab_set()
+
+        # 按内容尺寸居中显示
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() - dialog.winfo_reqwidth()) // 2
+        y = (dialog.winfo_screenheight() - dialog.winfo_reqheight()) // 2
+        dialog.geometry(f"+{x}+{y}")
+
+        # 显示对话框
+        try:
+            dialog.transient(self.app.root)
+            dialog.grab_set()
+        except tk.TclError as e:
+            print(f"显示音量控制对话框时出错: {e}")
         dialog.wait_window()
 
     def _create_voice_menu(self) -> pystray.Menu:
         """创建语音助手子菜单"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        voice_enabled = config.get("voice_enabled", False)
-        voice_wakeup_enabled = config.get("voice_wakeup_enabled", False)
-        voice_asr_enabled = config.get("voice_asr_enabled", False)
-        voice_tts_enabled = config.get("voice_tts_enabled", False)
-        
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
                 "启用语音功能",
                 self._toggle_voice,
-                checked=lambda item: voice_enabled,
+                checked=self._is_voice_enabled,
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
                 "语音唤醒",
-                self._toggle_voice_wakeup,
-                checked=lambda item: voice_wakeup_enabled,
-                enabled=lambda item: voice_enabled,
+                self._on_config_toggle,
+                checked=lambda item: self._get_config_value("voice_wakeup_enabled"),
+                enabled=self._is_voice_enabled,
             ),
             pystray.MenuItem(
                 "语音识别",
-                self._toggle_voice_asr,
-                checked=lambda item: voice_asr_enabled,
-                enabled=lambda item: voice_enabled,
+                self._on_config_toggle,
+                checked=lambda item: self._get_config_value("voice_asr_enabled"),
+                enabled=self._is_voice_enabled,
             ),
             pystray.MenuItem(
                 "语音合成",
-                self._toggle_voice_tts,
-                checked=lambda item: voice_tts_enabled,
-                enabled=lambda item: voice_enabled,
+                self._on_config_toggle,
+                checked=lambda item: self._get_config_value("voice_tts_enabled"),
+                enabled=self._is_voice_enabled,
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
                 "开始语音识别",
                 lambda icon, item: self.app.start_voice_recognition(),
-                enabled=lambda item: voice_enabled and voice_asr_enabled and self.app.is_voice_assistant_available(),
+                enabled=lambda item: self._is_voice_asr_ready() and self.app.is_voice_assistant_available(),
             ),
             pystray.MenuItem(
                 "停止语音识别",
                 lambda icon, item: self.app.stop_voice_recognition(),
-                enabled=lambda item: voice_enabled and voice_asr_enabled and self.app.is_voice_assistant_running(),
+                enabled=lambda item: self._is_voice_asr_ready() and self.app.is_voice_assistant_running(),
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
@@ -487,60 +521,46 @@ class TrayController:
             ),
         )
     
+    def _is_voice_enabled(self, item=None) -> bool:
+        """语音功能是否启用（菜单显示时实时读取配置）"""
+        return self._get_config_value("voice_enabled")
+
+    def _is_voice_asr_ready(self) -> bool:
+        """语音功能与语音识别是否均已启用"""
+        return self._is_voice_enabled() and self._get_config_value("voice_asr_enabled")
+
+    def _toggle_config_bool(self, key: str) -> bool:
+        """翻转布尔配置项并刷新菜单
+
+        Args:
+            key: 配置键名
+
+        Returns:
+            翻转后的值
+        """
+        enabled = not self._get_config_value(key)
+        update_config(**{key: enabled})
+        self.refresh_menu()
+        return enabled
+
+    def _on_config_toggle(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
+        """_CONFIG_TOGGLES 中各开关的菜单回调"""
+        self._toggle_config_bool(self._CONFIG_TOGGLES[item.text])
+
     def _toggle_voice(self, icon: pystray.Icon) -> None:
         """切换语音功能"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        current = config.get("voice_enabled", False)
-        update_config(voice_enabled=not current)
-        
-        # 如果启用了语音功能，尝试启动语音助手
-        if not current and hasattr(self.app, 'voice_assistant'):
+        # 启用时启动语音助手，禁用时停止
+        if self._toggle_config_bool("voice_enabled"):
             self.app.voice_assistant.start()
-        # 如果禁用了语音功能，停止语音助手
-        elif current and hasattr(self.app, 'voice_assistant'):
-            self.app.voice_assistant.stop()
-            
-        icon.menu = self.build_menu()
-    
-    def _toggle_voice_wakeup(self, icon: pystray.Icon) -> None:
-        """切换语音唤醒功能"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        current = config.get("voice_wakeup_enabled", False)
-        update_config(voice_wakeup_enabled=not current)
-        icon.menu = self.build_menu()
-    
-    def _toggle_voice_asr(self, icon: pystray.Icon) -> None:
-        """切换语音识别功能"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        current = config.get("voice_asr_enabled", False)
-        update_config(voice_asr_enabled=not current)
-        icon.menu = self.build_menu()
-    
-    def _toggle_voice_tts(self, icon: pystray.Icon) -> None:
-        """切换语音合成功能"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        current = config.get("voice_tts_enabled", False)
-        update_config(voice_tts_enabled=not current)
-        icon.menu = self.build_menu()
+        elif self.app._voice_assistant:
+            self.app._voice_assistant.stop()
     
     def _get_current_personality(self) -> str:
         """获取当前人设"""
-        from src.config import load_config
-        config = load_config()
-        return config.get("ai_personality", "aemeath")
+        return self._get_config_value("ai_personality", "aemeath")
     
     def _set_personality(self, personality: str) -> None:
         """设置人设"""
-        from src.config import update_config
-        
         # 更新配置
         update_config(ai_personality=personality)
         
@@ -556,64 +576,38 @@ class TrayController:
         
         personality_name = personality_names.get(personality, personality)
         
-        import tkinter as tk
-        from tkinter import messagebox
-        
-        root = tk.Tk()
-        root.withdraw()
         messagebox.showinfo(
             "人设切换",
             f"已切换至: {personality_name}\n\n\n下次对话将使用新人设~",
+            parent=self.app.root,
         )
-        root.destroy()
     
-    def _get_config_value(self, key: str, default: bool = False) -> bool:
-        """获取配置值"""
-        from src.config import load_config
-        config = load_config()
-        return config.get(key, default)
+    def _get_config_value(self, key: str, default: Any = False) -> Any:
+        """获取配置值（读取 src.config 的内存缓存，不触发磁盘读取或整份复制）"""
+        return get_config_value(key, default)
     
     def _toggle_system_commands(self) -> None:
         """切换系统命令功能"""
-        from src.config import update_config
-        
-        current = self._get_config_value("system_commands_enabled", False)
-        update_config(system_commands_enabled=not current)
-        self.icon.menu = self.build_menu()
-        
+        enabled = self._toggle_config_bool("system_commands_enabled")
+
         # 显示提示
-        status = "已启用" if not current else "已禁用"
+        status = "已启用" if enabled else "已禁用"
         self._show_notification(f"系统命令功能{status}")
     
     def _toggle_llm_assistance(self) -> None:
         """切换LLM辅助命令解析功能"""
-        from src.config import update_config
-        
-        current = self._get_config_value("llm_command_assistance_enabled", False)
-        update_config(llm_command_assistance_enabled=not current)
-        self.icon.menu = self.build_menu()
-        
+        enabled = self._toggle_config_bool("llm_command_assistance_enabled")
+
         # 显示提示
-        status = "已启用" if not current else "已禁用"
+        status = "已启用" if enabled else "已禁用"
         self._show_notification(f"LLM辅助命令解析{status}")
     
     def _show_notification(self, message: str) -> None:
         """显示通知"""
-        import tkinter as tk
-        from tkinter import messagebox
-        
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showinfo("设置", message)
-        root.destroy()
+        messagebox.showinfo("设置", message, parent=self.app.root)
     
     def _show_voice_help(self) -> None:
         """显示语音助手使用说明"""
-        import tkinter as tk
-        from tkinter import messagebox
-
-        root = tk.Tk()
-        root.withdraw()
         messagebox.showinfo(
             "语音助手使用说明",
             "语音唤醒：\n"
@@ -628,156 +622,17 @@ class TrayController:
             "1. 启用语音合成功能\n"
             "2. AI回复会以语音形式播放\n\n"
             "注意：需要先配置相关API密钥和模型文件",
+            parent=self.app.root,
         )
-        root.destroy()
-    
-    def _show_volume_control_dialog(self) -> None:
-        """显示统一的音量控制对话框"""
-        import tkinter as tk
-        from tkinter import ttk, messagebox
-        from src.config import load_config, update_config
-        
-        # 创建对话框窗口
-        dialog = tk.Toplevel()
-        dialog.title("音量控制")
-        dialog.geometry("350x330")  # 增加宽度和高度以容纳两个音量控制
-        dialog.resizable(False, False)
-        
-        # 设置窗口居中
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-        
-        # 加载当前配置
-        config = load_config()
-        current_tts_volume = config.get("tts_volume", 50)
-        current_music_volume = config.get("music_volume", 70)
-        
-        tts_volume_var = tk.IntVar(value=current_tts_volume)
-        music_volume_var = tk.IntVar(value=current_music_volume)
-        
-        # 创建主框架
-        main_frame = ttk.Frame(dialog, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # 标题
-        title_label = ttk.Label(
-            main_frame,
-            text="音量控制",
-            font=("Microsoft YaHei UI", 12, "bold")
-        )
-        title_label.pack(pady=(0, 15))
-        
-        # TTS音量控制框架
-        tts_frame = ttk.LabelFrame(main_frame, text="TTS音量", padding="10")
-        tts_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # TTS音量标签
-        tts_label = ttk.Label(tts_frame, text="音量:")
-        tts_label.pack(side=tk.LEFT, padx=(0, 10))
-        
-        # TTS音量滑块
-        tts_slider = ttk.Scale(
-            tts_frame,
-            from_=0,
-            to=100,
-            orient=tk.HORIZONTAL,
-            variable=tts_volume_var,
-            length=150
-        )
-        tts_slider.pack(side=tk.LEFT, padx=(0, 10))
-        
-        # TTS音量值显示
-        tts_value_label = ttk.Label(tts_frame, textvariable=tts_volume_var)
-        tts_value_label.pack(side=tk.LEFT)
-        
-        # 音乐音量控制框架
-        music_frame = ttk.LabelFrame(main_frame, text="音乐音量", padding="10")
-        music_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        # 音乐音量标签
-        music_label = ttk.Label(music_frame, text="音量:")
-        music_label.pack(side=tk.LEFT, padx=(0, 10))
-        
-        # 音乐音量滑块
-        music_slider = ttk.Scale(
-            music_frame,
-            from_=0,
-            to=100,
-            orient=tk.HORIZONTAL,
-            variable=music_volume_var,
-            length=150
-        )
-        music_slider.pack(side=tk.LEFT, padx=(0, 10))
-        
-        # 音乐音量值显示
-        music_value_label = ttk.Label(music_frame, textvariable=music_volume_var)
-        music_value_label.pack(side=tk.LEFT)
-        
-        # 按钮框架
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(15, 0))
-        
-        # 保存按钮
-        def save_volumes():
-            new_tts_volume = tts_volume_var.get()
-            new_music_volume = music_volume_var.get()
-            
-            print(f"🔧 调试: 保存TTS音量为 {new_tts_volume}, 音乐音量为 {new_music_volume}")
-            
-            # 保存配置
-            update_config(tts_volume=new_tts_volume, music_volume=new_music_volume)
-            print(f"🔧 调试: 音量配置已保存到配置文件")
-            
-            # 应用到语音助手
-            if hasattr(self.app, 'voice_assistant') and self.app.voice_assistant:
-                print(f"🔧 调试: 应用TTS音量到语音助手")
-                self.app.voice_assistant.set_tts_volume(new_tts_volume)
-            
-            # 应用到音乐控制器
-            if hasattr(self.app, 'music') and self.app.music:
-                print(f"🔧 调试: 应用音乐音量到音乐控制器")
-                self.app.music.set_volume(new_music_volume)
-            
-            # 显示保存成功提示
-            messagebox.showinfo("音量控制", f"TTS音量: {new_tts_volume}\n音乐音量: {new_music_volume}")
-            
-            # 关闭对话框
-            dialog.destroy()
-        
-        save_button = ttk.Button(button_frame, text="保存", command=save_volumes)
-        save_button.pack(side=tk.RIGHT)
-        
-        # 取消按钮
-        cancel_button = ttk.Button(button_frame, text="取消", command=dialog.destroy)
-        cancel_button.pack(side=tk.RIGHT, padx=(0, 10))
-        
-        # 显示对话框
-        print(f"🔧 调试: 显示音量控制对话框")
-        try:
-            dialog.transient(self.app.root)
-            dialog.grab_set()
-            dialog.wait_window()
-            print(f"🔧 调试: 音量控制对话框已关闭")
-        except Exception as e:
-            print(f"🔧 调试: 显示音量控制对话框时出错: {e}")
-            dialog.wait_window()
-    
-
     
     def _create_translate_menu(self) -> pystray.Menu:
         """创建翻译助手子菜单"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        translate_enabled = config.get("translate_enabled", False)
-
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
                 "开启/关闭翻译",
-                self._toggle_translate,
-                checked=lambda item: translate_enabled,
+                self._on_config_toggle,
+                checked=lambda item: self._get_config_value("translate_enabled"),
             ),
             pystray.MenuItem(
                 "手动翻译",
@@ -790,53 +645,28 @@ class TrayController:
             ),
         )
 
-    def _toggle_translate(self, icon: pystray.Icon) -> None:
-        """切换翻译功能"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        current = config.get("translate_enabled", False)
-        update_config(translate_enabled=not current)
-        icon.menu = self.build_menu()
-
     def _show_translate_help(self) -> None:
         """显示翻译使用说明"""
-        import tkinter as tk
-        from tkinter import messagebox
-
-        root = tk.Tk()
-        root.withdraw()
         messagebox.showinfo(
             "翻译助手使用说明",
             "1. 选中需要翻译的文字\n"
             "2. 按住 Ctrl 键超过1秒\n"
             "3. 即可弹出翻译窗口\n\n"
             "注意：需要先在AI配置中启用AI功能",
+            parent=self.app.root,
         )
-        root.destroy()
 
     def _create_quick_launch_menu(self) -> pystray.Menu:
         """创建快速启动子菜单"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        quick_enabled = config.get("quick_launch_enabled", False)
-        exe_path = config.get("quick_launch_exe_path", "")
-
-        # 显示路径（截取文件名）
-        if exe_path:
-            display_path = os.path.basename(exe_path)
-        else:
-            display_path = "未设置"
-
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
                 "开启/关闭",
-                self._toggle_quick_launch,
-                checked=lambda item: quick_enabled,
+                self._on_config_toggle,
+                checked=lambda item: self._get_config_value("quick_launch_enabled"),
             ),
             pystray.MenuItem(
-                f"程序: {display_path}",
+                lambda item: f"程序: {self._quick_launch_display_name()}",
                 self._set_quick_launch_path,
             ),
             pystray.Menu.SEPARATOR,
@@ -846,44 +676,26 @@ class TrayController:
             ),
         )
 
-    def _toggle_quick_launch(self, icon: pystray.Icon) -> None:
-        """切换快速启动功能"""
-        from src.config import load_config, update_config
-
-        config = load_config()
-        current = config.get("quick_launch_enabled", False)
-        update_config(quick_launch_enabled=not current)
-        icon.menu = self.build_menu()
+    def _quick_launch_display_name(self) -> str:
+        """快速启动程序的显示名称（截取文件名）"""
+        exe_path = self._get_config_value("quick_launch_exe_path", "")
+        # 文件对话框返回正斜杠路径，手工编辑的配置可能使用反斜杠，统一后取最后一段
+        return exe_path.replace("\\", "/").rpartition("/")[2] if exe_path else "未设置"
 
     def _set_quick_launch_path(self, icon: pystray.Icon, item) -> None:
         """设置快速启动的程序路径"""
-        import tkinter as tk
-        from tkinter import filedialog
-
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes("-topmost", True)
-
         file_path = filedialog.askopenfilename(
+            parent=self.app.root,
             title="选择要启动的程序",
             filetypes=[("可执行文件", "*.exe"), ("所有文件", "*.*")],
         )
 
-        root.destroy()
-
         if file_path:
-            from src.config import update_config
-
             update_config(quick_launch_exe_path=file_path)
-            icon.menu = self.build_menu()
+            self.refresh_menu()
 
     def _show_quick_launch_help(self) -> None:
         """显示快速启动使用说明"""
-        import tkinter as tk
-        from tkinter import messagebox
-
-        root = tk.Tk()
-        root.withdraw()
         messagebox.showinfo(
             "快速启动使用说明",
             "快速启动程序：\n"
@@ -892,14 +704,15 @@ class TrayController:
             "3. 在宠物上快速点击5次（2秒内）\n"
             "4. 即可启动设定的程序\n\n"
             "提示：点击太快可能导致触发失败",
+            parent=self.app.root,
         )
-        root.destroy()
 
     def build_menu(self) -> pystray.Menu:
         """构建托盘菜单"""
+        pystray = _pystray()
         return pystray.Menu(
             pystray.MenuItem(
-                "隐藏" if self.app.root.state() == "normal" else "显示",
+                lambda item: "显示" if self.app.root.state() == "withdrawn" else "隐藏",
                 self._toggle_visible,
             ),
             pystray.MenuItem(
@@ -917,7 +730,7 @@ class TrayController:
             pystray.MenuItem("语音助手", self._create_voice_menu()),
             pystray.MenuItem("翻译助手", self._create_translate_menu()),
             pystray.MenuItem("配置", self._create_config_menu()),
-            pystray.MenuItem("音量控制", self._show_volume_control_dialog),
+            pystray.MenuItem("音量控制", lambda icon, item: self._show_volume_dialog()),
             pystray.MenuItem("行为模式", self._create_behavior_mode_menu()),
             pystray.MenuItem("番茄钟", self._create_pomodoro_menu()),
             pystray.MenuItem("缩放", self._create_scale_menu()),
@@ -925,10 +738,22 @@ class TrayController:
             pystray.MenuItem("退出", self._quit),
         )
 
+    def refresh_menu(self) -> None:
+        """让托盘重新读取菜单项的文字/勾选/可用状态
+
+        菜单在 run() 中只构建一次，各菜单项的动态属性均为回调；状态变化后
+        只需通知 pystray 重新查询，无需重建整棵菜单。Win32 后端在 update_menu()
+        时才生成菜单快照，因此状态变化后仍需调用一次。
+        """
+        if self.icon:
+            self.icon.update_menu()
+
     def run(self) -> None:
         """启动托盘图标"""
+        pystray = _pystray()
         icon_image = self._create_icon_image()
-        self.icon = pystray.Icon("desktop_pet", icon_image, "远航星", self.build_menu())
+        self._menu = self.build_menu()
+        self.icon = pystray.Icon("desktop_pet", icon_image, "远航星", self._menu)
         self.icon.run_detached()
 
     def stop(self) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 import tkinter as tk
 from typing import TYPE_CHECKING
 
@@ -12,67 +13,92 @@ if TYPE_CHECKING:
 class AIChatPanel:
     """AI聊天输入框类 - 浮动在桌宠下方"""
 
+    # 流式回复刷新气泡的最小间隔（毫秒）
+    STREAM_FLUSH_MS = 50
+    # 跟随桌宠的位移死区（像素），低于此值不重新布局
+    FOLLOW_DEADBAND_PX = 2
+
     def __init__(self, app: DesktopPet):
         self.app = app
+        # UI管理器在 DesktopPet 构造早期创建，面板按需创建时已存在，缓存引用即可
+        self._ui_manager = getattr(app, "ui_manager", None)
         self.window: tk.Toplevel | None = None
         self._input_entry: tk.Entry | None = None
-        self._position_after_id: str | None = None
+        # 是否正在跟随桌宠（由主窗口 <Configure> 事件驱动，不再轮询）
+        self._following = False
+        self._configure_bound = False
         self._last_pet_pos: tuple[int, int] = (0, 0)
+        # 可见标记，由 show/hide/close 维护
+        self._visible = False
+        # AI 引擎是否支持流式回调（首次发送时检测一次）
+        self._supports_stream: bool | None = None
+        # 流式回复待显示的文本与合并刷新句柄（每 STREAM_FLUSH_MS 最多刷新一次气泡）
+        self._pending_stream_text: str | None = None
+        self._stream_flush_handle: int | None = None
 
     def show(self) -> None:
         """显示输入框"""
         if self.window and self.window.winfo_exists():
             self.window.deiconify()
             self.window.lift()
+            self._visible = True
             self._start_follow()
             if self._input_entry:
                 self._input_entry.focus_set()
             # 通知UI管理器更新布局
-            if hasattr(self.app, 'ui_manager'):
-                self.app.ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
-                self.app.ui_manager.set_component_visibility('ai_chat_panel', True)
+            if self._ui_manager is not None:
+                self._ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
+                self._ui_manager.set_component_visibility('ai_chat_panel', True)
             return
 
         self._create_window()
+        self._visible = True
         self._start_follow()
         # 通知UI管理器更新布局
-        if hasattr(self.app, 'ui_manager'):
-            self.app.ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
-            self.app.ui_manager.set_component_visibility('ai_chat_panel', True)
-            # 立即更新布局
-            self.app.ui_manager.update_layout()
+        if self._ui_manager is not None:
+            self._ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
+            self._ui_manager.set_component_visibility('ai_chat_panel', True)
 
     def hide(self) -> None:
         """隐藏输入框"""
         self._stop_follow()
+        self._visible = False
         if self.window and self.window.winfo_exists():
             self.window.withdraw()
         
         # 通知UI管理器更新布局
-        if hasattr(self.app, 'ui_manager'):
-            self.app.ui_manager.set_component_visibility('ai_chat_panel', False)
+        if self._ui_manager is not None:
+            self._ui_manager.set_component_visibility('ai_chat_panel', False)
 
     def close(self) -> None:
-        """关闭并销毁输入框"""
+        """关闭输入框：仅隐藏窗口，下次 show 直接复用，避免重建全部控件"""
+        self.hide()
+
+    def destroy(self) -> None:
+        """销毁输入框窗口（程序退出时调用）"""
         self._stop_follow()
+        self._cancel_stream_flush()
+        self._visible = False
         if self.window and self.window.winfo_exists():
             self.window.destroy()
         self.window = None
         self._input_entry = None
 
+    def _on_window_destroy(self, event: tk.Event) -> None:
+        """窗口被外部销毁时同步可见标记"""
+        if event.widget is self.window:
+            self._visible = False
+
     def is_visible(self) -> bool:
-        """检查输入框是否可见"""
-        return (
-            self.window is not None
-            and self.window.winfo_exists()
-            and self.window.winfo_viewable()
-        )
+        """检查输入框是否可见（读取缓存的可见标记，winfo_exists 仅作兜底）"""
+        return self._visible and self.window is not None and bool(self.window.winfo_exists())
 
     def _create_window(self) -> None:
         """创建输入框窗口"""
         self.window = tk.Toplevel(self.app.root)
         self.window.overrideredirect(True)
         self.window.attributes("-topmost", True)
+        self.window.bind("<Destroy>", self._on_window_destroy)
 
         # 设置窗口背景（粉色系，与气泡一致）
         bg_color = "#FFD1E8"
@@ -136,17 +162,9 @@ class AIChatPanel:
         close_btn.place(relx=1.0, x=-5, y=2, anchor="ne")
         close_btn.bind("<Button-1>", lambda e: self.app.toggle_ai_chat_panel())
 
-        # 设置窗口大小（紧凑）
-        self.window.geometry("260x45")
-        
-        # 设置初始位置为桌宠右侧
-        initial_x = getattr(self.app, "x", 200) + getattr(self.app, "w", 100) + 10
-        initial_y = getattr(self.app, "y", 200)
-        self.window.geometry(f"260x45+{initial_x}+{initial_y}")
-        
-        # 设置初始位置为桌宠右侧
-        initial_x = getattr(self.app, "x", 200) + getattr(self.app, "w", 100) + 10
-        initial_y = getattr(self.app, "y", 200)
+        # 设置窗口大小（紧凑）与初始位置（桌宠右侧），一次完成
+        initial_x = self.app.x + self.app.w + 10
+        initial_y = self.app.y
         self.window.geometry(f"260x45+{initial_x}+{initial_y}")
 
     def _send_message(self) -> None:
@@ -182,27 +200,52 @@ class AIChatPanel:
             """收到流式token"""
             nonlocal stream_response
             stream_response += token
-            # 实时更新气泡显示
-            self.app.speech_bubble.show(f"AI: {stream_response}", duration=None)
+            # 只记录最新文本，气泡按固定间隔合并刷新
+            self._pending_stream_text = f"AI: {stream_response}"
+            if self._stream_flush_handle is None:
+                self._stream_flush_handle = self.app.scheduler.call_later(
+                    self.STREAM_FLUSH_MS, self._flush_stream
+                )
         
         def on_response(response: str):
             # 在气泡中显示完整AI回复
+            self._cancel_stream_flush()
             self.app.speech_bubble.show(f"AI: {response}", duration=5000)
         
         def on_error(error_msg: str):
             # 在气泡中显示错误
+            self._cancel_stream_flush()
             self.app.speech_bubble.show(f"AI: {error_msg}", duration=4000)
         
         # 检查是否支持流式回复
-        import inspect
-        sig = inspect.signature(self.app.ai_chat.send_message)
-        if 'on_stream_token' in sig.parameters:
+        if self._supports_stream is None:
+            self._detect_stream_support()
+        if self._supports_stream:
             # 支持流式回复
             self.app.ai_chat.send_message(message, on_response, on_error, on_stream_token)
         else:
             # 不支持流式回复，使用普通模式
             self.app.ai_chat.send_message(message, on_response, on_error)
 
+    def _flush_stream(self) -> None:
+        """把累积的流式文本一次性刷新到气泡"""
+        self._stream_flush_handle = None
+        text = self._pending_stream_text
+        self._pending_stream_text = None
+        if text is not None:
+            self.app.speech_bubble.show(text, duration=None)
+
+    def _cancel_stream_flush(self) -> None:
+        """丢弃尚未刷新的流式文本（完整回复或错误到达时调用）"""
+        self.app.scheduler.cancel(self._stream_flush_handle)
+        self._stream_flush_handle = None
+        self._pending_stream_text = None
+
+    def _detect_stream_support(self) -> None:
+        """检测 AI 引擎的 send_message 是否接受 on_stream_token 参数，并缓存结果"""
+        sig = inspect.signature(self.app.ai_chat.send_message)
+        self._supports_stream = 'on_stream_token' in sig.parameters
+
     def _update_position(self) -> None:
         """更新输入框位置到桌宠下方"""
         # 现在使用UI管理器来处理位置，这里不需要做任何事情
@@ -211,35 +254,35 @@ class AIChatPanel:
 
     def _start_follow(self) -> None:
         """开始跟随桌宠移动"""
-        if self._position_after_id:
+        if self._following:
             return  # 已经在跟随了
+        self._following = True
+        self._last_pet_pos = (self.app.x, self.app.y)
+        # 主窗口移动/缩放时 Tk 会产生 <Configure> 事件，据此更新布局。
+        # 绑定只做一次且不解绑：旧版 tkinter 的 unbind(seq, funcid) 会清掉该序列的全部绑定
+        if not self._configure_bound:
+            self.app.root.bind("<Configure>", self._on_root_configure, add="+")
+            self._configure_bound = True
         # 通知UI管理器更新布局
-        if hasattr(self.app, 'ui_manager'):
-            self.app.ui_manager.update_layout()
-        self._follow_loop()
+        if self._ui_manager is not None:
+            self._ui_manager.mark_dirty()
 
-    def _follow_loop(self) -> None:
-        """跟随循环"""
-        if not self.is_visible():
+    def _on_root_configure(self, event: tk.Event) -> None:
+        """主窗口几何变化时，若桌宠位置改变则更新布局"""
+        # 子控件的 <Configure> 也会经由绑定标签传到主窗口，只处理主窗口自身
+        if not self._following or event.widget is not self.app.root:
             return
 
-        # 检查桌宠位置是否变化
-        current_pos = (getattr(self.app, "x", 200), getattr(self.app, "y", 200))
-        if current_pos != self._last_pet_pos:
-            # 通知UI管理器更新布局
-            if hasattr(self.app, 'ui_manager'):
-                self.app.ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
-                self.app.ui_manager.update_layout()
-            self._last_pet_pos = current_pos
-
-        # 继续循环
-        self._position_after_id = self.app.root.after(16, self._follow_loop)  # ~60fps
+        current_pos = (self.app.x, self.app.y)
+        last_x, last_y = self._last_pet_pos
+        # 移动不足死区时跳过，_last_pet_pos 只在真正更新时前移，慢速漂移会累积到阈值
+        if abs(current_pos[0] - last_x) + abs(current_pos[1] - last_y) < self.FOLLOW_DEADBAND_PX:
+            return
+        # 通知UI管理器更新布局
+        if self._ui_manager is not None:
+            self._ui_manager.set_pet_info_and_relayout(self.app.x, self.app.y, self.app.w, self.app.h)
+        self._last_pet_pos = current_pos
 
     def _stop_follow(self) -> None:
         """停止跟随"""
-        if self._position_after_id:
-            try:
-                self.app.root.after_cancel(self._position_after_id)
-            except tk.TclError:
-                pass
-            self._position_after_id = None
\ No newline at end of file
+        self._following = False
\ No newline at end of file
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Optional
+import tkinter.font as tkfont
+from functools import lru_cache
+from typing import Optional, Tuple
 
+from src.config import update_config
 from src.constants import TRANSPARENT_COLOR
 
 
@@ -15,6 +18,9 @@ class MusicPanel:
     - Canvas 绘制胶囊底板、胶囊按钮、进度条
     """
 
+    # 圆角多边形每段曲线的细分数；16px 以内的圆角 12 段与 36 段肉眼无差别
+    _SPLINESTEPS = 12
+
     def __init__(self, app) -> None:
         self.app = app
         self.window: tk.Toplevel | None = None
@@ -53,6 +59,14 @@ class MusicPanel:
         self._volume_slider_x = 40
         self._volume_slider_w = 160
 
+        # 由上面布局推导出的常量，鼠标事件与进度刷新直接使用
+        self._track_x1 = self._pad + 14
+        self._track_x2 = self._w - self._pad - 14
+        self._track_y1 = self._pad + self._track_y
+        self._track_y2 = self._track_y1 + self._track_h
+        self._track_w_inv = 1.0 / (self._track_x2 - self._track_x1)
+        self._volume_w_inv = 1.0 / self._volume_slider_w
+
         # Canvas item ids
         self._pill_id = None
         self._track_bg_id = None
@@ -65,14 +79,32 @@ class MusicPanel:
         self._volume_knob_id = None
         self._volume_icon_id = None
         self._volume_text_id = None
+        # 上一次绘制的动态元素状态，未变化时跳过对应的 coords/itemconfigure 调用
+        self._fill_x2: Optional[int] = None
+        self._time_text: Optional[str] = None
+        self._play_icon: Optional[str] = None
+        self._volume_shown: Optional[int] = None
 
         self._btn_prev = {}
         self._btn_play = {}
         self._btn_next = {}
+        # 按钮命中区域，由画布级事件统一分发（不再为每个按钮 tag_bind）
+        self._btn_regions: list[dict] = []
+        self._hover_btn: Optional[dict] = None
+        self._pressed_btn: Optional[dict] = None
         
         # 音量控制状态
         self._volume_dragging = False
 
+        # 可见标记，由 show/hide 维护
+        self._visible = False
+
+        # 字体对象（需在 Tk 根窗口存在后创建，见 _create_fonts）
+        self._f_btn: Optional[tkfont.Font] = None
+        self._f_small: Optional[tkfont.Font] = None
+        self._f_volume_pct: Optional[tkfont.Font] = None
+        self._f_icon: Optional[tkfont.Font] = None
+
     def show(self) -> None:
         """显示面板"""
         if not self.window or not self.window.winfo_exists():
@@ -81,7 +113,8 @@ class MusicPanel:
         if self.window:
             self.window.deiconify()
             self.window.lift()
-        self._redraw_all()
+            self._visible = True
+        self._update_dynamic()
         self._schedule_progress()
         
         # 确保窗口尺寸已更新
@@ -102,6 +135,7 @@ class MusicPanel:
         if self._progress_after_id:
             self.app.root.after_cancel(self._progress_after_id)
             self._progress_after_id = None
+        self._visible = False
         if self.window and self.window.winfo_exists():
             self.window.withdraw()
         
@@ -109,16 +143,19 @@ class MusicPanel:
         if hasattr(self.app, 'ui_manager'):
             self.app.ui_manager.set_component_visibility('music_panel', False)
 
+    def _on_window_destroy(self, event: tk.Event) -> None:
+        """窗口被外部销毁时同步可见标记"""
+        if event.widget is self.window:
+            self._visible = False
+
     def is_visible(self) -> bool:
-        if not self.window or not self.window.winfo_exists():
-            return False
-        return str(self.window.state()) != "withdrawn"
+        """检查面板是否可见（读取缓存的可见标记，winfo_exists 仅作兜底）"""
+        return self._visible and self.window is not None and bool(self.window.winfo_exists())
 
     def update_position(self) -> None:
-        """更新面板位置：桌宠正下方居中"""
-        # 现在使用UI管理器来处理位置，这里不需要做任何事情
-        # UI管理器会自动计算和设置位置
-        pass
+        """更新面板位置：桌宠正下方居中（由UI管理器在下一个刷新周期统一计算）"""
+        if hasattr(self.app, 'ui_manager'):
+            self.app.ui_manager.mark_dirty()
 
     def _create_window(self) -> None:
         self.window = tk.Toplevel(self.app.root)
@@ -127,6 +164,7 @@ class MusicPanel:
         self.window.config(bg=TRANSPARENT_COLOR)
         self.window.attributes("-transparentcolor", TRANSPARENT_COLOR)
         self.window.attributes("-alpha", 1.0)
+        self.window.bind("<Destroy>", self._on_window_destroy)
 
         self.canvas = tk.Canvas(
             self.window,
@@ -137,16 +175,43 @@ class MusicPanel:
             bd=0,
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self._create_fonts()
 
-        # 进度条交互
+        # 进度条、音量与按钮交互（按钮按坐标命中分发）
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", self._on_leave)
         self.canvas.bind("<ButtonPress-1>", self._on_press)
         self.canvas.bind("<B1-Motion>", self._on_drag)
         self.canvas.bind("<ButtonRelease-1>", self._on_release)
 
+        self._build_all()
+
+    def _create_fonts(self) -> None:
+        """创建一次字体对象，之后所有文本元素复用，避免每次解析字体元组"""
+        if self._f_btn is not None:
+            return
+        family = "Microsoft YaHei UI"
+        self._f_btn = tkfont.Font(family=family, size=11, weight="bold")
+        self._f_small = tkfont.Font(family=family, size=8)
+        self._f_volume_pct = tkfont.Font(family=family, size=9)
+        self._f_icon = tkfont.Font(family=family, size=14)
+
     def _redraw_all(self) -> None:
+        """重建全部画布元素（仅用于窗口重建或主题变化）"""
+        self._build_all()
+
+    def _build_all(self) -> None:
+        """创建全部画布元素；之后的刷新只通过 _update_dynamic 修改动态元素"""
         if not self.canvas:
             return
         self.canvas.delete("all")
+        self._btn_regions = []
+        self._hover_btn = None
+        self._pressed_btn = None
+        self._fill_x2 = None
+        self._time_text = None
+        self._play_icon = None
+        self._volume_shown = None
 
         # 阴影层
         self._draw_rounded_rect(
@@ -174,18 +239,18 @@ class MusicPanel:
             width=1,
         )
 
-        self._draw_progress()
+        self._build_progress()
         self._draw_buttons()
-        self._draw_volume_control()
+        self._build_volume_control()
+        self._update_dynamic()
 
-    def _draw_progress(self) -> None:
+    def _build_progress(self) -> None:
+        """创建进度条元素（填充、旋钮、时间文本的位置由 _update_progress 设置）"""
         if not self.canvas:
             return
 
-        x1 = self._pad + 14
-        x2 = self._w - self._pad - 14
-        y1 = self._pad + self._track_y
-        y2 = y1 + self._track_h
+        x1, x2 = self._track_x1, self._track_x2
+        y1, y2 = self._track_y1, self._track_y2
         r = self._track_h // 2
 
         # track bg
@@ -201,52 +266,93 @@ class MusicPanel:
             width=1,
         )
 
-        pos = self.app.get_music_position() if self.app.is_music_playing() else 0.0
-        total = self.app.get_music_length() if self.app.is_music_playing() else 0.0
-        progress = 0.0 if total <= 0 else max(0.0, min(1.0, pos / total))
-        fill_x2 = int(x1 + (x2 - x1) * progress)
-
-        if fill_x2 > x1 + r:
-            self._track_fill_id = self._draw_rounded_rect(
-                self.canvas,
-                x1,
-                y1,
-                fill_x2,
-                y2,
-                radius=r,
-                fill=self._accent,
-                outline="",
-                width=0,
-            )
+        # fill：用圆头粗线代替平滑多边形，更新时只改两个端点，无需重新细分曲线
+        cy = (y1 + y2) // 2
+        self._track_fill_id = self.canvas.create_line(
+            x1 + r,
+            cy,
+            x2 - r,
+            cy,
+            fill=self._accent,
+            width=self._track_h,
+            capstyle=tk.ROUND,
+        )
 
         # knob
-        knob_r = 7
-        knob_x = int(x1 + (x2 - x1) * progress)
-        knob_y = (y1 + y2) // 2
         self._knob_id = self.canvas.create_oval(
-            knob_x - knob_r,
-            knob_y - knob_r,
-            knob_x + knob_r,
-            knob_y + knob_r,
+            0, 0, 0, 0,
             fill="#FFFFFF",
             outline=self._accent2,
             width=2,
         )
 
         # time text (small)
-        if total > 0:
-            text = f"{self._fmt(pos)} / {self._fmt(total)}"
-        else:
-            text = "--:-- / --:--"
         self._time_id = self.canvas.create_text(
             self._w - self._pad - 18,
             self._pad + 10,
-            text=text,
+            text="--:-- / --:--",
             fill=self._muted,
-            font=("Microsoft YaHei UI", 8),
+            font=self._f_small,
             anchor="ne",
         )
 
+    def _update_dynamic(self) -> None:
+        """只更新随播放状态变化的元素：进度、播放图标、音量"""
+        if not self.canvas:
+            return
+        self._update_progress()
+        self._update_play_icon()
+        self._update_volume_control()
+
+    def _update_progress(self) -> None:
+        """更新进度条填充、旋钮位置与时间文本"""
+        canvas = self.canvas
+        x1, x2 = self._track_x1, self._track_x2
+        y1, y2 = self._track_y1, self._track_y2
+        r = self._track_h // 2
+
+        playing = self.app.is_music_playing()
+        pos = self.app.get_music_position() if playing else 0.0
+        total = self.app.get_music_length() if playing else 0.0
+        progress = 0.0 if total <= 0 else max(0.0, min(1.0, pos / total))
+        fill_x2 = int(x1 + (x2 - x1) * progress)
+
+        if fill_x2 != self._fill_x2:
+            self._fill_x2 = fill_x2
+            knob_y = (y1 + y2) // 2
+            if fill_x2 > x1 + r:
+                canvas.coords(self._track_fill_id, x1 + r, knob_y, max(x1 + r, fill_x2 - r), knob_y)
+                canvas.itemconfigure(self._track_fill_id, state="normal")
+            else:
+                canvas.itemconfigure(self._track_fill_id, state="hidden")
+
+            knob_r = 7
+            canvas.coords(
+                self._knob_id,
+                fill_x2 - knob_r,
+                knob_y - knob_r,
+                fill_x2 + knob_r,
+                knob_y + knob_r,
+            )
+
+        if total > 0:
+            text = f"{self._fmt(pos)} / {self._fmt(total)}"
+        else:
+            text = "--:-- / --:--"
+        if text != self._time_text:
+            self._time_text = text
+            canvas.itemconfigure(self._time_id, text=text)
+
+    def _update_play_icon(self) -> None:
+        """根据暂停状态切换播放按钮图标"""
+        text_id = self._btn_play.get("text")
+        if not text_id:
+            return
+        icon = "▶" if self.app.is_music_paused() else "⏸"
+        if icon != self._play_icon:
+            self._play_icon = icon
+            self.canvas.itemconfigure(text_id, text=icon)
+
     def _draw_buttons(self) -> None:
         if not self.canvas:
             return
@@ -269,11 +375,10 @@ class MusicPanel:
             icon_color=self._muted,
         )
 
-        play_text = "▶" if self.app.is_music_paused() else "⏸"
         self._btn_play = self._draw_icon_button(
             cx=play_cx,
             cy=cy,
-            text=play_text,
+            text="⏸",
             command=self._toggle_play,
             kind="play",
             icon_color=self._text,
@@ -341,37 +446,49 @@ class MusicPanel:
             cy,
             text=text,
             fill=icon_color,
-            font=("Microsoft YaHei UI", 11, "bold"),
+            font=self._f_btn,
         )
 
         self.canvas.addtag_withtag(tag, hi_id)
         self.canvas.addtag_withtag(tag, hit_id)
         self.canvas.addtag_withtag(tag, txt_id)
 
-        self.canvas.tag_bind(
-            tag,
-            "<Enter>",
-            lambda e, b={"hi": hi_id, "hover": hover_fill}: self._btn_hover(b, True),
-        )
-        self.canvas.tag_bind(
-            tag,
-            "<Leave>",
-            lambda e, b={"hi": hi_id, "hover": hover_fill}: self._btn_hover(b, False),
-        )
-        self.canvas.tag_bind(
-            tag,
-            "<ButtonPress-1>",
-            lambda e, b={"hi": hi_id, "pressed": pressed_fill}: self._btn_press(b),
-        )
-        self.canvas.tag_bind(
-            tag,
-            "<ButtonRelease-1>",
-            lambda e,
-            b={"hi": hi_id, "hover": hover_fill},
-            cb=command: self._btn_release(b, cb),
-        )
+        btn = {
+            "tag": tag,
+            "hi": hi_id,
+            "hit": hit_id,
+            "text": txt_id,
+            "box": (cx - radius, cy - radius, cx + radius, cy + radius),
+            "hover": hover_fill,
+            "pressed": pressed_fill,
+            "command": command,
+        }
+        self._btn_regions.append(btn)
+        return btn
+
+    def _btn_at(self, x: int, y: int) -> Optional[dict]:
+        """返回坐标所在的按钮（线性扫描，仅 3 个按钮）"""
+        for btn in self._btn_regions:
+            x1, y1, x2, y2 = btn["box"]
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return btn
+        return None
+
+    def _on_motion(self, event) -> None:
+        """画布级悬浮分发：仅在悬浮按钮变化时更新高亮"""
+        btn = self._btn_at(event.x, event.y)
+        if btn is self._hover_btn:
+            return
+        if self._hover_btn is not None:
+            self._btn_hover(self._hover_btn, False)
+        self._hover_btn = btn
+        if btn is not None:
+            self._btn_hover(btn, True)
 
-        return {"tag": tag, "hi": hi_id, "hit": hit_id, "text": txt_id}
+    def _on_leave(self, event) -> None:
+        if self._hover_btn is not None:
+            self._btn_hover(self._hover_btn, False)
+            self._hover_btn = None
 
     def _btn_hover(self, btn: dict, on: bool) -> None:
         if not self.canvas:
@@ -403,22 +520,26 @@ class MusicPanel:
             return
         hi_id = btn.get("hi")
         if hi_id:
-            # keep a soft hover after release, then redraw will reset anyway
+            # keep a soft hover after release; moving off the button hides it
             self.canvas.itemconfigure(
                 hi_id, fill=btn.get("hover", self._hover), state="normal"
             )
         cb()
-        self._redraw_all()
+        self._update_play_icon()
 
     def _on_press(self, event) -> None:
-        print(f"🔧 调试: _on_press被调用，点击位置({event.x}, {event.y})")
         if not self.canvas:
-            print(f"🔧 调试: canvas不存在，返回")
+            return
+
+        # 检查是否按下播放控制按钮
+        btn = self._btn_at(event.x, event.y)
+        if btn is not None:
+            self._pressed_btn = btn
+            self._btn_press(btn)
             return
         
         # 检查是否点击音量控制区域
         if self._is_in_volume_slider(event.x, event.y):
-            print(f"🔧 调试: 点击在音量滑块区域内，开始拖动")
             self._volume_dragging = True
             self._set_volume_by_x(event.x)
             return
@@ -440,26 +561,33 @@ class MusicPanel:
         self._seek_by_x(event.x)
 
     def _on_release(self, event) -> None:
+        btn = self._pressed_btn
+        if btn is not None:
+            self._pressed_btn = None
+            if self._btn_at(event.x, event.y) is btn:
+                self._btn_release(btn, btn["command"])
+            elif self.canvas:
+                self.canvas.itemconfigure(btn["hi"], state="hidden")
+                self._hover_btn = None
+            return
         self._dragging = False
-        self._volume_dragging = False
+        if self._volume_dragging:
+            self._volume_dragging = False
+            # 拖动过程中只应用音量，松开时保存一次
+            update_config(music_volume=self.app.get_music_volume())
 
     def _is_in_track(self, x: int, y: int) -> bool:
-        x1 = self._pad + 14
-        x2 = self._w - self._pad - 14
-        y1 = self._pad + self._track_y
-        y2 = y1 + self._track_h
+        x1, x2 = self._track_x1, self._track_x2
+        y1, y2 = self._track_y1, self._track_y2
         return x1 <= x <= x2 and (y1 - 8) <= y <= (y2 + 8)
 
     def _seek_by_x(self, x: int) -> None:
-        x1 = self._pad + 14
-        x2 = self._w - self._pad - 14
         total = self.app.get_music_length()
         if total <= 0:
             return
-        ratio = (x - x1) / max(1, (x2 - x1))
-        ratio = max(0.0, min(1.0, ratio))
+        ratio = min(1.0, max(0.0, (x - self._track_x1) * self._track_w_inv))
         self.app.seek_music(total * ratio)
-        self._redraw_all()
+        self._update_progress()
     
     def _is_in_volume_slider(self, x: int, y: int) -> bool:
         """检查点击位置是否在音量滑块区域内"""
@@ -467,41 +595,26 @@ class MusicPanel:
         y2 = y1 + self._volume_h + 10
         x1 = self._volume_slider_x - 5
         x2 = x1 + self._volume_slider_w + 10
-        result = x1 <= x <= x2 and y1 <= y <= y2
-        print(f"🔧 调试: 检查点击位置({x}, {y})是否在音量滑块区域内: {result}")
-        return result
+        return x1 <= x <= x2 and y1 <= y <= y2
     
     def _set_volume_by_x(self, x: int) -> None:
         """根据x坐标设置音量"""
-        x1 = self._volume_slider_x
-        x2 = x1 + self._volume_slider_w
-        ratio = (x - x1) / max(1, (x2 - x1))
-        ratio = max(0.0, min(1.0, ratio))
+        ratio = min(1.0, max(0.0, (x - self._volume_slider_x) * self._volume_w_inv))
         volume = int(ratio * 100)
+        if volume == self.app.get_music_volume():
+            return
         
-        print(f"🔧 调试: 音乐面板设置音量为 {volume}")
-        
-        # 直接保存到配置文件，类似于TTS音量设置
-        from src.config import update_config
-        print(f"🔧 调试: 准备保存音乐音量到配置文件")
-        update_config(music_volume=volume)
-        print(f"🔧 调试: 音乐音量已保存到配置文件")
+        # 设置音量（仅内存中生效，松开鼠标时由 _on_release 保存）
+        self.app.set_music_volume(volume, persist=False)
         
-        # 设置音量
-        if hasattr(self.app, 'set_music_volume'):
-            print(f"🔧 调试: 调用app.set_music_volume({volume})")
-            self.app.set_music_volume(volume)
-        else:
-            print(f"🔧 调试: app没有set_music_volume方法")
-        
-        # 重绘音量控制
-        self._redraw_all()
+        # 更新音量控制
+        self._update_volume_control()
 
     def _schedule_progress(self) -> None:
         if not self.window or not self.window.winfo_exists():
             return
-        if self.is_visible() and self.app.is_music_playing() and not self._dragging:
-            self._redraw_all()
+        if self._visible and self.app.is_music_playing() and not self._dragging:
+            self._update_dynamic()
         self._progress_after_id = self.app.root.after(300, self._schedule_progress)
 
     def _prev(self) -> None:
@@ -519,23 +632,18 @@ class MusicPanel:
         s = seconds % 60
         return f"{m:02d}:{s:02d}"
 
-    def _draw_volume_control(self) -> None:
-        """绘制音量控制"""
+    def _build_volume_control(self) -> None:
+        """创建音量控制元素（填充、旋钮、百分比的位置由 _update_volume_control 设置）"""
         if not self.canvas:
             return
-        
-        # 获取当前音量
-        current_volume = self.app.get_music_volume() if hasattr(self.app, 'get_music_volume') else 70
-        volume_ratio = current_volume / 100.0
-        
+
         # 音量图标
-        icon_size = 14
         icon_y = self._pad + self._volume_y
         self._volume_icon_id = self.canvas.create_text(
             self._volume_icon_x,
             icon_y,
             text="🔊",
-            font=("Microsoft YaHei UI", icon_size),
+            font=self._f_icon,
             fill=self._text
         )
         
@@ -553,24 +661,16 @@ class MusicPanel:
         )
         
         # 音量滑块填充
-        fill_x2 = x1 + int(self._volume_slider_w * volume_ratio)
-        if fill_x2 > x1:
-            self._volume_fill_id = self.canvas.create_rectangle(
-                x1, y1, fill_x2, y2,
-                fill=self._accent2,
-                outline="",
-                width=0
-            )
+        self._volume_fill_id = self.canvas.create_rectangle(
+            x1, y1, x2, y2,
+            fill=self._accent2,
+            outline="",
+            width=0
+        )
         
         # 音量滑块旋钮
-        knob_x = x1 + int(self._volume_slider_w * volume_ratio)
-        knob_y = (y1 + y2) // 2
-        knob_r = 6
         self._volume_knob_id = self.canvas.create_oval(
-            knob_x - knob_r,
-            knob_y - knob_r,
-            knob_x + knob_r,
-            knob_y + knob_r,
+            0, 0, 0, 0,
             fill="#FFFFFF",
             outline=self._accent2,
             width=2
@@ -580,11 +680,42 @@ class MusicPanel:
         self._volume_text_id = self.canvas.create_text(
             self._w - self._volume_icon_x,
             icon_y,
-            text=f"{current_volume}%",
+            text="",
             fill=self._muted,
-            font=("Microsoft YaHei UI", 9),
+            font=self._f_volume_pct,
             anchor="e"
         )
+
+    def _update_volume_control(self) -> None:
+        """更新音量填充、旋钮位置与百分比文本"""
+        canvas = self.canvas
+        current_volume = self.app.get_music_volume() if hasattr(self.app, 'get_music_volume') else 70
+        if current_volume == self._volume_shown:
+            return
+        self._volume_shown = current_volume
+        volume_ratio = current_volume / 100.0
+
+        y1 = self._pad + self._volume_y - self._volume_h // 2
+        y2 = y1 + self._volume_h
+        x1 = self._volume_slider_x
+        fill_x2 = x1 + int(self._volume_slider_w * volume_ratio)
+
+        if fill_x2 > x1:
+            canvas.coords(self._volume_fill_id, x1, y1, fill_x2, y2)
+            canvas.itemconfigure(self._volume_fill_id, state="normal")
+        else:
+            canvas.itemconfigure(self._volume_fill_id, state="hidden")
+
+        knob_y = (y1 + y2) // 2
+        knob_r = 6
+        canvas.coords(
+            self._volume_knob_id,
+            fill_x2 - knob_r,
+            knob_y - knob_r,
+            fill_x2 + knob_r,
+            knob_y + knob_r,
+        )
+        canvas.itemconfigure(self._volume_text_id, text=f"{current_volume}%")
     
     def _draw_rounded_rect(
         self,
@@ -605,7 +736,24 @@ class MusicPanel:
                 x1, y1, x2, y2, fill=fill, outline=outline, width=width
             )
 
-        points = [
+        return canvas.create_polygon(
+            self._rounded_rect_points(x1, y1, x2, y2, radius),
+            smooth=True,
+            splinesteps=self._SPLINESTEPS,
+            fill=fill,
+            outline=outline,
+            width=width,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _rounded_rect_points(x1: int, y1: int, x2: int, y2: int, radius: int) -> Tuple[int, ...]:
+        """圆角矩形平滑多边形的顶点（可直接用于 create_polygon / coords）
+
+        按几何参数缓存：窗口重建时固定形状无需重新计算。
+        """
+        radius = max(0, min(radius, (x2 - x1) // 2, (y2 - y1) // 2))
+        return (
             x1 + radius,
             y1,
             x2 - radius,
@@ -630,12 +778,4 @@ class MusicPanel:
             y1 + radius,
             x1,
             y1,
-        ]
-        return canvas.create_polygon(
-            points,
-            smooth=True,
-            splinesteps=36,
-            fill=fill,
-            outline=outline,
-            width=width,
         )
\ No newline at end of file
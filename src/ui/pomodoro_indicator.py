@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import tkinter as tk
+from functools import lru_cache
+from typing import Tuple
 
 from src.constants import TRANSPARENT_COLOR
 
@@ -10,6 +12,11 @@ from src.constants import TRANSPARENT_COLOR
 class PomodoroIndicator:
     """番茄钟进度条"""
 
+    _RADIUS = 9
+    _FONT = ("Microsoft YaHei UI", 8, "bold")
+    # 圆角多边形每段曲线的细分数，9px 的圆角 8 段已足够平滑
+    _SPLINESTEPS = 8
+
     def __init__(self, app) -> None:
         self.app = app
         self.window: tk.Toplevel | None = None
@@ -18,24 +25,48 @@ class PomodoroIndicator:
         self._offset_y = 0
         self._width = 150
         self._height = 18
+        # 进度填充的最大宽度（左右各留 2px 边距）
+        self._fill_max = self._width - 4
         self._style = {
             "bg": "#FFFFFF",
             "border": "#7BEAF7",
             "track": "#F7A7B6",
             "text": "#2E2A28",
         }
+        # 可见标记，由 show/hide 维护
+        self._visible = False
+        # 画布元素 id，由 _build_items 创建
+        self._bg_id: int | None = None
+        self._fill_id: int | None = None
+        self._text_id: int | None = None
+        self._fill_width = 0
+        # 上一次显示的 (阶段, 分, 秒, 填充宽度)，未变化时跳过重绘
+        self._last_state: tuple | None = None
 
     def show(self) -> None:
-        """显示进度条"""
+        """显示进度条（窗口只在首次显示时创建，之后隐藏/显示复用）"""
         if self.window and self.window.winfo_exists():
             self.window.deiconify()
-            return
+            self._visible = True
+        else:
+            self._create_window()
 
+        # 通知UI管理器更新布局
+        if hasattr(self.app, 'ui_manager'):
+            # 更新宠物信息
+            self.app.ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
+            # 设置组件可见性并更新布局
+            self.app.ui_manager.set_component_visibility('pomodoro_indicator', True)
+
+    def _create_window(self) -> None:
+        """创建进度条窗口与画布元素"""
         self.window = tk.Toplevel(self.app.root)
         self.window.overrideredirect(True)
         self.window.attributes("-topmost", True)
         self.window.config(bg=TRANSPARENT_COLOR)
         self.window.attributes("-transparentcolor", TRANSPARENT_COLOR)
+        self.window.bind("<Destroy>", self._on_window_destroy)
+        self._visible = True
 
         self.canvas = tk.Canvas(
             self.window,
@@ -46,31 +77,24 @@ class PomodoroIndicator:
             bd=0,
         )
         self.canvas.pack()
-        self._redraw(phase="专注", remaining=0, total=1)
-        
-        # 确保窗口尺寸已更新
-        self.window.update_idletasks()
-        
-        # 通知UI管理器更新布局
-        if hasattr(self.app, 'ui_manager'):
-            # 确保主窗口已更新
-            self.app.root.update_idletasks()
-            # 更新宠物信息
-            self.app.ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
-            # 设置组件可见性并更新布局
-            self.app.ui_manager.set_component_visibility('pomodoro_indicator', True)
+        self._build_items()
+        self._redraw("专注 00:00", self._fill_max)
 
     def hide(self) -> None:
-        """隐藏进度条"""
-        if self.window:
-            self.window.destroy()
-            self.window = None
-            self.canvas = None
+        """隐藏进度条（只撤下窗口，保留供下次显示复用）"""
+        self._visible = False
+        if self.window and self.window.winfo_exists():
+            self.window.withdraw()
             
         # 通知UI管理器更新布局
         if hasattr(self.app, 'ui_manager'):
             self.app.ui_manager.set_component_visibility('pomodoro_indicator', False)
 
+    def _on_window_destroy(self, event: tk.Event) -> None:
+        """窗口被外部销毁时同步可见标记"""
+        if event.widget is self.window:
+            self._visible = False
+
     def update_progress(self, phase: str, remaining: int, total: int) -> None:
         """更新进度条
 
@@ -79,148 +103,139 @@ class PomodoroIndicator:
             remaining: 剩余秒数
             total: 阶段总秒数
         """
-        if not self.window or not self.window.winfo_exists():
-            self.show()
-        self._redraw(phase, remaining, total)
-        
-        # 通知UI管理器更新布局，以防音乐状态发生变化
-        if hasattr(self.app, 'ui_manager'):
-            # 确保主窗口已更新
-            self.app.root.update_idletasks()
-            # 更新宠物信息
-            self.app.ui_manager.update_pet_info(self.app.x, self.app.y, self.app.w, self.app.h)
-            # 设置组件可见性并更新布局
-            self.app.ui_manager.set_component_visibility('pomodoro_indicator', True)
+        minutes, seconds = divmod(max(0, remaining), 60)
+        progress = min(1.0, max(0.0, 1 - remaining / total)) if total > 0 else 0.0
+        fill_width = int(self._fill_max * progress)
+        state = (phase, minutes, seconds, fill_width)
+        if self._visible and state == self._last_state:
+            return
 
-    def update_position(self) -> None:
-        """更新进度条位置"""
-        # 现在使用UI管理器来处理位置，这里不需要做任何事情
-        # UI管理器会自动计算和设置位置
-        pass
+        if not self._visible:
+            self.show()
+        self._last_state = state
+        # 只重绘自身；位置由宠物移动与各组件显隐时的布局刷新负责，不必每秒重新布局
+        self._redraw(f"{phase} {minutes:02d}:{seconds:02d}", fill_width)
 
-    def _redraw(self, phase: str, remaining: int, total: int) -> None:
+    def _build_items(self) -> None:
+        """创建全部画布元素；之后 _redraw 只移动进度填充并修改文本"""
         if not self.canvas:
             return
 
         self.canvas.delete("all")
-        radius = 9
-        progress = 0.0 if total <= 0 else max(0.0, min(1.0, 1 - remaining / total))
-        fill_width = int((self._width - 4) * progress)
-
-        self._draw_rounded_rect(
+        self._bg_id = self._draw_rounded_rect(
             1,
             1,
             self._width - 2,
             self._height - 2,
-            radius=radius,
+            radius=self._RADIUS,
             fill=self._style["bg"],
             outline=self._style["border"],
             width=1,
         )
-
-        if fill_width > 0:
-            self._draw_rounded_rect(
-                2,
-                2,
-                2 + fill_width,
-                self._height - 2,
-                radius=radius - 2,
-                fill=self._style["track"],
-                outline="",
-                width=0,
-            )
-
-        minutes = max(0, remaining) // 60
-        seconds = max(0, remaining) % 60
-        text = f"{phase} {minutes:02d}:{seconds:02d}"
-        self.canvas.create_text(
+        # 填充按满宽创建，默认隐藏，之后只修改坐标
+        self._fill_id = self._draw_rounded_rect(
+            2,
+            2,
+            self._width - 2,
+            self._height - 2,
+            radius=self._RADIUS - 2,
+            fill=self._style["track"],
+            outline="",
+            width=0,
+        )
+        self.canvas.itemconfigure(self._fill_id, state="hidden")
+        self._fill_width = 0
+        self._last_state = None
+        self._text_id = self.canvas.create_text(
             self._width // 2,
             self._height // 2,
-            text=text,
+            text="",
             fill=self._style["text"],
-            font=("Microsoft YaHei UI", 8, "bold"),
+            font=self._FONT,
         )
 
-    def _draw_rounded_rect(
-        self,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-        radius: int,
-        fill: str,
-        outline: str,
-        width: int,
-    ) -> None:
-        if not self.canvas:
-            return
+    def _redraw(self, text: str, fill_width: int) -> None:
+        """移动进度填充并更新文本
 
-        radius = max(0, min(radius, (x2 - x1) // 2, (y2 - y1) // 2))
-        if radius == 0:
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2, fill=fill, outline=outline, width=width
-            )
+        Args:
+            text: 显示文本（阶段与剩余时间）
+            fill_width: 进度填充宽度（像素）
+        """
+        canvas = self.canvas
+        if not canvas:
             return
 
-        self.canvas.create_arc(
-            x1,
+        if fill_width != self._fill_width:
+            self._fill_width = fill_width
+            fill_id = self._fill_id
+            if fill_width > 0:
+                canvas.coords(
+                    fill_id,
+                    self._rounded_rect_points(2, 2, 2 + fill_width, self._height - 2, self._RADIUS - 2),
+                )
+                canvas.itemconfigure(fill_id, state="normal")
+            else:
+                canvas.itemconfigure(fill_id, state="hidden")
+
+        canvas.itemconfigure(self._text_id, text=text)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _rounded_rect_points(
+        x1: int, y1: int, x2: int, y2: int, radius: int
+    ) -> Tuple[int, ...]:
+        """圆角矩形平滑多边形的顶点（可直接用于 create_polygon / coords）
+
+        按几何参数缓存：进度条尺寸固定，填充只随宽度变化，每个宽度只计算一次。
+        """
+        radius = max(0, min(radius, (x2 - x1) // 2, (y2 - y1) // 2))
+        return (
+            x1 + radius,
             y1,
-            x1 + radius * 2,
-            y1 + radius * 2,
-            start=90,
-            extent=90,
-            fill=fill,
-            outline=outline,
-            width=width,
-        )
-        self.canvas.create_arc(
-            x2 - radius * 2,
+            x2 - radius,
             y1,
             x2,
-            y1 + radius * 2,
-            start=0,
-            extent=90,
-            fill=fill,
-            outline=outline,
-            width=width,
-        )
-        self.canvas.create_arc(
-            x2 - radius * 2,
-            y2 - radius * 2,
+            y1,
+            x2,
+            y1 + radius,
+            x2,
+            y2 - radius,
             x2,
             y2,
-            start=270,
-            extent=90,
-            fill=fill,
-            outline=outline,
-            width=width,
-        )
-        self.canvas.create_arc(
-            x1,
-            y2 - radius * 2,
-            x1 + radius * 2,
+            x2 - radius,
             y2,
-            start=180,
-            extent=90,
-            fill=fill,
-            outline=outline,
-            width=width,
-        )
-        self.canvas.create_rectangle(
             x1 + radius,
-            y1,
-            x2 - radius,
             y2,
-            fill=fill,
-            outline=outline,
-            width=width,
-        )
-        self.canvas.create_rectangle(
             x1,
-            y1 + radius,
-            x2,
+            y2,
+            x1,
             y2 - radius,
+            x1,
+            y1 + radius,
+            x1,
+            y1,
+        )
+
+    def _draw_rounded_rect(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        radius: int,
+        fill: str,
+        outline: str,
+        width: int,
+    ) -> int | None:
+        """用单个平滑多边形绘制圆角矩形，返回画布元素 id"""
+        if not self.canvas:
+            return None
+
+        return self.canvas.create_polygon(
+            self._rounded_rect_points(x1, y1, x2, y2, radius),
+            smooth=True,
+            splinesteps=self._SPLINESTEPS,
             fill=fill,
             outline=outline,
             width=width,
-        )
\ No newline at end of file
+        )
@@ -58,8 +58,8 @@ class QuickMenu:
         y = int(self.app.y)
 
         # 确保不超出屏幕
-        screen_w = self.app.root.winfo_screenwidth()
-        screen_h = self.app.root.winfo_screenheight()
+        screen_w = self.app.screen_w
+        screen_h = self.app.screen_h
 
         # 如果在屏幕右侧，显示在宠物左侧
         if x + 150 > screen_w:
@@ -476,12 +476,12 @@ class QuickMenu:
     def _hide_pet(self) -> None:
         """隐藏宠物"""
         # 隐藏宠物时，记录音乐面板的显示状态并隐藏音乐面板
-        if hasattr(self.app, "music_panel") and self.app.music_panel and self.app.music_panel.window and self.app.music_panel.window.winfo_exists() and self.app.music_panel.window.state() != "withdrawn":
-            self.app.music_panel._was_visible = True
-            self.app.music_panel.hide()
+        if self.app._music_panel and self.app._music_panel.window and self.app._music_panel.window.winfo_exists() and self.app._music_panel.window.state() != "withdrawn":
+            self.app._music_panel._was_visible = True
+            self.app._music_panel.hide()
         else:
-            if hasattr(self.app, "music_panel") and self.app.music_panel:
-                self.app.music_panel._was_visible = False
+            if self.app._music_panel:
+                self.app._music_panel._was_visible = False
         
         # 隐藏宠物时，记录语音气泡的显示状态并隐藏语音气泡
         if hasattr(self.app, "speech_bubble") and self.app.speech_bubble and self.app.speech_bubble.window and self.app.speech_bubble.window.winfo_exists() and self.app.speech_bubble.window.state() != "withdrawn":
@@ -494,9 +494,7 @@ class QuickMenu:
         self.app.root.withdraw()
         
         # 更新系统托盘菜单状态
-        if hasattr(self.app, "tray_controller") and self.app.tray_controller:
-            if self.app.tray_controller.icon:
-                self.app.tray_controller.icon.menu = self.app.tray_controller.build_menu()
+        self.app.refresh_tray_menu()
         
         self.hide()
 
@@ -535,7 +533,6 @@ class QuickMenu:
         # 创建新窗口显示命令列表
         commands_window = tk.Toplevel(app.root)
         commands_window.title("语音命令列表")
-        commands_window.geometry("600x500")
         commands_window.resizable(False, False)
         
         # 设置窗口在屏幕中央
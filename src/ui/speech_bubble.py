@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Callable, List
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
-from src.constants import TRANSPARENT_COLOR
+from src.constants import BEHAVIOR_MODE_QUIET, TRANSPARENT_COLOR
 
 
 class SpeechBubble:
@@ -36,6 +36,8 @@ class SpeechBubble:
         self._typewriter_text_id: int | None = None
         self._typewriter_canvas: tk.Canvas | None = None
         self._is_typing = False
+        # 可见标记，由 show/hide 维护，避免外部反复查询 Tk 窗口状态
+        self._visible = False
 
     def show(
         self,
@@ -81,6 +83,8 @@ class SpeechBubble:
         self.window.attributes("-topmost", True)
         self.window.config(bg=TRANSPARENT_COLOR)
         self.window.attributes("-transparentcolor", TRANSPARENT_COLOR)
+        self.window.bind("<Destroy>", self._on_window_destroy)
+        self._visible = True
 
         font = tkfont.Font(family="Microsoft YaHei UI", size=11, weight="bold")
         wrapped_lines = self._wrap_text(text, font, 200)
@@ -278,6 +282,7 @@ class SpeechBubble:
         # 停止打字机效果
         self._stop_typewriter()
 
+        self._visible = False
         if self.window:
             self.window.destroy()
             self.window = None
@@ -293,6 +298,11 @@ class SpeechBubble:
         if hasattr(self.app, 'ui_manager'):
             self.app.ui_manager.set_component_visibility('speech_bubble', False)
 
+    def _on_window_destroy(self, event: tk.Event) -> None:
+        """窗口被外部销毁时同步可见标记"""
+        if event.widget is self.window:
+            self._visible = False
+
     def is_visible(self) -> bool:
         """判断气泡是否可见"""
         if not self.window or not self.window.winfo_exists():
@@ -331,7 +341,7 @@ class SpeechBubble:
         self.show(text, duration=2000)
         
         # 确保UI管理器立即更新布局，特别是在活泼模式和粘人模式下
-        if hasattr(self.app, 'ui_manager') and self.app.behavior_mode in ["active", "clingy"]:
+        if hasattr(self.app, 'ui_manager') and self.app.behavior_mode != BEHAVIOR_MODE_QUIET:
             # 延迟一帧后更新布局，确保窗口已创建
             self.app.root.after(10, lambda: self.app.ui_manager.update_layout())
 
@@ -375,6 +385,8 @@ class SpeechBubble:
         self.window.attributes("-topmost", True)
         self.window.config(bg=TRANSPARENT_COLOR)
         self.window.attributes("-transparentcolor", TRANSPARENT_COLOR)
+        self.window.bind("<Destroy>", self._on_window_destroy)
+        self._visible = True
 
         font = tkfont.Font(family="Microsoft YaHei UI", size=11, weight="bold")
         max_bubble_width = 280  # 气泡最大宽度
@@ -465,8 +477,7 @@ class SpeechBubble:
         # 调整窗口位置
         self.window.update_idletasks()
 
-        screen_w = self.app.root.winfo_screenwidth()
-        screen_h = self.app.root.winfo_screenheight()
+        screen_w = self.app.screen_w
         x_pos = max(10, min(x - canvas_width // 2, screen_w - canvas_width - 10))
         y_pos = max(10, y - canvas_height)
         self.window.geometry(f"{canvas_width}x{canvas_height}+{x_pos}+{y_pos}")
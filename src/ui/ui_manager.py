@@ -5,10 +5,42 @@
 """
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Tuple, Any
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import tkinter as tk
 
 
+def _top_position(px: int, py: int, pw: int, ph: int, cw: int, ch: int) -> Tuple[int, int]:
+    """放在宠物上方居中"""
+    return (px + pw // 2 - cw // 2, py - ch - 5)
+
+
+def _bottom_position(px: int, py: int, pw: int, ph: int, cw: int, ch: int) -> Tuple[int, int]:
+    """放在宠物下方居中"""
+    return (px + pw // 2 - cw // 2, py + ph + 5)
+
+
+def _left_position(px: int, py: int, pw: int, ph: int, cw: int, ch: int) -> Tuple[int, int]:
+    """放在宠物左侧垂直居中"""
+    return (px - cw - 5, py + ph // 2 - ch // 2)
+
+
+def _right_position(px: int, py: int, pw: int, ph: int, cw: int, ch: int) -> Tuple[int, int]:
+    """放在宠物右侧垂直居中"""
+    return (px + pw + 5, py + ph // 2 - ch // 2)
+
+
+_priority_key = attrgetter("priority")
+
+# 首选位置 -> 相对宠物的初始坐标计算函数（参数：宠物 x, y, 宽, 高，组件宽, 高）
+_POSITION_FNS: Dict[str, Callable[[int, int, int, int, int, int], Tuple[int, int]]] = {
+    "top": _top_position,
+    "bottom": _bottom_position,
+    "left": _left_position,
+    "right": _right_position,
+}
+
+
 class UIComponent:
     """UI组件信息类"""
     
@@ -23,6 +55,9 @@ class UIComponent:
         self.x = 0  # 当前x坐标
         self.y = 0  # 当前y坐标
         self.visible = False  # 是否可见
+        # 上一次实际应用的 (窗口, x, y, 宽, 高)，未变化时不再调用 geometry；
+        # 包含窗口对象本身，组件重建窗口后会重新定位
+        self._applied: Tuple[Any, int, int, int, int] | None = None
         
     def get_position(self) -> Tuple[int, int]:
         """获取当前位置"""
@@ -32,13 +67,11 @@ class UIComponent:
         """设置位置"""
         self.x = x
         self.y = y
-        if hasattr(self.obj, 'window') and self.obj.window and self.obj.window.winfo_exists():
-            # 确保窗口已更新
-            self.obj.window.update_idletasks()
-            
-            # 获取窗口的实际尺寸
-            actual_width = self.obj.window.winfo_width()
-            actual_height = self.obj.window.winfo_height()
+        window = getattr(self.obj, 'window', None)
+        if window and window.winfo_exists():
+            # 获取窗口的实际尺寸（布局在调度器中延后执行，此时窗口尺寸已由 Tk 更新）
+            actual_width = window.winfo_width()
+            actual_height = window.winfo_height()
             
             # 如果获取不到实际尺寸，使用注册时的尺寸
             if actual_width <= 1:
@@ -46,13 +79,14 @@ class UIComponent:
             if actual_height <= 1:
                 actual_height = self.height
                 
-            # 设置窗口位置，确保坐标是整数
+            # 设置窗口位置，确保坐标是整数；与上次应用的几何相同时跳过
             x_int = int(x)
             y_int = int(y)
-            self.obj.window.geometry(f"{actual_width}x{actual_height}+{x_int}+{y_int}")
-            
-            # 确保窗口已更新
-            self.obj.window.update_idletasks()
+            applied = (window, x_int, y_int, actual_width, actual_height)
+            if applied == self._applied:
+                return
+            window.geometry(f"{actual_width}x{actual_height}+{x_int}+{y_int}")
+            self._applied = applied
             
     def is_visible(self) -> bool:
         """检查是否可见"""
@@ -65,6 +99,9 @@ class UIComponent:
 
 class UIManager:
     """UI组件自动管理器"""
+
+    # 合并布局刷新的间隔（毫秒），约 30Hz
+    LAYOUT_FLUSH_MS = 33
     
     def __init__(self, app):
         self.app = app
@@ -73,6 +110,13 @@ class UIManager:
         self.pet_height = 100
         self.pet_x = 0
         self.pet_y = 0
+        # 布局脏标记：拖动/移动等高频路径只做标记，由调度器合并为一次 update_layout
+        self._layout_dirty = False
+        self._flush_handle: Optional[int] = None
+        # 上一次 update_layout 所依据的宠物位置与尺寸
+        self._laid_out_pet: Optional[Tuple[int, int, int, int]] = None
+        # 上一次实际计算位置时的输入（宠物几何 + 各组件窗口/可见性/尺寸），相同则跳过计算
+        self._layout_key: Optional[tuple] = None
         
     def register_component(self, name: str, obj: Any, width: int, height: int,
                           preferred_position: str = "auto", priority: int = 0) -> None:
@@ -102,6 +146,22 @@ class UIManager:
         self.pet_y = y
         self.pet_width = width
         self.pet_height = height
+
+    def set_pet_info_and_relayout(self, x: int, y: int, width: int, height: int) -> None:
+        """更新宠物信息并安排一次布局刷新
+
+        宠物位置与尺寸和上次布局时相同且没有待刷新的布局时直接返回。
+
+        Args:
+            x: 宠物x坐标
+            y: 宠物y坐标
+            width: 宠物宽度
+            height: 宠物高度
+        """
+        self.update_pet_info(x, y, width, height)
+        if not self._layout_dirty and (x, y, width, height) == self._laid_out_pet:
+            return
+        self.mark_dirty()
         
     def set_component_visibility(self, name: str, visible: bool) -> None:
         """设置组件可见性
@@ -110,29 +170,42 @@ class UIManager:
             name: 组件名称
             visible: 是否可见
         """
-        if name in self.components:
-            self.components[name].visible = visible
-            # 确保主窗口已更新
-            self.app.root.update_idletasks()
+        component = self.components.get(name)
+        if component is not None:
+            component.visible = visible
             # 延迟更新布局，确保窗口状态已更新
-            self.app.root.after(10, self.update_layout)
+            self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """标记布局需要刷新
+
+        同一刷新周期内的多次标记只触发一次 update_layout。
+        """
+        self._layout_dirty = True
+        if self._flush_handle is None:
+            self._flush_handle = self.app.scheduler.call_later(self.LAYOUT_FLUSH_MS, self._flush_layout)
+
+    def _flush_layout(self) -> None:
+        """执行合并后的布局刷新"""
+        self._flush_handle = None
+        if self._layout_dirty:
+            self.update_layout()
             
     def update_layout(self) -> None:
         """更新布局，根据当前可见的组件重新计算位置"""
-        # 获取所有组件，包括可能刚显示但还没有标记为可见的组件
-        all_components = list(self.components.values())
-        
-        # 确保所有窗口都已更新
-        self.app.root.update_idletasks()
-        
-        # 更新所有组件的实际尺寸和可见性
-        for component in all_components:
-            if hasattr(component.obj, 'window') and component.obj.window and component.obj.window.winfo_exists():
-                # 确保组件窗口已更新
-                component.obj.window.update_idletasks()
-                
-                actual_width = component.obj.window.winfo_width()
-                actual_height = component.obj.window.winfo_height()
+        self._layout_dirty = False
+        self._laid_out_pet = (self.pet_x, self.pet_y, self.pet_width, self.pet_height)
+        # 单次遍历所有组件（包括可能刚显示但还没有标记为可见的组件）：
+        # 更新实际尺寸与可见性，同时收集可见组件与本次布局的输入。
+        # 布局由 mark_dirty 延后到调度器中执行，此时空闲任务已处理完毕，无需 update_idletasks；
+        # 取不到实际尺寸时沿用注册/上次的尺寸
+        visible_components: List[UIComponent] = []
+        component_states = []
+        for component in self.components.values():
+            window = getattr(component.obj, 'window', None)
+            if window and window.winfo_exists():
+                actual_width = window.winfo_width()
+                actual_height = window.winfo_height()
                 
                 # 如果获取到了实际尺寸，更新组件的尺寸信息
                 if actual_width > 1:
@@ -141,28 +214,20 @@ class UIManager:
                     component.height = actual_height
                 
                 # 更新可见性
-                component.visible = component.obj.window.state() != "withdrawn"
+                component.visible = window.state() != "withdrawn"
+            if component.visible:
+                visible_components.append(component)
+            component_states.append((window, component.visible, component.width, component.height))
         
-        # 获取所有可见的组件
-        visible_components = [comp for comp in all_components if comp.visible]
+        # 宠物几何与各组件状态都未变化时，上次计算的位置仍然有效。
+        # 窗口对象也计入比较：组件重建窗口后需要重新定位
+        layout_key = (self._laid_out_pet, tuple(component_states))
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
         
         # 按优先级排序，优先级高的先处理
-        visible_components.sort(key=lambda x: x.priority, reverse=True)
-        
-        # 再次确保所有组件的尺寸已正确更新
-        for component in visible_components:
-            if hasattr(component.obj, 'window') and component.obj.window and component.obj.window.winfo_exists():
-                # 确保组件窗口已更新
-                component.obj.window.update_idletasks()
-                
-                actual_width = component.obj.window.winfo_width()
-                actual_height = component.obj.window.winfo_height()
-                
-                # 如果获取到了实际尺寸，更新组件的尺寸信息
-                if actual_width > 1:
-                    component.width = actual_width
-                if actual_height > 1:
-                    component.height = actual_height
+        visible_components.sort(key=_priority_key, reverse=True)
         
         # 计算每个组件的位置
         for component in visible_components:
@@ -179,46 +244,31 @@ class UIManager:
         # 根据组件名称和首选位置计算初始位置
         if component.preferred_position == "auto":
             x, y = self._get_auto_position(component, all_visible)
-        elif component.preferred_position == "top":
-            x = self.pet_x + self.pet_width // 2 - component.width // 2
-            y = self.pet_y - component.height - 5
-        elif component.preferred_position == "bottom":
-            x = self.pet_x + self.pet_width // 2 - component.width // 2
-            y = self.pet_y + self.pet_height + 5
-        elif component.preferred_position == "left":
-            x = self.pet_x - component.width - 5
-            y = self.pet_y + self.pet_height // 2 - component.height // 2
-        elif component.preferred_position == "right":
-            x = self.pet_x + self.pet_width + 5
-            y = self.pet_y + self.pet_height // 2 - component.height // 2
         else:
-            # 默认放在上方
-            x = self.pet_x + self.pet_width // 2 - component.width // 2
-            y = self.pet_y - component.height - 5
+            # 未知的首选位置默认放在上方
+            position_fn = _POSITION_FNS.get(component.preferred_position, _top_position)
+            x, y = position_fn(
+                self.pet_x, self.pet_y, self.pet_width, self.pet_height,
+                component.width, component.height,
+            )
             
         # 确保不超出屏幕，并确保坐标是整数
-        screen_w = self.app.root.winfo_screenwidth()
-        screen_h = self.app.root.winfo_screenheight()
+        screen_w = self.app.screen_w
+        screen_h = self.app.screen_h
         x = int(max(10, min(x, screen_w - component.width - 10)))
         y = int(max(10, min(y, screen_h - component.height - 10)))
         
         # 检查是否与其他组件重叠，如果重叠则调整位置
         x, y = self._avoid_overlap(component, x, y, all_visible)
         
-        # 更新组件的尺寸信息
-        if hasattr(component.obj, 'window') and component.obj.window and component.obj.window.winfo_exists():
-            actual_width = component.obj.window.winfo_width()
-            actual_height = component.obj.window.winfo_height()
-            
-            # 如果获取到了实际尺寸，更新组件的尺寸信息
-            if actual_width > 1:
-                component.width = actual_width
-            if actual_height > 1:
-                component.height = actual_height
-                
-        # 设置组件位置
+        # 设置组件位置（尺寸已在 update_layout 开头刷新）
         component.set_position(x, y)
         
+    def _visible_component(self, name: str) -> Optional[UIComponent]:
+        """返回已注册且可见的组件，否则返回 None"""
+        component = self.components.get(name)
+        return component if component is not None and component.visible else None
+
     def _get_auto_position(self, component: UIComponent, 
                           all_visible: List[UIComponent]) -> Tuple[int, int]:
         """获取自动计算的位置
@@ -242,8 +292,9 @@ class UIManager:
             y = int(self.pet_y + self.pet_height + 5)
         elif component.name == "pomodoro_indicator":
             # 番茄钟根据其他组件情况决定位置
-            speech_bubble = next((c for c in all_visible if c.name == "speech_bubble"), None)
-            music_panel = next((c for c in all_visible if c.name == "music_panel"), None)
+            # 直接按名称取组件，all_visible 即 visible 为真的组件
+            speech_bubble = self._visible_component("speech_bubble")
+            music_panel = self._visible_component("music_panel")
             
             # 默认位置：宠物上方
             x = int(self.pet_x + self.pet_width // 2 - component.width // 2)
@@ -259,7 +310,6 @@ class UIManager:
                     # 没有找到语音气泡，放在宠物上方
                     y = self.pet_y - component.height - 5
                 # 确保不超出屏幕
-                screen_h = self.app.root.winfo_screenheight()
                 if y < 10:
                     y = 10
             elif speech_bubble:
@@ -295,46 +345,48 @@ class UIManager:
         Returns:
             调整后的(x, y)坐标
         """
-        # 检查是否与其他组件重叠
-        for other in all_visible:
-            if other.name == component.name:
-                continue  # 跳过自己
-                
+        # 本次布局中其他组件的矩形只取一次，初始检测与各方向复检共用
+        peers = [
+            (other.x, other.y, other.width, other.height)
+            for other in all_visible
+            if other is not component
+        ]
+        w = component.width
+        h = component.height
+
+        def overlaps_any(nx: int, ny: int) -> bool:
+            return any(
+                not (nx + w <= px or px + pw <= nx or ny + h <= py or py + ph <= ny)
+                for px, py, pw, ph in peers
+            )
+
+        max_x = self.app.screen_w - w - 10
+        max_y = self.app.screen_h - h - 10
+        for px, py, pw, ph in peers:
             # 检查是否重叠
-            if self._is_overlapping(x, y, component.width, component.height,
-                                   other.x, other.y, other.width, other.height):
+            if not (x + w <= px or px + pw <= x or y + h <= py or py + ph <= y):
                 # 尝试向四个方向移动，找到不重叠的位置
                 directions = [
-                    (x, y - other.height - 5),  # 上
-                    (x, y + other.height + 5),  # 下
-                    (x - other.width - 5, y),  # 左
-                    (x + other.width + 5, y),  # 右
+                    (x, y - ph - 5),  # 上
+                    (x, y + ph + 5),  # 下
+                    (x - pw - 5, y),  # 左
+                    (x + pw + 5, y),  # 右
                 ]
                 
                 for new_x, new_y in directions:
                     # 确保不超出屏幕
-                    screen_w = self.app.root.winfo_screenwidth()
-                    screen_h = self.app.root.winfo_screenheight()
-                    new_x = max(10, min(new_x, screen_w - component.width - 10))
-                    new_y = max(10, min(new_y, screen_h - component.height - 10))
+                    new_x = max(10, min(new_x, max_x))
+                    new_y = max(10, min(new_y, max_y))
                     
                     # 检查新位置是否与所有组件都不重叠
-                    overlap = False
-                    for check_other in all_visible:
-                        if check_other.name == component.name:
-                            continue
-                        if self._is_overlapping(new_x, new_y, component.width, component.height,
-                                              check_other.x, check_other.y, check_other.width, check_other.height):
-                            overlap = True
-                            break
-                            
-                    if not overlap:
+                    if not overlaps_any(new_x, new_y):
                         return (new_x, new_y)
                         
         return (x, y)
         
-    def _is_overlapping(self, x1: int, y1: int, w1: int, h1: int,
-                       x2: int, y2: int, w2: int, h2: int) -> bool:
+    @staticmethod
+    def _is_overlapping(x1: int, y1: int, w1: int, h1: int,
+                        x2: int, y2: int, w2: int, h2: int) -> bool:
         """检查两个矩形是否重叠
         
         Args:
@@ -1,13 +1,34 @@
 """语音功能模块
 
 包含语音唤醒、语音识别、语音合成和系统命令处理功能
+
+子模块依赖较重（numpy、语音识别 SDK 等），导出的名称在首次访问时才导入对应子模块，
+``import src.voice`` 本身不会加载它们。
 """
 
-from .voice_recognition import VoiceRecognition
-from .voice_assistant import VoiceAssistant
-from .keyword_spotter import KeywordSpotter
-from .token_manager import TokenManager, get_token_manager, get_asr_token, setup_aliyun_credentials
-from .system_commands import SystemCommandProcessor
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .keyword_spotter import KeywordSpotter
+    from .system_commands import SystemCommandProcessor
+    from .token_manager import TokenManager, get_asr_token, get_token_manager, setup_aliyun_credentials
+    from .voice_assistant import VoiceAssistant
+    from .voice_recognition import VoiceRecognition
+
+# 导出名称 -> 所在子模块
+_LAZY = {
+    "VoiceRecognition": ".voice_recognition",
+    "VoiceAssistant": ".voice_assistant",
+    "KeywordSpotter": ".keyword_spotter",
+    "TokenManager": ".token_manager",
+    "get_token_manager": ".token_manager",
+    "get_asr_token": ".token_manager",
+    "setup_aliyun_credentials": ".token_manager",
+    "SystemCommandProcessor": ".system_commands",
+}
 
 __all__ = [
     "VoiceRecognition",
@@ -18,4 +39,19 @@ __all__ = [
     "get_asr_token",
     "setup_aliyun_credentials",
     "SystemCommandProcessor",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入子模块并缓存导出的名称（PEP 562）"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """列出模块属性，包含尚未导入的导出名称（PEP 562）"""
+    return sorted(set(globals()) | set(__all__))
@@ -7,13 +7,22 @@
 import os
 import random
 import re
-from typing import Dict, List, Optional, NamedTuple, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, NamedTuple, Tuple, TYPE_CHECKING
 
-from src.config import load_config
+from src.config import get_config_value
 
 if TYPE_CHECKING:
     from src.core.pet_core import DesktopPet
 
+# 消息末尾需要去掉的标点
+_TRAILING_PUNCT_RE = re.compile(r'[。！？，、；："（）【】《》]+$')
+
+# 提取命令前移除的修饰词（按顺序逐个移除，前面的移除后可能拼出后面的）
+_MODIFIERS = ("一下", "帮我", "给我", "能不能", "可不可以")
+
 
 class AnalysisResult(NamedTuple):
     """分析结果"""
@@ -40,6 +49,17 @@ class IntentResult(NamedTuple):
     confidence: float = 0.0
 
 
+class ScanHits(NamedTuple):
+    """消息单次扫描的命中结果"""
+    keyword: Optional[Tuple[int, str, str]]  # 优先级最高的应用关键词或系统命令 (优先级, 名称, 操作)
+    scene: Optional[str]  # 优先级最高的场景
+    intent: bool  # 是否包含意愿词
+    action: bool  # 是否包含动作词
+    content: bool  # 是否包含内容词（动作词或应用名称）
+    question: bool  # 是否包含疑问标记
+    pronoun: bool  # 是否包含人称代词
+
+
 class LLMResult(NamedTuple):
     """LLM分析结果"""
     is_command: bool
@@ -49,6 +69,87 @@ class LLMResult(NamedTuple):
     raw_response: Optional[str] = None
 
 
+class _KeywordMatcher:
+    """多关键词匹配器
+
+    构建时把全部关键词编译成一个前瞻正则，匹配时只需对消息做一次扫描，
+    即可得到出现在消息中的所有关键词的附带数据（payload）。
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, tuple]]) -> None:
+        """
+        初始化匹配器
+
+        Args:
+            entries: (关键词, payload) 序列，同一关键词可对应多个 payload
+        """
+        payloads: Dict[str, List[tuple]] = {}
+        for keyword, payload in entries:
+            payloads.setdefault(keyword, []).append(payload)
+
+        # 长关键词排在前面，同一起点只报告最长的关键词；
+        # 作为其前缀的较短关键词也必然在该处出现，预先合并到它的命中列表里
+        keywords = sorted(payloads, key=len, reverse=True)
+        self._hits: Dict[str, List[tuple]] = {
+            keyword: [p for other in keywords if keyword.startswith(other) for p in payloads[other]]
+            for keyword in keywords
+        }
+        # 前瞻分组宽度为零，finditer 会在每个位置尝试匹配，重叠的关键词不会被吞掉
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+    def find_all(self, text: str) -> List[tuple]:
+        """
+        返回文本中出现的所有关键词的 payload（按出现位置排序，可能重复）
+
+        Args:
+            text: 待匹配文本
+
+        Returns:
+            payload 列表
+        """
+        hits = self._hits
+        return [p for m in self._pattern.finditer(text) for p in hits[m.group(1)]]
+
+
+@lru_cache(maxsize=4)
+def _build_char_index(names: Tuple[str, ...]) -> Dict[str, Tuple[int, ...]]:
+    """
+    为自定义命令名建立字符倒排索引（字符 -> 含该字符的命令下标），命令名不变时复用
+
+    _is_similar 判定相似的命令至少与消息有一个共同字符（空命令名除外，记在 "" 键下），
+    因此只需对共享字符的命令逐个判断。
+
+    Args:
+        names: 自定义命令名元组（保持配置中的顺序）
+
+    Returns:
+        字符倒排索引
+    """
+    index: Dict[str, List[int]] = {}
+    for i, name in enumerate(names):
+        lowered = name.lower()
+        for char in set(lowered) if lowered else ("",):
+            index.setdefault(char, []).append(i)
+    return {char: tuple(ids) for char, ids in index.items()}
+
+
+# 操作类型推断线索，按优先级排列：消息同时包含多类线索时取靠前的一类
+_ACTION_CUES = (
+    ("launch_app", ("打开", "启动", "运行")),
+    ("close_app", ("关闭", "退出", "结束")),
+    ("system_setting", ("调", "设置", "切换")),
+    ("media_control", ("播放", "暂停", "停止")),
+    ("web_search", ("搜索", "查找")),
+)
+
+# 线索词匹配器，payload 为 (优先级, 操作类型)，模块加载时构建一次
+_ACTION_CUE_MATCHER = _KeywordMatcher(
+    (cue, (rank, action))
+    for rank, (action, cues) in enumerate(_ACTION_CUES)
+    for cue in cues
+)
+
+
 class CommandAnalyzer:
     """
     命令分析器
@@ -56,6 +157,14 @@ class CommandAnalyzer:
     负责分析用户消息，识别可能的命令意图
     """
     
+    # 分析结果缓存容量
+    RESULT_CACHE_SIZE = 256
+    
+    # 分析结果 LRU 缓存，所有实例共享（语音助手每条消息都会新建分析器）。
+    # 键为 (消息, 自定义命令名元组)，自定义命令增删后旧结果自然失效
+    _result_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], AnalysisResult]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
+    
     def __init__(self, app: "DesktopPet", llm_callback=None) -> None:
         """
         初始化命令分析器
@@ -120,6 +229,99 @@ class CommandAnalyzer:
             "写代码": ["写代码", "打代码", "编程", "开发"],
             "看电影": ["看电影", "放电影", "播放视频"]
         }
+        
+        # 疑问标记
+        self.question_indicators = ["吗", "呢", "什么", "怎么", "为什么", "哪里", "哪个", "？"]
+        
+        # 人称代词（用于粗略判断句子是否有主语）
+        self.pronouns = ["我", "你", "他", "她", "它"]
+        
+        # 各阶段共用的多关键词匹配器，一次扫描得到全部命中；payload 为 (类别, 优先级, 名称, 操作)。
+        # keyword 的优先级按原有遍历顺序递增：应用（字典顺序）先于系统命令
+        entries = []
+        for app_name, keywords in self.app_keywords.items():
+            rank = len(entries)
+            entries.extend((keyword, ("keyword", rank, app_name, "launch_app")) for keyword in keywords)
+            entries.append((app_name, ("content", 0, app_name, None)))
+        rank = len(entries)
+        for offset, (command, action_type) in enumerate(self.system_commands.items()):
+            entries.append((command, ("keyword", rank + offset, command, action_type)))
+        for rank, (scene, keywords) in enumerate(self.scene_words.items()):
+            entries.extend((keyword, ("scene", rank, scene, None)) for keyword in keywords)
+        for kind, words in (
+            ("intent", self.intent_words),
+            ("action", self.action_words),
+            ("question", self.question_indicators),
+            ("pronoun", self.pronouns),
+        ):
+            entries.extend((word, (kind, 0, word, None)) for word in words)
+        self._matcher = _KeywordMatcher(entries)
+    
+    def _custom_commands(self) -> Dict:
+        """
+        获取自定义命令表
+        
+        直接读取配置的内存缓存，不像 load_config 那样每次复制整份配置；
+        返回的字典只读，不要修改。
+        
+        Returns:
+            自定义命令字典（命令名 -> 命令数据）
+        """
+        return get_config_value("custom_commands") or {}
+    
+    def _custom_candidates(self, message: str, names: Tuple[str, ...]) -> Iterable[int]:
+        """
+        筛选可能与消息相似的自定义命令
+        
+        Args:
+            message: 用户语音消息
+            names: 自定义命令名元组
+            
+        Returns:
+            候选命令下标（升序）
+        """
+        lowered = message.lower()
+        if not lowered or not names:
+            # 空消息包含于任何命令名中，全部都是候选
+            return range(len(names))
+        
+        char_index = _build_char_index(names)
+        candidates = set(char_index.get("", ()))
+        for char in set(lowered):
+            candidates.update(char_index.get(char, ()))
+        return sorted(candidates)
+    
+    def _scan(self, message: str) -> ScanHits:
+        """
+        扫描一次消息，收集各分析阶段需要的关键词命中情况
+        
+        Args:
+            message: 用户语音消息
+            
+        Returns:
+            扫描结果
+        """
+        keyword = None
+        scene = None
+        kinds = set()
+        for kind, rank, name, action in self._matcher.find_all(message):
+            kinds.add(kind)
+            if kind == "keyword":
+                if keyword is None or rank < keyword[0]:
+                    keyword = (rank, name, action)
+            elif kind == "scene":
+                if scene is None or rank < scene[0]:
+                    scene = (rank, name)
+        
+        return ScanHits(
+            keyword=keyword,
+            scene=scene[1] if scene else None,
+            intent="intent" in kinds,
+            action="action" in kinds,
+            content="action" in kinds or "content" in kinds,
+            question="question" in kinds,
+            pronoun="pronoun" in kinds
+        )
     
     def analyze_message(self, message: str) -> AnalysisResult:
         """
@@ -131,6 +333,58 @@ class CommandAnalyzer:
         Returns:
             分析结果
         """
+        cache = self._result_cache
+        key = (message, tuple(self._custom_commands()))
+        with self._result_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+        
+        # 各阶段共用同一次扫描结果
+        hits = self._scan(message)
+        
+        result = self._match_stages(message, hits)
+        if result is not None:
+            # 自定义命令的详情来自可变配置，不缓存
+            if result.action != "custom_command":
+                with self._result_cache_lock:
+                    cache[key] = result
+                    if len(cache) > self.RESULT_CACHE_SIZE:
+                        cache.popitem(last=False)
+            return result
+        
+        # 第四阶段：LLM辅助判断（随机抽样，结果不缓存）
+        if self._should_use_llm(message, hits):
+            llm_result = self._llm_analysis(message)
+            if llm_result.is_command:
+                return AnalysisResult(
+                    type="llm_command",
+                    command=llm_result.command,
+                    confidence=llm_result.confidence,
+                    action=llm_result.action,
+                    details={"llm_response": llm_result.raw_response}
+                )
+        
+        # 默认：普通对话
+        return AnalysisResult(
+            type="normal_chat",
+            command=None,
+            confidence=0.0,
+            action=None
+        )
+    
+    def _match_stages(self, message: str, hits: ScanHits) -> Optional[AnalysisResult]:
+        """
+        依次执行精确匹配、模糊匹配、意图分析三个确定性阶段
+        
+        Args:
+            message: 用户语音消息
+            hits: 消息的扫描结果
+            
+        Returns:
+            分析结果，三个阶段都未命中时返回None
+        """
         # 第一阶段：精确匹配
         exact_result = self._exact_match(message)
         if exact_result.is_match:
@@ -143,7 +397,7 @@ class CommandAnalyzer:
             )
         
         # 第二阶段：模糊匹配
-        fuzzy_result = self._fuzzy_match(message)
+        fuzzy_result = self._fuzzy_match(message, hits)
         if fuzzy_result.is_match:
             return AnalysisResult(
                 type="fuzzy_command",
@@ -154,7 +408,7 @@ class CommandAnalyzer:
             )
         
         # 第三阶段：意图分析
-        intent_result = self._intent_analysis(message)
+        intent_result = self._intent_analysis(message, hits)
         if intent_result.has_intent:
             return AnalysisResult(
                 type="potential_command",
@@ -164,25 +418,7 @@ class CommandAnalyzer:
                 details={"intent": True}
             )
         
-        # 第四阶段：LLM辅助判断
-        if self._should_use_llm(message):
-            llm_result = self._llm_analysis(message)
-            if llm_result.is_command:
-                return AnalysisResult(
-                    type="llm_command",
-                    command=llm_result.command,
-                    confidence=llm_result.confidence,
-                    action=llm_result.action,
-                    details={"llm_response": llm_result.raw_response}
-                )
-        
-        # 默认：普通对话
-        return AnalysisResult(
-            type="normal_chat",
-            command=None,
-            confidence=0.0,
-            action=None
-        )
+        return None
     
     def _exact_match(self, message: str) -> MatchResult:
         """
@@ -225,8 +461,7 @@ class CommandAnalyzer:
                         action="launch_app"
                     )
                 # 检查目标是否在自定义命令中
-                config = load_config()
-                custom_commands = config.get("custom_commands", {})
+                custom_commands = self._custom_commands()
                 if target in custom_commands:
                     return MatchResult(
                         is_match=True,
@@ -236,8 +471,7 @@ class CommandAnalyzer:
                     )
         
         # 检查自定义命令
-        config = load_config()
-        custom_commands = config.get("custom_commands", {})
+        custom_commands = self._custom_commands()
         if message in custom_commands:
             return MatchResult(
                 is_match=True,
@@ -248,113 +482,87 @@ class CommandAnalyzer:
         
         return MatchResult(is_match=False)
     
-    def _fuzzy_match(self, message: str) -> MatchResult:
+    def _fuzzy_match(self, message: str, hits: ScanHits) -> MatchResult:
         """
         模糊匹配系统预设命令
         
         Args:
             message: 用户语音消息
+            hits: 消息的扫描结果
             
         Returns:
             匹配结果
         """
-        # 检查应用程序关键词
-        for app_name, keywords in self.app_keywords.items():
-            for keyword in keywords:
-                if keyword in message:
-                    # 尝试提取完整的命令（包括动作词）
-                    full_command = self._extract_command_from_message(message)
-                    if full_command and app_name in full_command:
-                        # 如果提取的完整命令包含应用名称，使用完整命令
-                        return MatchResult(
-                            is_match=True,
-                            command=full_command,
-                            action=self._infer_action(message)
-                        )
-                    else:
-                        # 否则使用应用名称
-                        return MatchResult(
-                            is_match=True,
-                            command=app_name,
-                            action="launch_app"
-                        )
-        
-        # 检查系统控制关键词
-        for command, action_type in self.system_commands.items():
-            if command in message:
-                return MatchResult(
-                    is_match=True,
-                    command=command,
-                    action=action_type
-                )
+        # 检查应用程序关键词和系统控制关键词（应用优先）
+        if hits.keyword is not None:
+            _, name, action = hits.keyword
+            if name in self.app_keywords:
+                # 尝试提取完整的命令（包括动作词）
+                full_command = self._extract_command_from_message(message)
+                if full_command and name in full_command:
+                    # 如果提取的完整命令包含应用名称，使用完整命令
+                    return MatchResult(
+                        is_match=True,
+                        command=full_command,
+                        action=self._infer_action(message)
+                    )
+            # 否则使用应用名称或系统命令
+            return MatchResult(
+                is_match=True,
+                command=name,
+                action=action
+            )
         
-        # 检查自定义命令
-        config = load_config()
-        custom_commands = config.get("custom_commands", {})
-        for cmd_name, cmd_data in custom_commands.items():
+        # 检查自定义命令（只比较与消息有共同字符的候选，按配置顺序取第一个）
+        custom_commands = self._custom_commands()
+        names = tuple(custom_commands)
+        for i in self._custom_candidates(message, names):
+            cmd_name = names[i]
             if self._is_similar(message, cmd_name):
                 return MatchResult(
                     is_match=True,
                     command=cmd_name,
                     action="custom_command",
-                    details=cmd_data
+                    details=custom_commands[cmd_name]
                 )
         
         return MatchResult(is_match=False)
     
-    def _intent_analysis(self, message: str) -> IntentResult:
+    def _intent_analysis(self, message: str, hits: ScanHits) -> IntentResult:
         """
         分析用户意图，判断是否可能是命令
         
         Args:
             message: 用户语音消息
+            hits: 消息的扫描结果
             
         Returns:
             意图分析结果
         """
         message = message.strip()
         
-        # 意愿词检测
-        for word in self.intent_words:
-            if word in message:
-                suggested_command = self._extract_command_from_message(message)
-                suggested_action = self._infer_action(message)
-                
-                if suggested_command:
-                    return IntentResult(
-                        has_intent=True,
-                        suggested_command=suggested_command,
-                        suggested_action=suggested_action,
-                        confidence=0.6
-                    )
-        
-        # 动作词检测
-        for word in self.action_words:
-            if word in message:
-                suggested_command = self._extract_command_from_message(message)
-                suggested_action = self._infer_action(message)
-                
-                if suggested_command:
-                    return IntentResult(
-                        has_intent=True,
-                        suggested_command=suggested_command,
-                        suggested_action=suggested_action,
-                        confidence=0.5
-                    )
+        # 意愿词/动作词检测（提取结果与具体命中的词无关，只需提取一次）
+        if hits.intent or hits.action:
+            suggested_command = self._extract_command_from_message(message)
+            if suggested_command:
+                return IntentResult(
+                    has_intent=True,
+                    suggested_command=suggested_command,
+                    suggested_action=self._infer_action(message),
+                    confidence=0.6 if hits.intent else 0.5
+                )
         
         # 场景词检测
-        for scene, keywords in self.scene_words.items():
-            for keyword in keywords:
-                if keyword in message:
-                    return IntentResult(
-                        has_intent=True,
-                        suggested_command=scene,
-                        suggested_action=self._infer_action_from_scene(scene),
-                        confidence=0.7
-                    )
+        if hits.scene is not None:
+            return IntentResult(
+                has_intent=True,
+                suggested_command=hits.scene,
+                suggested_action=self._infer_action_from_scene(hits.scene),
+                confidence=0.7
+            )
         
         # 短消息检测
-        if len(message) <= 8 and self._is_imperative_sentence(message):
+        if len(message) <= 8 and self._is_imperative_sentence(message, hits):
             return IntentResult(
                 has_intent=True,
                 suggested_command=message,
@@ -364,12 +572,13 @@ class CommandAnalyzer:
         
         return IntentResult(has_intent=False)
     
-    def _should_use_llm(self, message: str) -> bool:
+    def _should_use_llm(self, message: str, hits: ScanHits) -> bool:
         """
         判断是否应该使用LLM辅助
         
         Args:
             message: 用户语音消息
+            hits: 消息的扫描结果
             
         Returns:
             如果应该使用LLM辅助返回True，否则返回False
@@ -379,11 +588,11 @@ class CommandAnalyzer:
             return False
         
         # 检查是否包含内容词
-        if not self._has_content_words(message):
+        if not hits.content:
             return False
         
         # 检查是否是疑问句
-        if self._is_question(message):
+        if hits.question:
             return False
         
         # 随机抽样，10%的概率使用LLM
@@ -457,16 +666,11 @@ class CommandAnalyzer:
         Returns:
             提取的命令
         """
-        # 改进的命令提取逻辑
-        cleaned_message = message.strip()
-        
         # 移除末尾的标点符号
-        import re
-        cleaned_message = re.sub(r'[。！？，、；：""''（）【】《》]+$', '', cleaned_message)
+        cleaned_message = _TRAILING_PUNCT_RE.sub("", message.strip())
         
         # 移除常见的修饰词
-        modifiers = ["一下", "帮我", "给我", "能不能", "可不可以"]
-        for modifier in modifiers:
+        for modifier in _MODIFIERS:
             if modifier in cleaned_message:
                 cleaned_message = cleaned_message.replace(modifier, "").strip()
         
@@ -480,20 +684,13 @@ class CommandAnalyzer:
                     # 返回完整的"动作+目标"组合
                     return f"{word}{target}"
         
-        # 如果没有动作词，尝试直接提取关键词
-        # 检查是否包含应用程序关键词
-        for app_name, keywords in self.app_keywords.items():
-            for keyword in keywords:
-                if keyword in cleaned_message:
-                    return app_name
+        # 如果没有动作词，尝试直接提取关键词（应用程序关键词优先于系统命令）
+        keyword = self._scan(cleaned_message).keyword
+        if keyword is not None:
+            return keyword[1]
         
-        # 检查是否包含系统命令关键词
-        for command in self.system_commands.keys():
-            if command in cleaned_message:
-                return command
-        
-        # 如果无法提取，返回清理后的消息（再次移除末尾标点）
-        cleaned_message = re.sub(r'[。！？，、；：""''（）【】《》]+$', '', cleaned_message)
+        # 如果无法提取，返回清理后的消息（移除修饰词后末尾可能重新露出标点，再去一次）
+        cleaned_message = _TRAILING_PUNCT_RE.sub("", cleaned_message)
         return cleaned_message if cleaned_message else None
     
     def _infer_action(self, message: str) -> Optional[str]:
@@ -506,19 +703,9 @@ class CommandAnalyzer:
         Returns:
             推断的操作类型
         """
-        # 根据关键词推断操作类型
-        if any(word in message for word in ["打开", "启动", "运行"]):
-            return "launch_app"
-        elif any(word in message for word in ["关闭", "退出", "结束"]):
-            return "close_app"
-        elif any(word in message for word in ["调", "设置", "切换"]):
-            return "system_setting"
-        elif any(word in message for word in ["播放", "暂停", "停止"]):
-            return "media_control"
-        elif any(word in message for word in ["搜索", "查找"]):
-            return "web_search"
-        
-        return "unknown"
+        # 根据关键词推断操作类型，一次扫描取优先级最高的线索
+        hits = _ACTION_CUE_MATCHER.find_all(message)
+        return min(hits)[1] if hits else "unknown"
     
     def _infer_action_from_scene(self, scene: str) -> Optional[str]:
         """
@@ -566,12 +753,13 @@ class CommandAnalyzer:
         
         return False
     
-    def _is_imperative_sentence(self, message: str) -> bool:
+    def _is_imperative_sentence(self, message: str, hits: ScanHits) -> bool:
         """
         判断是否是祈使句
         
         Args:
             message: 用户语音消息
+            hits: 消息的扫描结果
             
         Returns:
             如果是祈使句返回True，否则返回False
@@ -585,45 +773,7 @@ class CommandAnalyzer:
                 return True
         
         # 检查是否没有主语（简单判断）
-        if not any(word in message for word in ["我", "你", "他", "她", "它"]):
+        if not hits.pronoun:
             return True
         
         return False
-    
-    def _has_content_words(self, message: str) -> bool:
-        """
-        检查消息是否包含内容词
-        
-        Args:
-            message: 用户语音消息
-            
-        Returns:
-            如果包含内容词返回True，否则返回False
-        """
-        # 简单实现：检查是否包含名词或动词
-        content_words = self.action_words + list(self.app_keywords.keys())
-        
-        for word in content_words:
-            if word in message:
-                return True
-        
-        return False
-    
-    def _is_question(self, message: str) -> bool:
-        """
-        判断是否是疑问句
-        
-        Args:
-            message: 用户语音消息
-            
-        Returns:
-            如果是疑问句返回True，否则返回False
-        """
-        # 检查疑问词或问号
-        question_indicators = ["吗", "呢", "什么", "怎么", "为什么", "哪里", "哪个", "？"]
-        
-        for indicator in question_indicators:
-            if indicator in message:
-                return True
-        
-        return False
\ No newline at end of file
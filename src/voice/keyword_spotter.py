@@ -4,10 +4,11 @@
 """
 
 import os
+import queue
 import sys
 import threading
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 try:
     import sounddevice as sd
@@ -21,9 +22,40 @@ except ImportError:
 
     sys.exit(-1)
 
+import numpy as np
+
 from src.config import load_config
 
 
+def _find_missing_files(files: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    找出不存在的文件
+
+    模型文件通常都在同一目录下，每个目录只列举一次，而不是对每个文件调用 os.path.exists
+
+    参数:
+        files: (名称, 路径) 列表
+
+    返回:
+        不存在的 (名称, 路径) 列表
+    """
+    listings: Dict[str, Set[str]] = {}
+    missing = []
+    for name, path in files:
+        directory, filename = os.path.split(path)
+        entries = listings.get(directory)
+        if entries is None:
+            try:
+                with os.scandir(directory or ".") as it:
+                    entries = {os.path.normcase(entry.name) for entry in it}
+            except OSError:
+                entries = set()
+            listings[directory] = entries
+        if os.path.normcase(filename) not in entries:
+            missing.append((name, path))
+    return missing
+
+
 class KeywordSpotter:
     """
     关键词检测引擎类
@@ -31,6 +63,9 @@ class KeywordSpotter:
     用于检测唤醒词，当检测到唤醒词时触发回调函数
     """
     
+    # 音频环形缓冲区块数；队列容量比它小 2，保证录音回调不会覆盖排队中或正在解码的块
+    AUDIO_RING_SIZE = 8
+    
     def __init__(self, callback: Optional[Callable[[str], None]] = None):
         """
         初始化关键词检测引擎
@@ -49,6 +84,11 @@ class KeywordSpotter:
         self.sample_rate = 16000
         self.samples_per_read = int(0.1 * self.sample_rate)  # 100ms
         
+        # 录音回调（生产者）写入预分配的环形缓冲区，监听线程（消费者）按块号取出解码
+        self._audio_buffers = np.zeros((self.AUDIO_RING_SIZE, self.samples_per_read), dtype=np.float32)
+        self._audio_queue: "queue.Queue[Tuple[int, int]]" = queue.Queue(maxsize=self.AUDIO_RING_SIZE - 2)
+        self._ring_pos = 0
+        
         # 加载配置
         self._load_config()
         
@@ -68,14 +108,8 @@ class KeywordSpotter:
 
         
         # 关键词检测模型路径 - 使用绝对路径
-        model_dir = current_dir / "assets" / "models" / "kws"
-        self.tokens_path = str(model_dir / "tokens.txt")
-        self.encoder_path = str(model_dir / "encoder.onnx")
-        self.decoder_path = str(model_dir / "decoder.onnx")
-        self.joiner_path = str(model_dir / "joiner.onnx")
-        self.keywords_file = str(model_dir / "keywords.txt")
-        
-
+        default_model_dir = current_dir / "assets" / "models" / "kws"
+        self.keywords_file = str(default_model_dir / "keywords.txt")
         
         # 从配置中获取参数，如果没有则使用默认值
         self.keywords_score = config.get("voice_wakeup_score", 5.0)
@@ -85,11 +119,12 @@ class KeywordSpotter:
         custom_model_path = config.get("kws_model_path", "")
         if custom_model_path and os.path.exists(custom_model_path):
             model_dir = Path(custom_model_path)
-            self.tokens_path = str(model_dir / "tokens.txt")
-            self.encoder_path = str(model_dir / "encoder.onnx")
-            self.decoder_path = str(model_dir / "decoder.onnx")
-            self.joiner_path = str(model_dir / "joiner.onnx")
-
+        else:
+            model_dir = default_model_dir
+        self.tokens_path = str(model_dir / "tokens.txt")
+        self.encoder_path = str(model_dir / "encoder.onnx")
+        self.decoder_path = str(model_dir / "decoder.onnx")
+        self.joiner_path = str(model_dir / "joiner.onnx")
         
         custom_keywords_file = config.get("kws_keywords_file", "")
         if custom_keywords_file and os.path.exists(custom_keywords_file):
@@ -108,14 +143,7 @@ class KeywordSpotter:
                 ("keywords", self.keywords_file)
             ]
             
-            missing_files = []
-            for name, path in files_to_check:
-                if not os.path.exists(path):
-                    missing_files.append((name, path))
-
-                else:
-                    pass
-            
+            missing_files = _find_missing_files(files_to_check)
             if missing_files:
                 
                 return
@@ -179,6 +207,20 @@ class KeywordSpotter:
             raise TypeError("回调函数必须是可调用的")
         self.callback = callback
     
+    def _on_audio(self, indata, frames, time_info, status):
+        """
+        录音回调（PortAudio 线程）：把一块音频复制到环形缓冲区并通知监听线程
+        
+        解码跟不上时直接丢弃该块，不阻塞录音线程
+        """
+        if self._audio_queue.full():
+            return
+        index = self._ring_pos
+        self._ring_pos = (index + 1) % self.AUDIO_RING_SIZE
+        frames = min(frames, self.samples_per_read)
+        self._audio_buffers[index, :frames] = indata[:frames, 0]
+        self._audio_queue.put_nowait((index, frames))
+    
     def _process_audio_stream(self):
         """处理音频流的核心循环"""
         if not self.keyword_spotter:
@@ -187,15 +229,27 @@ class KeywordSpotter:
             
         stream = self.keyword_spotter.create_stream()
         
+        # 丢弃上次监听残留的音频块
+        self._audio_queue = queue.Queue(maxsize=self.AUDIO_RING_SIZE - 2)
+        self._ring_pos = 0
+        
         try:
-            with sd.InputStream(channels=1, dtype="float32", samplerate=self.sample_rate) as s:
+            with sd.InputStream(
+                channels=1,
+                dtype="float32",
+                samplerate=self.sample_rate,
+                blocksize=self.samples_per_read,
+                callback=self._on_audio,
+            ):
                 while self.is_running:
-                    # 读取音频数据
-                    samples, _ = s.read(self.samples_per_read)
-                    samples = samples.reshape(-1)
+                    # 等待录音回调送来的音频块（超时后重新检查 is_running）
+                    try:
+                        index, frames = self._audio_queue.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
                     
                     # 输入到检测器
-                    stream.accept_waveform(self.sample_rate, samples)
+                    stream.accept_waveform(self.sample_rate, self._audio_buffers[index, :frames])
                     
                     # 处理检测结果
                     while self.keyword_spotter.is_ready(stream):